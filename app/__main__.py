@@ -1,19 +1,38 @@
+from importlib.util import find_spec
+from typing import Any
+
 import uvicorn
 
 from app.settings import settings
 
 
+def server_options() -> dict[str, Any]:
+    """
+    Options of `uvicorn.run`.
+
+    uvloop and httptools are used when installed (they come with
+    `uvicorn[standard]`), asyncio and h11 otherwise. Requests and memory
+    limits are enforced by `app.web.recycler`.
+    """
+    return {
+        "workers": settings.workers,
+        "host": settings.host,
+        "port": settings.port,
+        "reload": settings.reload,
+        "log_level": settings.log_level.value.lower(),
+        "loop": "uvloop" if find_spec("uvloop") else "asyncio",
+        "http": "httptools" if find_spec("httptools") else "h11",
+        "limit_concurrency": settings.server_limit_concurrency,
+        "backlog": settings.server_backlog,
+        "timeout_keep_alive": settings.server_keep_alive,
+        "timeout_graceful_shutdown": settings.server_graceful_timeout,
+        "factory": True,
+    }
+
+
 def main() -> None:
     """Entrypoint of the application."""
-    uvicorn.run(
-        "app.web.application:get_app",
-        workers=settings.workers_count,
-        host=settings.host,
-        port=settings.port,
-        reload=settings.reload,
-        log_level=settings.log_level.value.lower(),
-        factory=True,
-    )
+    uvicorn.run("app.web.application:get_app", **server_options())
 
 
 if __name__ == "__main__":
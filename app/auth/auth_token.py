@@ -1,8 +1,12 @@
-from typing import Any
+from typing import Any, Optional
 
+import jwt
+from fastapi_users import BaseUserManager, exceptions
 from fastapi_users.authentication import JWTStrategy
+from fastapi_users.db import SQLAlchemyUserDatabase
 from fastapi_users.jwt import decode_jwt, generate_jwt
 
+from app.auth.user_cache import user_cache
 from app.db.models.user_model import User
 from app.settings import settings
 
@@ -11,8 +15,45 @@ LIFETIME_SECONDS = settings.auth_lifetime_seconds
 REFRESH_SECONDS = settings.auth_refresh_seconds
 
 
+class CachedJWTStrategy(JWTStrategy[User, int]):
+    """JWT strategy answering already-verified tokens from `user_cache`."""
+
+    async def read_token(
+        self,
+        token: Optional[str],
+        user_manager: BaseUserManager[User, int],
+    ) -> Optional[User]:
+        if token is None:
+            return None
+
+        cached = user_cache.get(token)
+        if cached is not None and isinstance(user_manager.user_db, SQLAlchemyUserDatabase):
+            return await user_manager.user_db.session.merge(cached, load=False)
+
+        try:
+            data = decode_jwt(
+                token,
+                self.decode_key,
+                self.token_audience,
+                algorithms=[self.algorithm],
+            )
+            user_id = data.get("sub")
+            if user_id is None:
+                return None
+        except jwt.PyJWTError:
+            return None
+
+        try:
+            user = await user_manager.get(user_manager.parse_id(user_id))
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+
+        user_cache.set(token, user, token_expires_at=data.get("exp"))
+        return user
+
+
 def get_jwt_strategy() -> JWTStrategy[User, int]:
-    return JWTStrategy(secret=SECRET, lifetime_seconds=LIFETIME_SECONDS)
+    return CachedJWTStrategy(secret=SECRET, lifetime_seconds=LIFETIME_SECONDS)
 
 
 def get_refresh_jwt_strategy() -> JWTStrategy[User, int]:
@@ -0,0 +1,32 @@
+import secrets
+
+from argon2 import PasswordHasher
+from fastapi_users.password import PasswordHelperProtocol
+
+from app.services.password.service import check_password
+
+
+class Argon2PasswordHelper(PasswordHelperProtocol):
+    """
+    fastapi-users password helper sharing the application Argon2 hasher.
+
+    fastapi-users calls it synchronously (registration, password reset);
+    login goes through `UserManager.authenticate`, which uses the
+    asynchronous password service instead.
+    """
+
+    def __init__(self, hasher: PasswordHasher) -> None:
+        self.hasher = hasher
+
+    def verify_and_update(
+        self,
+        plain_password: str,
+        hashed_password: str,
+    ) -> tuple[bool, str | None]:
+        return check_password(self.hasher, hashed_password, plain_password)
+
+    def hash(self, password: str) -> str:
+        return self.hasher.hash(password)
+
+    def generate(self) -> str:
+        return secrets.token_urlsafe()
@@ -0,0 +1,150 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, TypedDict
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.db.models.user_model import User
+from app.settings import settings
+
+
+class UserCacheStats(TypedDict):
+
+    hits: int
+    misses: int
+    size: int
+
+
+@dataclass
+class _Entry:
+    user_id: int
+    user: User
+    expires_at: float
+
+
+class UserCache:
+    """
+    TTL + LRU cache of authenticated users, keyed by token fingerprint.
+
+    Entries are indexed by user id so every token of a user can be dropped
+    when that user changes. The cache is per process: other workers only
+    pick up a change once their entry expires, hence a short TTL.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._by_user: dict[int, set[str]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def fingerprint(token: str) -> str:
+        return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+    def get(self, token: str) -> User | None:
+        key = self.fingerprint(token)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires_at <= self.clock():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.user
+
+    def set(self, token: str, user: User, *, token_expires_at: float | None = None) -> None:
+        """
+        Cache a detached copy of `user` for `token`.
+
+        The entry never outlives the token itself. Cached users are shared
+        between requests: attach them to a session with
+        `session.merge(user, load=False)` rather than using them directly.
+        """
+        if not self.enabled:
+            return
+
+        snapshot = User(**{attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs})
+        make_transient_to_detached(snapshot)
+
+        expires_at = self.clock() + self.ttl_seconds
+        if token_expires_at is not None:
+            expires_at = min(expires_at, token_expires_at)
+
+        key = self.fingerprint(token)
+        self._remove(key)
+        self._entries[key] = _Entry(user_id=user.id, user=snapshot, expires_at=expires_at)
+        self._by_user.setdefault(user.id, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, user_id: int) -> None:
+        for key in self._by_user.pop(user_id, set()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_user.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> UserCacheStats:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._by_user.get(entry.user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[entry.user_id]
+
+
+user_cache = UserCache(
+    max_size=settings.auth_cache_max_size,
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+)
+
+
+def invalidate_user(session: AsyncSession | Session, user_id: int) -> None:
+    """
+    Drop a user's cached principals now and again once `session` commits.
+
+    The second pass covers requests that read the old row while the change
+    was still uncommitted and cached it again.
+    """
+    user_cache.invalidate(user_id)
+
+    sync_session = session.sync_session if isinstance(session, AsyncSession) else session
+    sync_session.info.setdefault("invalidated_users", set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for user_id in session.info.pop("invalidated_users", ()):
+        user_cache.invalidate(user_id)
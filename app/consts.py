@@ -6,7 +6,10 @@ class Permission(StrEnum):
     ADMINISTRATE = "administrate"
     IMPERSONATE = "impersonate"
     CREATE_USER = "create_user"
+    MONITOR = "monitor"
 
 
 class EventLogType(StrEnum):
-    pass
+
+    USER_LOGGED_IN = "user_logged_in"
+    USER_LOGGED_OUT = "user_logged_out"
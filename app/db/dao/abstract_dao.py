@@ -1,17 +1,40 @@
 import logging
 from dataclasses import Field as DCField
 from dataclasses import asdict
-from typing import Any, ClassVar, Generic, Protocol, Sequence, Type, TypeVar
-
-from sqlalchemy import func, select
+from datetime import datetime
+from typing import Any, ClassVar, Generic, Protocol, Sequence, Type, TypeVar, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    Table,
+    and_,
+    func,
+    insert,
+    inspect,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.interfaces import ORMOption
 
 from app.db.models.abstract_model import AbstractModel
+from app.db.pagination import Page, SortSpec, decode_cursor, encode_cursor
 from app.settings import settings
+from app.utils import not_none
 
 logger = logging.getLogger(settings.logger_name)
 
 
+class StaleVersionError(ValueError):
+    """The row changed since the version the caller based its update on."""
+
+
 class DataclassInstanceCreate(Protocol):
     __dataclass_fields__: ClassVar[dict[str, DCField[Any]]]
 
@@ -27,9 +50,23 @@ class DataclassInstanceUpdate(Protocol):
 TModel = TypeVar("TModel", bound=AbstractModel)
 TCreate = TypeVar("TCreate", bound=DataclassInstanceCreate)
 TUpdate = TypeVar("TUpdate", bound=DataclassInstanceUpdate)
+TRow = TypeVar("TRow")
 
 
 class AbstractDAO(Generic[TModel, TCreate, TUpdate]):
+    """
+    Generic data access object.
+
+    Model relationships are declared with `lazy="raise"`: read methods accept
+    loader `options` (see the eager-load options exposed by each DAO) so a
+    query only loads the relations its caller actually needs.
+
+    `get_all`, `get_page` and `get_by_id` mark their queries as replica-safe:
+    a `RoutingSession` runs them on a read replica until the session writes.
+    They filter on `is_active.is_(True)`, the predicate of the partial
+    indexes declared with `active_index`, and list rows in `id` order.
+    """
+
     session: AsyncSession
     model: Type[TModel]
 
@@ -43,13 +80,76 @@ class AbstractDAO(Generic[TModel, TCreate, TUpdate]):
         await self.session.refresh(model)
         return model.id
 
+    async def create_many(self, items: Sequence[TCreate]) -> list[int]:
+        """
+        Insert several rows and return their ids, in the same order as `items`.
+
+        Small batches are sent as paged multi-row INSERT ... RETURNING
+        statements. From `settings.db_copy_threshold` rows, ids are reserved
+        from the table sequence and the rows are streamed with COPY.
+        """
+        if not items:
+            return []
+
+        rows = [asdict(item) for item in items]
+
+        if len(rows) >= settings.db_copy_threshold:
+            return await self._copy_many(rows)
+
+        query = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        result = await self.session.execute(query, rows)
+
+        return list(result.scalars().all())
+
+    async def _copy_many(self, rows: list[dict[str, Any]]) -> list[int]:
+        table = cast(Table, not_none(inspect(self.model)).local_table)
+        sequence = func.pg_get_serial_sequence(table.name, table.c.id.name)
+        query = select(func.nextval(sequence)).select_from(func.generate_series(1, len(rows)))
+        ids = list((await self.session.execute(query)).scalars().all())
+
+        # COPY skips client-side column defaults, so they are resolved here.
+        dialect = self.session.get_bind().dialect
+        columns = [
+            column
+            for column in table.columns
+            if column.key in rows[0] or (column.default is not None and column.default.is_scalar)
+        ]
+        processors = [column.type.bind_processor(dialect) for column in columns]
+        defaults = [getattr(column.default, "arg", None) for column in columns]
+
+        records = []
+        for key, row in zip(ids, rows, strict=True):
+            record: list[Any] = [key]
+            for column, processor, default in zip(columns, processors, defaults, strict=True):
+                value = row.get(column.key, default)
+                record.append(processor(value) if processor else value)
+            records.append(record)
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await not_none(raw_connection.driver_connection).copy_records_to_table(
+            table.name,
+            columns=[table.c.id.name, *(column.name for column in columns)],
+            records=records,
+        )
+
+        return ids
+
     async def get_all(
         self,
         *,
         limit: int = 10,
         offset: int = 0,
+        options: Sequence[ORMOption] = (),
     ) -> Sequence[TModel]:
-        query = select(self.model).where(self.model.is_active.is_(True)).offset(offset)
+        query = (
+            select(self.model)
+            .where(self.model.is_active.is_(True))
+            .order_by(self.model.id)
+            .offset(offset)
+            .options(*options)
+            .execution_options(replica=True)
+        )
 
         if limit > 0:
             query = query.limit(limit)
@@ -58,29 +158,169 @@ class AbstractDAO(Generic[TModel, TCreate, TUpdate]):
 
         return raw_models.scalars().fetchall()
 
-    async def get_by_id(self, key: int) -> TModel | None:
-        query = select(self.model).where(
-            self.model.id == key and self.model.is_active.is_(True),
+    async def get_page(
+        self,
+        *,
+        sort: SortSpec = (),
+        limit: int = 10,
+        cursor: str | None = None,
+        filters: Sequence[ColumnElement[bool]] = (),
+        options: Sequence[ORMOption] = (),
+    ) -> Page[TModel]:
+        """
+        Keyset pagination over active rows matching `filters`.
+
+        Rows are ordered by `sort` (as returned by `app.utils.parse_sort`) with
+        `id` as tie-breaker, and each page seeks past the last row of the
+        previous one instead of using OFFSET, so every page costs the same.
+        Relationships are not loaded unless requested through `options`.
+        """
+        sort = self._keyset_sort(sort)
+        query = self._keyset_query(select(self.model), sort=sort, limit=limit, cursor=cursor, filters=filters)
+        rows = (await self.session.execute(query.options(*options))).scalars().fetchall()
+        return self._keyset_page(rows, sort=sort, limit=limit)
+
+    async def get_rows_page(
+        self,
+        columns: Sequence[InstrumentedAttribute[Any]],
+        *,
+        sort: SortSpec = (),
+        limit: int = 10,
+        cursor: str | None = None,
+        filters: Sequence[ColumnElement[bool]] = (),
+    ) -> Page[Row[Any]]:
+        """
+        Same as `get_page`, returning only `columns` of each row instead of models.
+
+        The sort columns are selected too when they are not part of `columns`.
+        """
+        sort = self._keyset_sort(sort)
+        keys = {column.key for column in columns}
+        selected = [*columns, *(getattr(self.model, field) for field, _ in sort if field not in keys)]
+        query = self._keyset_query(select(*selected), sort=sort, limit=limit, cursor=cursor, filters=filters)
+        rows = (await self.session.execute(query)).all()
+        return self._keyset_page(rows, sort=sort, limit=limit)
+
+    def _keyset_query(
+        self,
+        query: Select[Any],
+        *,
+        sort: SortSpec,
+        limit: int,
+        cursor: str | None,
+        filters: Sequence[ColumnElement[bool]],
+    ) -> Select[Any]:
+        columns = [getattr(self.model, field) for field, _ in sort]
+        query = (
+            query.where(self.model.is_active.is_(True), *filters)
+            .order_by(
+                *(
+                    column.asc() if direction == "asc" else column.desc()
+                    for column, (_, direction) in zip(columns, sort, strict=True)
+                ),
+            )
+            .limit(limit + 1)
+            .execution_options(replica=True)
+        )
+
+        if cursor:
+            values = decode_cursor(cursor, sort=sort)
+            query = query.where(self._seek_after(columns, sort, values))
+        return query
+
+    @staticmethod
+    def _keyset_page(rows: Sequence[TRow], *, sort: SortSpec, limit: int) -> Page[TRow]:
+        items, extra = rows[:limit], rows[limit:]
+
+        next_cursor = None
+        if extra:
+            last = items[-1]
+            next_cursor = encode_cursor(
+                sort=sort,
+                values=[getattr(last, field) for field, _ in sort],
+            )
+
+        return Page(items=items, next_cursor=next_cursor)
+
+    def _keyset_sort(self, sort: SortSpec) -> SortSpec:
+        columns = not_none(inspect(self.model)).columns
+
+        for field, _ in sort:
+            if field not in columns:
+                raise ValueError(f"Cannot sort on unknown field '{field}'")
+            if columns[field].nullable:
+                raise ValueError(f"Cannot paginate on nullable field '{field}'")
+
+        if any(field == "id" for field, _ in sort):
+            return list(sort)
+        return [*sort, ("id", sort[-1][1] if sort else "asc")]
+
+    @staticmethod
+    def _seek_after(
+        columns: list[Any],
+        sort: SortSpec,
+        values: list[Any],
+    ) -> ColumnElement[bool]:
+        directions = {direction for _, direction in sort}
+        # Bound literals, as SQLAlchemy refuses `<`/`>` against a bare True/False.
+        values = [literal(value, column.type) for column, value in zip(columns, values, strict=True)]
+
+        if len(directions) == 1:
+            # Uniform direction: a row comparison maps onto a composite index.
+            if directions == {"asc"}:
+                return tuple_(*columns) > tuple_(*values)
+            return tuple_(*columns) < tuple_(*values)
+
+        clauses = []
+        for index, (column, (_, direction)) in enumerate(zip(columns, sort, strict=True)):
+            previous = [columns[i] == values[i] for i in range(index)]
+            step = column > values[index] if direction == "asc" else column < values[index]
+            clauses.append(and_(*previous, step))
+
+        return or_(*clauses)
+
+    async def get_by_id(
+        self,
+        key: int,
+        *,
+        options: Sequence[ORMOption] = (),
+    ) -> TModel | None:
+        query = (
+            select(self.model)
+            .where(self.model.id == key, self.model.is_active.is_(True))
+            .options(*options)
+            .execution_options(replica=True)
         )
 
         rows = await self.session.execute(query)
         return rows.scalars().first()
 
-    async def update(self, *, key: int, updates: TUpdate) -> None:
-        query = select(self.model).where(self.model.id == key)
+    async def update(self, *, key: int, updates: TUpdate, expected_updated_at: datetime | None = None) -> None:
+        """
+        Apply `updates` to the row `key`.
+
+        With `expected_updated_at` (optimistic concurrency, see
+        `app.web.etag`), the row is only updated if it has not changed since:
+        `StaleVersionError` is raised otherwise.
+        """
+        query = (
+            update(self.model)
+            .where(self.model.id == key)
+            .values(**asdict(updates), updated_at=func.now())
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        if expected_updated_at is not None:
+            query = query.where(self.model.updated_at == expected_updated_at)
         row = await self.session.execute(query)
-        model = row.scalars().first()
 
-        if not model:
-            raise ValueError("Model not found")
-
-        for attr, value in asdict(updates).items():
-            setattr(model, attr, value)
-
-        model.updated_at = func.now()
-
-        await self.session.flush()
-        await self.session.refresh(model)
+        if row.first() is not None:
+            return
+        if expected_updated_at is not None and await self.session.scalar(
+            select(self.model.id).where(self.model.id == key),
+        ):
+            raise StaleVersionError("Model was modified")
+        raise ValueError("Model not found")
 
     async def delete(self, key: int) -> None:
         row = await self.session.execute(select(self.model).where(self.model.id == key))
@@ -93,41 +333,37 @@ class AbstractDAO(Generic[TModel, TCreate, TUpdate]):
         await self.session.delete(already_dead)
 
     async def archive(self, key: int, updated_by: int) -> None:
-
-        query = select(self.model).where(self.model.id == key)
-        row = await self.session.execute(query)
-        model = row.scalars().first()
-
-        if not model:
-            raise ValueError("Model not found")
-
-        if not model.is_active:
+        if not await self._set_active(key=key, is_active=False, updated_by=updated_by):
             raise ValueError("Model is already archived")
 
-        model.is_active = False
-        model.updated_at = func.now()
-        model.updated_by = updated_by
-
-        await self.session.flush()
-        await self.session.refresh(model)
-
     async def restore(self, key: int, updated_by: int) -> None:
         if not hasattr(self.model, "id"):
             raise NotImplementedError("Model has no id field")
 
-        query = select(self.model).where(self.model.id == key)
-        row = await self.session.execute(query)
-        model = row.scalars().first()
+        if not await self._set_active(key=key, is_active=True, updated_by=updated_by):
+            raise ValueError("Model is already restored")
 
-        if not model:
-            raise ValueError("Model not found")
+    async def _set_active(self, *, key: int, is_active: bool, updated_by: int) -> bool:
+        """
+        Flip `is_active` with a single guarded UPDATE ... RETURNING.
+
+        Returns False when the row exists but is already in the requested
+        state. The lookup that tells both cases apart only runs when nothing
+        was updated.
+        """
+        query = (
+            update(self.model)
+            .where(self.model.id == key, self.model.is_active.is_(not is_active))
+            .values(is_active=is_active, updated_at=func.now(), updated_by=updated_by)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        row = await self.session.execute(query)
 
-        if model.is_active:
-            raise ValueError("Model is already restored")
+        if row.first() is not None:
+            return True
 
-        model.is_active = True
-        model.updated_at = func.now()
-        model.updated_by = updated_by
+        if await self.session.scalar(select(self.model.id).where(self.model.id == key)) is None:
+            raise ValueError("Model not found")
 
-        await self.session.flush()
-        await self.session.refresh(model)
+        return False
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any
 
 from app.consts import EventLogType
@@ -20,3 +20,7 @@ class EventLogUpdate:
 
 class EventLogDAO(AbstractDAO[EventLog, EventLogCreate, EventLogUpdate]):
     model = EventLog
+
+    def add(self, data: EventLogCreate) -> None:
+        """Add an event to the session: it is inserted with the session's next flush, not right away."""
+        self.session.add(self.model(**asdict(data)))
@@ -1,7 +1,21 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Float, Row, cast, func, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from app.db.dao.abstract_dao import AbstractDAO
-from app.db.models.post_model import Post
+from app.db.models.post_model import SEARCH_CONFIG, Post
+from app.db.pagination import Page, SortSpec, decode_cursor
+
+# Columns of the post listing, which does not need the content
+LIST_COLUMNS = (Post.id, Post.title, Post.published, Post.author_id, Post.created_at)
+
+# Order of the search results, best match first
+SEARCH_SORT: SortSpec = [("rank", "desc"), ("id", "desc")]
 
 
 class PostDAO(
@@ -9,6 +23,72 @@ class PostDAO(
 ):
     model = Post
 
+    @staticmethod
+    def with_author() -> ORMOption:
+        return selectinload(Post.author)
+
+    async def get_list_page(
+        self,
+        *,
+        filters: "DAOPostListFilters",
+        sort: SortSpec = (),
+        limit: int = 10,
+        cursor: str | None = None,
+    ) -> Page[Row[Any]]:
+        """A keyset page of active posts matching `filters`, with the `LIST_COLUMNS` only."""
+        conditions: list[ColumnElement[bool]] = []
+        if filters.author_id is not None:
+            conditions.append(Post.author_id == filters.author_id)
+        if filters.published is not None:
+            conditions.append(Post.published.is_(filters.published))
+        if filters.created_from is not None:
+            conditions.append(Post.created_at >= filters.created_from)
+        if filters.created_before is not None:
+            conditions.append(Post.created_at < filters.created_before)
+
+        return await self.get_rows_page(LIST_COLUMNS, sort=sort, limit=limit, cursor=cursor, filters=conditions)
+
+    async def search(
+        self,
+        terms: str,
+        *,
+        limit: int = 10,
+        cursor: str | None = None,
+    ) -> Page[Row[Any]]:
+        """
+        A keyset page of the active posts matching `terms`, best ranked first.
+
+        `terms` is in the web search syntax (`"exact phrase" -excluded or other`).
+        Rows have the `LIST_COLUMNS` and their `rank`; matches are found through
+        the GIN index on `Post.search_vector`.
+        """
+        query = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), terms)
+        # Double precision, so that the rank carried by the cursor compares equal to itself
+        rank = cast(func.ts_rank_cd(Post.search_vector, query), Float)
+
+        statement = (
+            select(*LIST_COLUMNS, rank.label("rank"))
+            .where(Post.is_active.is_(True), Post.search_vector.bool_op("@@")(query))
+            .order_by(rank.desc(), Post.id.desc())
+            .limit(limit + 1)
+            .execution_options(replica=True)
+        )
+        if cursor:
+            values = decode_cursor(cursor, sort=SEARCH_SORT)
+            statement = statement.where(self._seek_after([rank, Post.id], SEARCH_SORT, values))
+
+        rows = (await self.session.execute(statement)).all()
+        return self._keyset_page(rows, sort=SEARCH_SORT, limit=limit)
+
+
+@dataclass
+class DAOPostListFilters:
+    author_id: int | None = None
+    published: bool | None = None
+    created_from: datetime | None = None
+    created_before: datetime | None = None
+
+
 @dataclass
 class DAOPostCreateDTO:
     title: str
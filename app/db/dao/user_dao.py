@@ -1,19 +1,31 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional, cast
 
-from argon2 import PasswordHasher
 from sqlalchemy import Column, select
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
+from app.auth.user_cache import invalidate_user
 from app.db.dao.abstract_dao import AbstractDAO
 from app.db.models.user_model import User
+from app.services.password.service import password_service
 
 
 class UserDAO(AbstractDAO[User, "UserCreate", "UserUpdatePassword"]):
     model = User
 
+    @staticmethod
+    def with_posts() -> ORMOption:
+        return selectinload(User.posts)
+
     async def get_by_email(self, email: str) -> Optional[User]:
-        query = select(self.model).where(cast(Column[str], self.model.email) == email)
+        query = (
+            select(self.model)
+            .where(cast(Column[str], self.model.email) == email)
+            .execution_options(replica=True)
+        )
 
         try:
             raw_model = await self.session.execute(query)
@@ -21,9 +33,36 @@ class UserDAO(AbstractDAO[User, "UserCreate", "UserUpdatePassword"]):
         except NoResultFound:
             return None
 
-    async def patch_password(self, user_id: int, password: str) -> None:
+    async def update(
+        self,
+        *,
+        key: int,
+        updates: "UserUpdatePassword",
+        expected_updated_at: datetime | None = None,
+    ) -> None:
+        await super().update(key=key, updates=updates, expected_updated_at=expected_updated_at)
+        invalidate_user(self.session, key)
+
+    async def delete(self, key: int) -> None:
+        await super().delete(key)
+        invalidate_user(self.session, key)
+
+    async def archive(self, key: int, updated_by: int) -> None:
+        await super().archive(key, updated_by)
+        invalidate_user(self.session, key)
+
+    async def restore(self, key: int, updated_by: int) -> None:
+        await super().restore(key, updated_by)
+        invalidate_user(self.session, key)
+
+    async def patch_password(
+        self,
+        user_id: int,
+        password: str,
+        expected_updated_at: datetime | None = None,
+    ) -> None:
         """Patch user password."""
-        hashed_password = PasswordHasher().hash(password)
+        hashed_password = await password_service.hash(password)
 
         await self.update(
             key=user_id,
@@ -31,6 +70,7 @@ class UserDAO(AbstractDAO[User, "UserCreate", "UserUpdatePassword"]):
                 hashed_password=hashed_password,
                 updated_by=user_id,  # Assuming the user is updating their own password
             ),
+            expected_updated_at=expected_updated_at,
         )
 
 
@@ -1,17 +1,26 @@
 import hashlib
 from datetime import datetime
-from typing import Any, AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Optional, cast
 
-from fastapi import Depends, Request, Response
-from fastapi_users import BaseUserManager
+from fastapi import Depends, HTTPException, Request, Response
+from fastapi.security import OAuth2PasswordRequestForm
+from fastapi_users import BaseUserManager, exceptions
 from fastapi_users.db import SQLAlchemyUserDatabase
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.auth_token import generate_token
+from app.auth.password_helper import Argon2PasswordHelper
+from app.auth.user_cache import invalidate_user
+from app.consts import EventLogType
+from app.db.dao.event_log_dao import EventLogCreate
 from app.db.models.user_model import User
 from app.dependencies.db import get_user_db
+from app.errors import DomainError
 from app.services.email.dto import EmailMessageData
-from app.services.email.service import EmailService
+from app.services.email.queue import email_queue
+from app.services.event_log.buffer import event_log_buffer
 from app.services.logger.service import Logger, LogLevel
+from app.services.password.service import password_service
 from app.settings import settings
 
 SECRET = settings.auth_secret
@@ -23,6 +32,13 @@ class UserManager(BaseUserManager[User, int]):
     reset_password_token_secret = SECRET
     reset_password_token_lifetime_seconds = RESET_LIFETIME_SECONDS
 
+    @property
+    def _session(self) -> AsyncSession:
+        return cast(SQLAlchemyUserDatabase[User, int], self.user_db).session
+
+    def _invalidate_cached_user(self, user: User) -> None:
+        invalidate_user(self._session, user.id)
+
     async def on_after_register(
         self,
         user: User,
@@ -41,7 +57,7 @@ class UserManager(BaseUserManager[User, int]):
         Logger.info(f"User {user.email} forgot password.")
         Logger.log(LogLevel.DEBUG, f"Reset password token: {token}")
 
-        EmailService().send(
+        await email_queue.enqueue(
             EmailMessageData(
                 receivers=receivers,
                 subject="Reset password",
@@ -65,17 +81,84 @@ class UserManager(BaseUserManager[User, int]):
         hasher.update(refresh_token.encode())
         user.refresh_token = hasher.hexdigest()
         user.last_login = datetime.now()
+        self._invalidate_cached_user(user)
+        # Committed with the refresh token it records
+        event_log_buffer.record(
+            EventLogCreate(event_type=EventLogType.USER_LOGGED_IN, details={}, created_by=user.id),
+            session=self._session,
+        )
         Logger.info(f"User {user.email} logged in.")
 
     async def on_after_logout(self, user: User, response: Response) -> None:
         user.refresh_token = ""
+        self._invalidate_cached_user(user)
+        event_log_buffer.record(
+            EventLogCreate(event_type=EventLogType.USER_LOGGED_OUT, details={}, created_by=user.id),
+        )
         Logger.info(f"User {user.email} logged out.")
 
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: dict[str, Any],
+        request: Optional[Request] = None,
+    ) -> None:
+        self._invalidate_cached_user(user)
+
+    async def on_after_verify(
+        self,
+        user: User,
+        request: Optional[Request] = None,
+    ) -> None:
+        self._invalidate_cached_user(user)
+
+    async def on_after_reset_password(
+        self,
+        user: User,
+        request: Optional[Request] = None,
+    ) -> None:
+        self._invalidate_cached_user(user)
+
+    async def on_before_delete(
+        self,
+        user: User,
+        request: Optional[Request] = None,
+    ) -> None:
+        self._invalidate_cached_user(user)
+
     def parse_id(self, value: Any) -> int:
         return int(value)
 
+    async def authenticate(
+        self,
+        credentials: OAuth2PasswordRequestForm,
+    ) -> Optional[User]:
+        """Same as fastapi-users, with Argon2 running off the event loop."""
+        try:
+            try:
+                user = await self.get_by_email(credentials.username)
+            except exceptions.UserNotExists:
+                # Hash anyway so unknown emails take as long as wrong passwords.
+                await password_service.hash(credentials.password)
+                return None
+
+            verified, updated_password_hash = await password_service.verify_and_update(
+                user.hashed_password,
+                credentials.password,
+            )
+        except DomainError as e:
+            raise HTTPException(**e.to_http_args()) from e
+
+        if not verified:
+            return None
+
+        if updated_password_hash is not None:
+            await self.user_db.update(user, {"hashed_password": updated_password_hash})
+
+        return user
+
 
 async def get_user_manager(
     user_db: SQLAlchemyUserDatabase[User, int] = Depends(get_user_db),
 ) -> AsyncGenerator[Any, Any]:
-    yield UserManager(user_db)
+    yield UserManager(user_db, Argon2PasswordHelper(password_service.hasher))
@@ -0,0 +1,124 @@
+import inspect
+import logging
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+from typing import Any, Iterator
+
+import greenlet  # type: ignore[import-untyped]
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.settings import settings
+
+logger = logging.getLogger(settings.logger_name)
+
+_APP_DIR = str(Path(__file__).resolve().parents[1])
+_THIS_FILE = str(Path(__file__).resolve())
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_PARAM = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+\b")
+_IN_LIST = re.compile(r"\(\?(?:, \?)+\)")
+_SPACES = re.compile(r"\s+")
+
+
+@dataclass
+class QueryStats:
+    """Statements executed while a `track_queries` scope was active."""
+
+    count: int = 0
+    duration: float = 0.0  # in seconds
+    statements: list[str] | None = None
+
+
+_scopes: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_scopes", default=())
+
+
+@contextmanager
+def track_queries(*, record: bool = False) -> Iterator[QueryStats]:
+    """
+    Count the statements run by the current task until the block exits.
+
+    Scopes nest: a statement is counted in every active one. The tasks and
+    threads started from the block inherit it. With `record`, the
+    statements themselves are kept too.
+    """
+    stats = QueryStats(statements=[] if record else None)
+    token = _scopes.set((*_scopes.get(), stats))
+    try:
+        yield stats
+    finally:
+        _scopes.reset(token)
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse whitespace and replace literals and parameters with `?`."""
+    statement = _STRING.sub("?", statement)
+    statement = _PARAM.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    statement = _IN_LIST.sub("(?, ...)", statement)
+    return _SPACES.sub(" ", statement).strip()
+
+
+def call_site(depth: int = 3) -> str:
+    """
+    The innermost `depth` application frames that led to the current statement.
+
+    Async engines run the driver in a greenlet whose frames stop at
+    SQLAlchemy's `greenlet_spawn`; the walk continues in the parent
+    greenlet, where the awaiting coroutines are.
+    """
+    sites: list[str] = []
+    frame: FrameType | None = inspect.currentframe()
+    current = greenlet.getcurrent()
+    while len(sites) < depth:
+        if frame is None:
+            current = current.parent if current is not None else None
+            if current is None:
+                break
+            frame = current.gr_frame
+            continue
+        filename = frame.f_code.co_filename
+        if filename.startswith(_APP_DIR) and filename != _THIS_FILE:
+            relative = Path(filename).relative_to(Path(_APP_DIR).parent)
+            sites.append(f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}")
+        frame = frame.f_back
+    return " <- ".join(sites) or "unknown"
+
+
+def _before_cursor_execute(*args: Any) -> None:
+    context = args[4]
+    context.query_start = time.perf_counter()
+
+
+def _after_cursor_execute(*args: Any) -> None:
+    statement, context = args[2], args[4]
+    duration = time.perf_counter() - context.query_start
+    for stats in _scopes.get():
+        stats.count += 1
+        stats.duration += duration
+        if stats.statements is not None:
+            stats.statements.append(statement)
+
+    if duration >= settings.db_slow_query_threshold:
+        normalized = normalize_sql(statement)
+        site = call_site()
+        logger.warning(
+            "Slow query (%.1f ms) at %s: %s",
+            duration * 1000,
+            site,
+            normalized,
+            extra={"duration_ms": round(duration * 1000, 3), "statement": normalized, "call_site": site},
+        )
+
+
+def instrument(engine: AsyncEngine) -> AsyncEngine:
+    """Count and time the statements of `engine`, and log the slow ones."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
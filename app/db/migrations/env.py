@@ -1,5 +1,7 @@
 import asyncio
+import re
 from logging.config import fileConfig
+from typing import Any
 
 from alembic import context
 from sqlalchemy.ext.asyncio.engine import create_async_engine
@@ -24,6 +26,14 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = meta
 
+# Monthly partitions are managed by `app.db.partitions`, not by migrations
+PARTITION_NAME = re.compile(r"\w+_y\d{4}m\d{2}")
+
+
+def include_object(obj: Any, name: str | None, type_: str, reflected: bool, compare_to: Any) -> bool:
+    return not (type_ == "table" and reflected and name is not None and PARTITION_NAME.fullmatch(name))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # ... etc.
@@ -44,6 +54,7 @@ async def run_migrations_offline() -> None:
     context.configure(
         url=str(settings.db_url),
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -58,7 +69,11 @@ def do_run_migrations(connection: Connection) -> None:
 
     :param connection: connection to the database.
     """
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_object=include_object,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
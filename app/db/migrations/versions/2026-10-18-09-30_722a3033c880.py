@@ -0,0 +1,35 @@
+"""event log types
+
+Revision ID: 722a3033c880
+Revises: 9a93d5ad6a35
+Create Date: 2026-10-18 09:30:12.418305
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "722a3033c880"
+down_revision = "9a93d5ad6a35"
+branch_labels = None
+depends_on = None
+
+EVENT_LOG_TYPES = ("user_logged_in", "user_logged_out")
+
+
+def upgrade() -> None:
+    for event_type in EVENT_LOG_TYPES:
+        op.execute(f"ALTER TYPE event_log_type ADD VALUE IF NOT EXISTS '{event_type}'")
+
+
+def downgrade() -> None:
+    # Postgres cannot drop enum values: the type is recreated without them
+    op.execute("DELETE FROM event_log")
+    op.execute("ALTER TYPE event_log_type RENAME TO event_log_type_old")
+    op.execute("CREATE TYPE event_log_type AS ENUM ()")
+    op.execute(
+        "ALTER TABLE event_log ALTER COLUMN event_type TYPE event_log_type "
+        "USING event_type::text::event_log_type"
+    )
+    op.execute("DROP TYPE event_log_type_old")
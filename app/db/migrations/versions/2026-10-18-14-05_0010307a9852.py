@@ -0,0 +1,86 @@
+"""partition event_log by month
+
+Revision ID: 0010307a9852
+Revises: 722a3033c880
+Create Date: 2026-10-18 14:05:41.902117
+
+"""
+
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0010307a9852"
+down_revision = "722a3033c880"
+branch_labels = None
+depends_on = None
+
+COLUMNS = "event_type, details, id, is_active, created_by, updated_by, created_at, updated_at"
+
+# Partitions created after the current month; later ones are created by the
+# application (`app.db.partitions`)
+MONTHS_AHEAD = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_table(partitioned: bool) -> None:
+    op.execute(
+        f"""
+        CREATE TABLE event_log (
+            event_type event_log_type NOT NULL,
+            details JSONB NOT NULL,
+            id INTEGER NOT NULL DEFAULT nextval('event_log_id_seq'),
+            is_active BOOLEAN NOT NULL,
+            created_by INTEGER REFERENCES "user" (id),
+            updated_by INTEGER REFERENCES "user" (id),
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            updated_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY ({"id, created_at" if partitioned else "id"})
+        ){" PARTITION BY RANGE (created_at)" if partitioned else ""}
+        """,
+    )
+
+
+def _replace_table(partitioned: bool) -> None:
+    op.execute("ALTER TABLE event_log RENAME TO event_log_old")
+    op.execute("ALTER INDEX event_log_pkey RENAME TO event_log_old_pkey")
+    _create_table(partitioned)
+
+    if partitioned:
+        connection = op.get_bind()
+        current = connection.execute(sa.text("SELECT date_trunc('month', now())::date")).scalar_one()
+        oldest = connection.execute(
+            sa.text("SELECT date_trunc('month', min(created_at))::date FROM event_log_old"),
+        ).scalar_one()
+        month = min(oldest or current, current)
+        while month <= _add_months(current, MONTHS_AHEAD):
+            op.execute(
+                f"CREATE TABLE event_log_y{month.year}m{month.month:02d} PARTITION OF event_log "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')",
+            )
+            month = _add_months(month, 1)
+
+    op.execute(f"INSERT INTO event_log ({COLUMNS}) SELECT {COLUMNS} FROM event_log_old")
+    # The sequence is owned by the old table, and would be dropped with it
+    op.execute("ALTER SEQUENCE event_log_id_seq OWNED BY event_log.id")
+    op.execute("DROP TABLE event_log_old")
+
+
+def upgrade() -> None:
+    _replace_table(partitioned=True)
+    op.create_index("ix_event_log_event_type_created_at", "event_log", ["event_type", "created_at"])
+    op.create_index("ix_event_log_details", "event_log", ["details"], postgresql_using="gin")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_log_details", table_name="event_log")
+    op.drop_index("ix_event_log_event_type_created_at", table_name="event_log")
+    # Partitions archived in the meantime are not restored
+    _replace_table(partitioned=False)
@@ -0,0 +1,60 @@
+"""partial indexes over active rows
+
+Revision ID: 1a61c0888678
+Revises: 0010307a9852
+Create Date: 2026-10-18 16:40:03.551870
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "1a61c0888678"
+down_revision = "0010307a9852"
+branch_labels = None
+depends_on = None
+
+# Same predicate as `app.db.models.abstract_model.ACTIVE_PREDICATE`
+ACTIVE = sa.text("is_active IS TRUE")
+
+
+def upgrade() -> None:
+    # Built without locking the tables against writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_active_id",
+            "user",
+            ["id"],
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_user_email_lower",
+            "user",
+            [sa.text("lower(email)")],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_post_active_id",
+            "post",
+            ["id"],
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_post_active_author_id",
+            "post",
+            ["author_id", "id"],
+            postgresql_where=ACTIVE,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_post_active_author_id", table_name="post", postgresql_concurrently=True)
+        op.drop_index("ix_post_active_id", table_name="post", postgresql_concurrently=True)
+        op.drop_index("ix_user_email_lower", table_name="user", postgresql_concurrently=True)
+        op.drop_index("ix_user_active_id", table_name="user", postgresql_concurrently=True)
@@ -0,0 +1,33 @@
+"""partial index for the post listing by date
+
+Revision ID: 5c2e8b7d41f3
+Revises: 1a61c0888678
+Create Date: 2026-10-18 18:20:37.204518
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "5c2e8b7d41f3"
+down_revision = "1a61c0888678"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_post_active_created_at",
+            "post",
+            ["created_at", "id"],
+            postgresql_where=sa.text("is_active IS TRUE"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_post_active_created_at", table_name="post", postgresql_concurrently=True)
@@ -0,0 +1,52 @@
+"""post full text search
+
+Revision ID: 8f3b6c1e9d24
+Revises: 5c2e8b7d41f3
+Create Date: 2026-10-18 20:10:52.611940
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "8f3b6c1e9d24"
+down_revision = "5c2e8b7d41f3"
+branch_labels = None
+depends_on = None
+
+# Same expression as `app.db.models.post_model.Post.search_vector`
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', title), 'A') || "
+    "setweight(to_tsvector('english', content), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Computing the column rewrites the table, under a lock blocking writes and reads
+    op.add_column(
+        "post",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR, persisted=True),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_post_active_search_vector",
+            "post",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_where=sa.text("is_active IS TRUE"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_post_active_search_vector", table_name="post", postgresql_concurrently=True)
+    op.drop_column("post", "search_vector")
@@ -1,11 +1,25 @@
 from datetime import datetime
+from typing import Any, ClassVar
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
+# Predicate of the partial indexes over active rows. Postgres only uses such an
+# index when the query's filter matches it, so `AbstractDAO` filters with
+# `is_active.is_(True)`, rendered the same way, and never with a bare `is_active`.
+ACTIVE_PREDICATE = "is_active IS TRUE"
+
+
+def active_index(name: str, *columns: str, **kwargs: Any) -> Index:
+    """Partial index over the active rows only, for the listings that skip archived ones."""
+    return Index(name, *columns, postgresql_where=text(ACTIVE_PREDICATE), **kwargs)
+
 
 class AbstractModel(object):
 
+    # Fetch `updated_at` with RETURNING when a flush bumps it, so it is never left expired
+    __mapper_args__: ClassVar[dict[str, Any]] = {"eager_defaults": True}
+
     id: Mapped[int] = mapped_column(Integer(), primary_key=True, autoincrement=True)
 
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
@@ -26,4 +40,5 @@ class AbstractModel(object):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(),
         server_default=func.now(),
+        onupdate=func.now(),
     )
@@ -1,5 +1,7 @@
+from datetime import datetime
 from typing import Any
 
+from sqlalchemy import DateTime, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql.sqltypes import Enum
@@ -10,11 +12,32 @@ from app.db.models.abstract_model import AbstractModel
 
 
 class EventLog(Base, AbstractModel):
+    """
+    Audit events, range-partitioned by month of `created_at`.
+
+    Partitions are created ahead of time and archived once expired by
+    `app.db.partitions`.
+    """
 
     __tablename__ = "event_log"
+    __table_args__ = (
+        Index("ix_event_log_event_type_created_at", "event_type", "created_at"),
+        Index("ix_event_log_details", "details", postgresql_using="gin"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     event_type: Mapped[EventLogType] = mapped_column(
-        Enum(*EventLogType, name="event_log_type"),
+        Enum(
+            EventLogType,
+            name="event_log_type",
+            values_callable=lambda event_types: [event_type.value for event_type in event_types],
+        ),
         nullable=False,
     )
     details: Mapped[dict[str, Any]] = mapped_column(type_=JSONB, nullable=False)
+    # The partition key has to be part of the primary key
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(),
+        primary_key=True,
+        server_default=func.now(),
+    )
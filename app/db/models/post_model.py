@@ -1,14 +1,24 @@
-from sqlalchemy import ForeignKey, Integer
+from sqlalchemy import Computed, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.sqltypes import String
 
 from app.db.base import Base
-from app.db.models.abstract_model import AbstractModel
+from app.db.models.abstract_model import AbstractModel, active_index
+
+# Text search configuration of `Post.search_vector`: queries must use the same one
+SEARCH_CONFIG = "english"
 
 
 class Post(Base, AbstractModel):
 
     __tablename__ = "post"
+    __table_args__ = (
+        active_index("ix_post_active_id", "id"),
+        active_index("ix_post_active_author_id", "author_id", "id"),
+        active_index("ix_post_active_created_at", "created_at", "id"),
+        active_index("ix_post_active_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     title: Mapped[str] = mapped_column(String(length=255), nullable=False)
     content: Mapped[str] = mapped_column(String(length=1024), nullable=False)
@@ -19,4 +29,15 @@ class Post(Base, AbstractModel):
         nullable=False,
         index=True,
     )
-    author = relationship("User", foreign_keys=[author_id], lazy="selectin")
+    # Maintained by Postgres from the title and content, titles ranking higher.
+    # Deferred: only the search reads it.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR(),
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', title), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', content), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+    author = relationship("User", foreign_keys=[author_id], lazy="raise")
@@ -2,18 +2,21 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi_users.db import SQLAlchemyBaseUserTable
+from sqlalchemy import Index, func
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.sqltypes import DateTime, String
 
 from app.consts import Permission
 from app.db.base import Base
-from app.db.models.abstract_model import AbstractModel
+from app.db.models.abstract_model import AbstractModel, active_index
 from app.db.models.post_model import Post
 
 
 class User(Base, SQLAlchemyBaseUserTable[int], AbstractModel):
 
+    __table_args__ = (active_index("ix_user_active_id", "id"),)
+
     first_name: Mapped[str] = mapped_column(String(length=255), nullable=False)
     last_name: Mapped[str] = mapped_column(String(length=255), nullable=False)
     permissions: Mapped[list[Permission]] = mapped_column(
@@ -26,6 +29,11 @@ class User(Base, SQLAlchemyBaseUserTable[int], AbstractModel):
     posts = relationship(
         "Post",
         back_populates="author",
-        lazy="selectin",
+        lazy="raise",
         foreign_keys=Post.author_id,
     )
+
+
+# fastapi-users looks users up by `lower(email)` (login, registration, impersonation),
+# archived ones included, which the unique index on `email` cannot serve
+Index("ix_user_email_lower", func.lower(User.email))
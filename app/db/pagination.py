@@ -0,0 +1,84 @@
+import base64
+import hashlib
+import hmac
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Generic, Sequence, Tuple, TypeVar
+
+from app.settings import settings
+from app.utils import SortDirection
+
+T = TypeVar("T")
+
+SortSpec = Sequence[Tuple[str, SortDirection]]
+
+
+@dataclass
+class Page(Generic[T]):
+    items: Sequence[T]
+    next_cursor: str | None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise ValueError("Invalid cursor value")
+    return value
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _b64decode(raw: str) -> bytes:
+    return base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    return hmac.new(settings.secret_key.encode(), payload, hashlib.sha256).digest()
+
+
+def encode_cursor(*, sort: SortSpec, values: Sequence[Any]) -> str:
+    """
+    Build an opaque continuation token.
+
+    The token carries the sort specification and the seek values of the last
+    row of a page, and is signed with `settings.secret_key` so clients can
+    neither forge nor reuse it with another ordering.
+    """
+    payload = json.dumps(
+        {"s": [list(part) for part in sort], "v": [_encode_value(value) for value in values]},
+        separators=(",", ":"),
+    ).encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(token: str, *, sort: SortSpec) -> list[Any]:
+    """Verify a continuation token and return its seek values."""
+    try:
+        raw_payload, raw_signature = token.split(".")
+        payload = _b64decode(raw_payload)
+        signature = _b64decode(raw_signature)
+    except ValueError as err:
+        raise ValueError("Invalid cursor") from err
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise ValueError("Invalid cursor")
+
+    data = json.loads(payload)
+    if data["s"] != [list(part) for part in sort]:
+        raise ValueError("Cursor does not match the requested sort")
+
+    return [_decode_value(value) for value in data["v"]]
@@ -0,0 +1,198 @@
+import asyncio
+import gzip
+import logging
+import re
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.settings import settings
+
+logger = logging.getLogger(settings.logger_name)
+
+# Key of the advisory lock held by maintenance runs, so that one worker at a time runs them
+_LOCK_KEY = 0x65766C6F67
+
+_EXPORT_CHUNK = 1000  # rows written to the archive at once
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month `months` after the month of `month`."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year}m{month.month:02d}"
+
+
+async def partition_tables(conn: AsyncConnection, table: str) -> dict[str, tuple[date, bool]]:
+    """
+    Monthly partition tables of `table`, with their month and whether they are attached.
+
+    Tables detached by an interrupted archival are listed too, by name.
+    """
+    pattern = re.compile(rf"{re.escape(table)}_y(\d{{4}})m(\d{{2}})")
+    rows = await conn.execute(
+        text(
+            "SELECT child.relname, inherits.inhparent IS NOT NULL "
+            "FROM pg_class child "
+            "LEFT JOIN pg_inherits inherits ON inherits.inhrelid = child.oid "
+            "WHERE child.relkind = 'r' AND child.relnamespace = current_schema()::regnamespace "
+            "AND child.relname LIKE :prefix",
+        ),
+        {"prefix": f"{table}\\_y%"},
+    )
+    tables = {}
+    for name, attached in rows:
+        match = pattern.fullmatch(name)
+        if match is not None:
+            tables[name] = (date(int(match[1]), int(match[2]), 1), attached)
+    return tables
+
+
+async def create_partitions(conn: AsyncConnection, table: str, *, start: date, end: date) -> list[str]:
+    """Create the missing monthly partitions of `table` from `start` to `end` included."""
+    existing = await partition_tables(conn, table)
+    created = []
+    month = date(start.year, start.month, 1)
+    while month <= end:
+        name = partition_name(table, month)
+        if name not in existing:
+            await conn.execute(
+                text(
+                    f'CREATE TABLE "{name}" PARTITION OF "{table}" '
+                    f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')",
+                ),
+            )
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+async def export_table(conn: AsyncConnection, name: str, path: Path) -> int:
+    """Write the rows of `name` to `path` as gzipped NDJSON, returning how many were written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.partial")
+    count = 0
+    # `name` is a partition table name, listed by `partition_tables`
+    result = await conn.stream(text(f'SELECT row_to_json(row)::text FROM "{name}" row ORDER BY id'))  # noqa: S608
+    try:
+        with gzip.open(partial, "wt", encoding="utf-8") as file:
+            async for rows in result.partitions(_EXPORT_CHUNK):
+                await asyncio.to_thread(file.write, "".join(f"{row[0]}\n" for row in rows))
+                count += len(rows)
+    finally:
+        await result.close()
+    partial.replace(path)
+    return count
+
+
+class PartitionMaintenance:
+    """
+    Keep the monthly partitions of a table ready, and archive the expired ones.
+
+    Each run creates the partitions of the current month and of the
+    `months_ahead` next ones. Partitions older than `retention_months`
+    (0 keeps them all) are detached, exported to
+    `<archive_dir>/<partition>.ndjson.gz` and dropped; the export reads a
+    detached table, so writes to the current partitions are not blocked
+    while it runs. `start` runs once, then every `interval` seconds.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        table: str,
+        *,
+        months_ahead: int,
+        retention_months: int,
+        archive_dir: Path,
+        interval: float,
+    ) -> None:
+        self.engine = engine
+        self.table = table
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.archive_dir = archive_dir
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        await self.run()
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run(self) -> list[Path]:
+        """Create the upcoming partitions and archive the expired ones, returning the archives written."""
+        async with self.engine.begin() as conn:
+            if not await self._lock(conn):
+                return []
+            month = (await conn.execute(text("SELECT date_trunc('month', now())::date"))).scalar_one()
+            created = await create_partitions(
+                conn,
+                self.table,
+                start=month,
+                end=add_months(month, self.months_ahead),
+            )
+            if created:
+                logger.info("Created partitions %s.", ", ".join(created))
+
+            expired = []
+            if self.retention_months > 0:
+                cutoff = add_months(month, -self.retention_months)
+                tables = await partition_tables(conn, self.table)
+                expired = sorted(name for name, (start, _) in tables.items() if start < cutoff)
+                for name in expired:
+                    if tables[name][1]:
+                        await conn.execute(text(f'ALTER TABLE "{self.table}" DETACH PARTITION "{name}"'))
+
+        archives = [await self._archive(name) for name in expired]
+        return [path for path in archives if path is not None]
+
+    async def _archive(self, name: str) -> Path | None:
+        path = self.archive_dir / f"{name}.ndjson.gz"
+        async with self.engine.begin() as conn:
+            if not await self._lock(conn):
+                return None
+            count = await export_table(conn, name, path)
+        # The export's cursor keeps the table in use until its transaction ends
+        async with self.engine.begin() as conn:
+            if not await self._lock(conn):
+                return None
+            await conn.execute(text(f'DROP TABLE "{name}"'))
+        logger.info("Archived %d row(s) of partition %s to %s.", count, name, path)
+        return path
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run()
+            except Exception:
+                logger.exception("Maintenance of the %s partitions failed.", self.table)
+
+    @staticmethod
+    async def _lock(conn: AsyncConnection) -> bool:
+        result = await conn.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": _LOCK_KEY})
+        return bool(result.scalar_one())
+
+
+def create_event_log_maintenance(engine: AsyncEngine) -> PartitionMaintenance:
+    return PartitionMaintenance(
+        engine,
+        "event_log",
+        months_ahead=settings.event_log_partitions_ahead,
+        retention_months=settings.event_log_retention_months,
+        archive_dir=Path(settings.event_log_archive_dir),
+        interval=settings.event_log_maintenance_interval,
+    )
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+from typing import Any, TypedDict
+
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from app.db.instrumentation import instrument
+from app.settings import settings
+
+logger = logging.getLogger(settings.logger_name)
+
+
+class PoolStats(TypedDict):
+
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    acquisitions: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool recording how long checkouts wait for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.acquisitions = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - start
+            self.acquisitions += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+def create_db_engine(*, url: str | None = None, **kwargs: Any) -> AsyncEngine:
+    """
+    Create the application engine with the pool configured from `Settings`.
+
+    Its statements are counted and timed, see `app.db.instrumentation`.
+
+    `prepared_statement_cache_size` is SQLAlchemy's cache of asyncpg prepared
+    statements, `statement_cache_size` asyncpg's own one: both follow
+    `db_statement_cache_size`, so setting it to 0 makes the engine usable
+    behind a transaction-mode pgbouncer.
+    """
+    db_url = make_url(url or str(settings.db_url)).update_query_dict(
+        {"prepared_statement_cache_size": str(settings.db_statement_cache_size)},
+    )
+    options: dict[str, Any] = {
+        "echo": settings.db_echo,
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "server_settings": {"statement_timeout": str(settings.db_statement_timeout)},
+        },
+    }
+    options.update(kwargs)
+    return instrument(create_async_engine(db_url, **options))
+
+
+async def warm_up(engine: AsyncEngine, size: int) -> int:
+    """
+    Open up to `size` pooled connections and return how many were opened.
+
+    Failures are logged and do not stop the application: the pool opens
+    connections on demand anyway, warming it up only saves the first
+    requests of a worker from paying for it.
+    """
+    pool = engine.pool
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        size = min(size, pool.size())
+
+    async def connect() -> AsyncConnection:
+        return await engine.connect().start()
+
+    results = await asyncio.gather(*(connect() for _ in range(size)), return_exceptions=True)
+
+    opened = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.warning("Could not open a database connection on startup: %s", result)
+            continue
+        await result.close()
+        opened += 1
+    return opened
+
+
+def pool_stats(engine: AsyncEngine) -> PoolStats:
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedPool):
+        raise ValueError("Engine is not using an InstrumentedPool")
+
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "acquisitions": pool.acquisitions,
+        "wait_seconds_total": pool.wait_seconds_total,
+        "wait_seconds_max": pool.wait_seconds_max,
+    }
@@ -0,0 +1,55 @@
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.db.replicas import ReplicaSet, RoutingSession
+
+
+class ReadOnlySessionError(InvalidRequestError):
+    """A write was attempted through a read-only session."""
+
+
+class ReadOnlySession(RoutingSession):
+    """
+    Session refusing ORM writes.
+
+    Flushing pending changes and executing INSERT, UPDATE or DELETE
+    statements raise `ReadOnlySessionError`. Raw SQL passed as `text()` is
+    not inspected.
+    """
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def _refuse_flush(session: Session, *args: Any) -> None:
+    if session.new or session.dirty or session.deleted:
+        raise ReadOnlySessionError("Cannot flush changes through a read-only session")
+
+
+@event.listens_for(ReadOnlySession, "do_orm_execute")
+def _refuse_write_statements(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        raise ReadOnlySessionError("Cannot execute a write statement through a read-only session")
+
+
+def readonly_session_factory(
+    engine: AsyncEngine,
+    replicas: ReplicaSet | None = None,
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Sessions for handlers that only read.
+
+    Connections run in autocommit mode: no BEGIN, COMMIT or ROLLBACK round
+    trip is sent, each statement sees the data committed before it started
+    (READ COMMITTED), and the connection goes back to the pool with its
+    default isolation level restored. Replica-safe reads go to `replicas`.
+    """
+    return async_sessionmaker(
+        engine.execution_options(isolation_level="AUTOCOMMIT"),
+        expire_on_commit=False,
+        sync_session_class=ReadOnlySession,
+        replicas=replicas,
+        replica_autocommit=True,
+    )
@@ -0,0 +1,153 @@
+import asyncio
+import itertools
+import logging
+from typing import Any, Sequence
+
+from sqlalchemy import Connection, Engine, event, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.sql import ClauseElement, Executable
+
+from app.db.pool import create_db_engine
+from app.settings import settings
+
+logger = logging.getLogger(settings.logger_name)
+
+
+class ReplicaSet:
+    """
+    Read replicas with their health.
+
+    `check` pings every replica and marks the unreachable ones down;
+    `choose` round-robins over the healthy ones and returns None when none
+    is, so callers fall back to the primary. `start` runs the checks in the
+    background every `check_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        *,
+        check_interval: float,
+        check_timeout: float,
+    ) -> None:
+        self.engines = list(engines)
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.healthy = [True] * len(self.engines)
+        self._autocommit_engines = [
+            engine.sync_engine.execution_options(isolation_level="AUTOCOMMIT") for engine in self.engines
+        ]
+        self._counter = itertools.count()
+        self._task: asyncio.Task[None] | None = None
+
+    def choose(self, *, autocommit: bool = False) -> Engine | None:
+        healthy = [index for index, up in enumerate(self.healthy) if up]
+        if not healthy:
+            return None
+        index = healthy[next(self._counter) % len(healthy)]
+        if autocommit:
+            return self._autocommit_engines[index]
+        return self.engines[index].sync_engine
+
+    async def check(self) -> list[bool]:
+        results = await asyncio.gather(*(self._ping(engine) for engine in self.engines))
+        for index, (was_up, up) in enumerate(zip(self.healthy, results, strict=True)):
+            if was_up and not up:
+                logger.warning("Read replica %s is down, reading from the primary.", self._name(index))
+            elif up and not was_up:
+                logger.info("Read replica %s is back up.", self._name(index))
+        self.healthy = results
+        return results
+
+    async def start(self) -> None:
+        if self._task is not None or not self.engines:
+            return
+        await self.check()
+        self._task = asyncio.create_task(self._check_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for engine in self.engines:
+            await engine.dispose()
+
+    async def _check_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.check()
+
+    async def _ping(self, engine: AsyncEngine) -> bool:
+        try:
+            async with asyncio.timeout(self.check_timeout), engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except Exception:
+            return False
+        return True
+
+    def _name(self, index: int) -> str:
+        url = self.engines[index].url
+        return f"{url.host}:{url.port}"
+
+
+class RoutingSession(Session):
+    """
+    Session sending replica-safe reads to a replica.
+
+    Statements marked with `.execution_options(replica=True)` run on a
+    healthy replica, everything else on the primary. Once the session has written
+    (a flush, or an INSERT, UPDATE or DELETE statement) every later read
+    goes to the primary too, so a request always reads its own writes.
+    Writes made with raw `text()` SQL are not detected.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        replicas: ReplicaSet | None = None,
+        replica_autocommit: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.replica_autocommit = replica_autocommit
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        *,
+        clause: ClauseElement | None = None,
+        **kwargs: Any,
+    ) -> Engine | Connection:
+        if (
+            self.replicas is not None
+            and isinstance(clause, Executable)
+            and clause.get_execution_options().get("replica")
+            and not self.info.get("wrote")
+        ):
+            engine = self.replicas.choose(autocommit=self.replica_autocommit)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "before_flush")
+def _mark_flush(session: Session, *args: Any) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_write_statement(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info["wrote"] = True
+
+
+def create_replica_set() -> ReplicaSet:
+    """Replicas listed in `settings.db_replicas`, pooled like the primary."""
+    return ReplicaSet(
+        [create_db_engine(url=str(url)) for url in settings.db_replica_urls],
+        check_interval=settings.db_replica_check_interval,
+        check_timeout=settings.db_replica_check_timeout,
+    )
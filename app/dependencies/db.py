@@ -8,7 +8,28 @@ from starlette.requests import Request
 from app.db.models.user_model import User
 
 
+def read_only(request: Request) -> None:
+    """
+    Route dependency serving the request's database session read-only.
+
+    Declare it in the route's `dependencies` so it runs before anything
+    else asks for a session: every dependency of the request, including
+    authentication, then shares the read-only session.
+    """
+    request.state.db_read_only = True
+
+
 async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    if getattr(request.state, "db_read_only", False):
+        # Closed when the endpoint returns, before the response is sent: read-only
+        # routes return ready-made responses, so nothing reads the database afterwards
+        readonly_session: AsyncSession = request.app.state.db_readonly_session_factory()
+        try:
+            yield readonly_session
+        finally:
+            await readonly_session.close()
+        return
+
     session: AsyncSession = request.app.state.db_session_factory()
 
     try:
@@ -0,0 +1,26 @@
+import hmac
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.settings import settings
+
+scrape_bearer = HTTPBearer(auto_error=False, scheme_name="MetricsToken")
+
+
+def verify_metrics_token(
+    credentials: HTTPAuthorizationCredentials | None = Depends(scrape_bearer),
+) -> None:
+    """
+    Let metrics scrapers in with `Authorization: Bearer <settings.metrics_token>`.
+
+    Scrapers cannot log in, so they are not authenticated as users. While
+    no token is configured, every request is refused.
+    """
+    if credentials is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, headers={"WWW-Authenticate": "Bearer"})
+    if settings.metrics_token is None or not hmac.compare_digest(
+        credentials.credentials.encode(),
+        settings.metrics_token.encode(),
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
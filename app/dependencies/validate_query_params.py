@@ -1,34 +1,78 @@
-import json
 import re
-from typing import Any, Callable, Coroutine, Dict, Type, cast
+from typing import Any, Callable, Coroutine, Dict, Type
 
-from benedict import benedict  # type: ignore
 from fastapi import HTTPException, Request
 from pydantic import BaseModel, ValidationError
 from starlette.datastructures import QueryParams
 
+from app.settings import settings
 
-def build_nested_structure(data: QueryParams) -> Dict[str, Any]:
-    result = benedict()
+_SEGMENT = re.compile(r"[^\[\].]+")
 
-    for key, value in data.items():
-        keys = re.findall(r"([^\[\]]+)", key)
 
-        path = create_path(keys)
+def _is_index(segment: str) -> bool:
+    return segment.isascii() and segment.isdigit()
+
+
+def _slot(container: Dict[str, Any] | list[Any], segment: str, max_index: int) -> str | int:
+    """Turn `segment` into a key of `container`, growing lists up to `max_index`."""
+    if isinstance(container, dict):
+        container.setdefault(segment, None)
+        return segment
+
+    index = int(segment)
+    if index > max_index:
+        raise ValueError(f"List index {index} is above the limit of {max_index}")
+    if index >= len(container):
+        container.extend([None] * (index + 1 - len(container)))
+    return index
+
 
-        result[path] = value
+def build_nested_structure(
+    data: QueryParams,
+    *,
+    max_depth: int = settings.query_max_depth,
+    max_keys: int = settings.query_max_keys,
+    max_index: int = settings.query_max_index,
+) -> Dict[str, Any]:
+    """
+    Nest `a[b][0][c]=v` (or `a.b.0.c=v`) query parameters into plain containers.
+
+    Numeric segments index lists, padded with None up to the index; anything
+    else is a dict key. Each key is walked once, and the limits on depth, key
+    count and list index bound the size of what a client can make us build.
+    """
+    if len(data) > max_keys:
+        raise ValueError(f"Too many query parameters (limit is {max_keys})")
+
+    result: Dict[str, Any] = {}
+
+    for key, value in data.items():
+        segments = _SEGMENT.findall(key)
+        if not segments:
+            continue
+        if len(segments) > max_depth:
+            raise ValueError(f"Query parameter '{key}' is nested deeper than {max_depth}")
 
-    return cast(Dict[str, Any], json.loads(result.to_json()))
+        container: Any = result
+        for depth, segment in enumerate(segments):
+            slot = _slot(container, segment, max_index)
+            current = container[slot]
+            if depth == len(segments) - 1:
+                if isinstance(current, (dict, list)):
+                    raise ValueError(f"Query parameter '{key}' conflicts with another one")
+                container[slot] = value
+                break
 
+            child_type = list if _is_index(segments[depth + 1]) else dict
+            if current is None:
+                current = child_type()
+                container[slot] = current
+            elif not isinstance(current, child_type):
+                raise ValueError(f"Query parameter '{key}' conflicts with another one")
+            container = current
 
-def create_path(params: list[str]) -> str:
-    path_parts = []
-    for item in params:
-        if str(item).isdigit():
-            path_parts.append(f"[{item}]")
-        else:
-            path_parts.append(f".{item}" if path_parts else item)
-    return "".join(path_parts)
+    return result
 
 
 async def parse_query_with_validation(
@@ -39,7 +83,10 @@ async def parse_query_with_validation(
         raw_params = build_nested_structure(request.query_params)
         return model(**raw_params)
     except ValidationError as e:
-        raise HTTPException(status_code=422, detail=e.errors()) from e
+        # `ctx` can hold the exception raised by a validator, which is not serializable
+        raise HTTPException(status_code=422, detail=e.errors(include_context=False)) from e
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
 
 
 def validate_query_params(
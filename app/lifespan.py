@@ -2,9 +2,21 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
+from app.db.partitions import create_event_log_maintenance
+from app.db.pool import create_db_engine, warm_up
+from app.db.readonly import readonly_session_factory
+from app.db.replicas import RoutingSession, create_replica_set
+from app.services.email.queue import email_queue
+from app.services.email.service import EmailService
+from app.services.email.template import email_templates
+from app.services.event_log.buffer import event_log_buffer
+from app.services.logger.queue import log_queue
+from app.services.logger.service import logger
 from app.settings import settings
+from app.web.metrics import loop_lag
+from app.web.recycler import create_worker_recycler
 
 
 def _setup_db(app: FastAPI) -> None:  # pragma: no cover
@@ -17,13 +29,18 @@ def _setup_db(app: FastAPI) -> None:  # pragma: no cover
 
     :param app: fastAPI application.
     """
-    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
+    engine = create_db_engine()
+    replicas = create_replica_set()
     session_factory = async_sessionmaker(
         engine,
         expire_on_commit=False,
+        sync_session_class=RoutingSession,
+        replicas=replicas,
     )
     app.state.db_engine = engine
+    app.state.db_replicas = replicas
     app.state.db_session_factory = session_factory
+    app.state.db_readonly_session_factory = readonly_session_factory(engine, replicas)
 
 
 @asynccontextmanager
@@ -40,9 +57,28 @@ async def lifespan_setup(
     :return: function that actually performs actions.
     """
 
+    log_queue.start(logger, json_output=settings.log_json)
     app.middleware_stack = None
     _setup_db(app)
+    await warm_up(app.state.db_engine, settings.db_pool_min_size)
+    await app.state.db_replicas.start()
+    app.state.event_log_maintenance = create_event_log_maintenance(app.state.db_engine)
+    await app.state.event_log_maintenance.start()
     app.middleware_stack = app.build_middleware_stack()
+    email_templates.preload(EmailService.template_dir())
+    app.state.static_files.precompress()
+    await email_queue.start()
+    await event_log_buffer.start(app.state.db_session_factory)
+    await loop_lag.start()
+    app.state.worker_recycler = create_worker_recycler()
+    await app.state.worker_recycler.start()
 
     yield
+    await app.state.worker_recycler.stop()
+    await loop_lag.stop()
+    await event_log_buffer.stop()
+    await email_queue.stop()
+    await app.state.event_log_maintenance.stop()
+    await app.state.db_replicas.stop()
     await app.state.db_engine.dispose()
+    log_queue.stop()
@@ -0,0 +1,204 @@
+import asyncio
+import smtplib
+from dataclasses import dataclass
+from typing import Callable
+
+from redmail.email.sender import EmailSender
+
+from app.services.email.dto import EmailMessageData
+from app.services.email.service import EmailService
+from app.services.logger.service import Logger
+from app.settings import settings
+
+
+@dataclass
+class _Job:
+    message: EmailMessageData
+    attempt: int = 0
+
+
+class EmailQueue:
+    """
+    In-process outbound mail queue.
+
+    Each worker owns one SMTP connection, kept open between messages and
+    closed after `idle_timeout` seconds without mail. Workers pick up to
+    `batch_size` queued messages at once and send them over that connection
+    in a thread, so a slow SMTP server never blocks the event loop. Messages
+    that fail on a network or SMTP error are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int,
+        batch_size: int,
+        max_size: int,
+        max_retries: int,
+        retry_delay: float,
+        idle_timeout: float,
+        shutdown_timeout: float,
+        service_factory: Callable[[], EmailService] = EmailService,
+    ) -> None:
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_size = max_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.idle_timeout = idle_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.service_factory = service_factory
+        self._queue: asyncio.Queue[_Job] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._retries: set[asyncio.TimerHandle] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._queue is not None
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._tasks = [asyncio.create_task(self._work(self._queue)) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Let the workers drain the queue, then close their connections."""
+        if self._queue is None:
+            return
+
+        for handle in self._retries:
+            handle.cancel()
+        if self._retries:
+            Logger.warning(f"Dropping {len(self._retries)} email(s) waiting for a retry.")
+        self._retries.clear()
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=self.shutdown_timeout)
+        except TimeoutError:
+            Logger.warning(f"Dropping {self._queue.qsize()} queued email(s) on shutdown.")
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    async def enqueue(self, message: EmailMessageData) -> bool:
+        """
+        Queue `message` for delivery and return whether it was accepted.
+
+        When the queue is not started (scripts, tests) the message is sent
+        right away, still off the event loop.
+        """
+        if self._queue is None:
+            await asyncio.to_thread(self.service_factory().send, message)
+            return True
+
+        return self._put(self._queue, _Job(message))
+
+    async def _work(self, queue: asyncio.Queue[_Job]) -> None:
+        service = self.service_factory()
+        email_sender = service.create_sender()
+        loop = asyncio.get_running_loop()
+        sending: asyncio.Future[list[_Job]] | None = None
+
+        try:
+            while True:
+                try:
+                    job = await asyncio.wait_for(queue.get(), timeout=self.idle_timeout)
+                except TimeoutError:
+                    await asyncio.to_thread(self._close, email_sender)
+                    continue
+
+                batch = [job]
+                while len(batch) < self.batch_size and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                sending = loop.run_in_executor(None, self._send_batch, service, email_sender, batch)
+                try:
+                    # Shielded, so a cancelled worker does not lose track of the thread still sending
+                    failed = await asyncio.shield(sending)
+                finally:
+                    for _ in batch:
+                        queue.task_done()
+
+                for failed_job in failed:
+                    self._retry(queue, failed_job)
+        finally:
+            if sending is not None and not sending.done():
+                # The thread still uses the connection: close it once the send is over, without waiting for it
+                sending.add_done_callback(lambda _: loop.run_in_executor(None, self._close, email_sender))
+            else:
+                await asyncio.to_thread(self._close, email_sender)
+
+    def _send_batch(
+        self,
+        service: EmailService,
+        email_sender: EmailSender,
+        batch: list[_Job],
+    ) -> list[_Job]:
+        """Send `batch` over one connection and return the jobs to retry."""
+        failed = []
+        for job in batch:
+            try:
+                if not email_sender.is_alive:
+                    email_sender.connect()  # type: ignore[no-untyped-call]
+                service.send(job.message, email_sender=email_sender)
+            except (smtplib.SMTPException, OSError) as err:
+                Logger.warning(
+                    f"Failed to send email {job.message.subject!r}: {err}",
+                    stack_info=False,
+                )
+                self._close(email_sender)
+                failed.append(job)
+            except Exception as err:
+                Logger.error(f"Dropping email {job.message.subject!r}: {err}")
+        return failed
+
+    def _retry(self, queue: asyncio.Queue[_Job], job: _Job) -> None:
+        if job.attempt >= self.max_retries:
+            Logger.error(
+                f"Giving up on email {job.message.subject!r} after {job.attempt + 1} attempts.",
+            )
+            return
+
+        delay = self.retry_delay * 2**job.attempt
+        job.attempt += 1
+
+        def requeue() -> None:
+            self._retries.discard(handle)
+            self._put(queue, job)
+
+        handle = asyncio.get_running_loop().call_later(delay, requeue)
+        self._retries.add(handle)
+
+    @staticmethod
+    def _put(queue: asyncio.Queue[_Job], job: _Job) -> bool:
+        try:
+            queue.put_nowait(job)
+        except asyncio.QueueFull:
+            Logger.error(f"Email queue is full, dropping email {job.message.subject!r}.")
+            return False
+        return True
+
+    @staticmethod
+    def _close(email_sender: EmailSender) -> None:
+        """Close a pooled connection, even if the server already dropped it."""
+        if not email_sender.is_alive:
+            return
+        try:
+            email_sender.close()  # type: ignore[no-untyped-call]
+        except (smtplib.SMTPException, OSError):
+            email_sender.connection = None
+
+
+email_queue = EmailQueue(
+    workers=settings.email_queue_workers,
+    batch_size=settings.email_queue_batch_size,
+    max_size=settings.email_queue_max_size,
+    max_retries=settings.email_queue_max_retries,
+    retry_delay=settings.email_queue_retry_delay,
+    idle_timeout=settings.email_queue_idle_timeout,
+    shutdown_timeout=settings.email_queue_shutdown_timeout,
+)
@@ -4,6 +4,7 @@ from pathlib import Path
 from redmail.email.sender import EmailSender
 
 from app.services.email.dto import EmailMessageData
+from app.services.email.template import email_templates
 from app.settings import settings
 
 
@@ -17,8 +18,28 @@ class EmailService:
     def __init__(self, sender: str = settings.smtp_user) -> None:
         self.sender = sender
 
-    def send(self, message: EmailMessageData) -> EmailMessage | None:
-        """Send email using the provided EmailMessageData DTO."""
+    def create_sender(self) -> EmailSender:
+        """Build an SMTP client; it connects lazily, on `connect()` or send."""
+        return EmailSender(
+            host=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_starttls=self.use_starttls,
+            timeout=settings.smtp_timeout,
+        )
+
+    def send(
+        self,
+        message: EmailMessageData,
+        email_sender: EmailSender | None = None,
+    ) -> EmailMessage | None:
+        """
+        Send email using the provided EmailMessageData DTO.
+
+        Pass a connected `email_sender` to reuse its SMTP connection,
+        otherwise a connection is opened and closed for this message only.
+        """
         html = message.html or self._render_template(message)
         to, cc, bcc = self._resolve_recipients(
             message.receivers,
@@ -26,13 +47,7 @@ class EmailService:
             message.bcc or [],
         )
 
-        email = EmailSender(
-            host=self.host,
-            port=self.port,
-            username=self.username,
-            password=self.password,
-            use_starttls=self.use_starttls,
-        )
+        email = email_sender or self.create_sender()
 
         return email.send(
             sender=self.sender,
@@ -54,12 +69,13 @@ class EmailService:
         data.setdefault("static_host", settings.static_host)
 
         tpl_name = message.tpl.removesuffix(".html") + ".html"
-        template_path = Path(settings.static_dir) / "email_tpl" / tpl_name
+        template = email_templates.get(self.template_dir() / tpl_name)
 
-        with template_path.open("r") as f:
-            template = f.read()
+        return template.render(data)
 
-        return template.format(**data)
+    @staticmethod
+    def template_dir() -> Path:
+        return Path(settings.static_dir) / "email_tpl"
 
     def _resolve_recipients(
         self,
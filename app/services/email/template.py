@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from pathlib import Path
+from string import Formatter
+from typing import Mapping
+
+
+@dataclass(frozen=True)
+class EmailTemplate:
+    """
+    A `str.format` template parsed once into literal text and fields.
+
+    Rendering joins the pre-split literals with the formatted values instead
+    of scanning the whole (mostly CSS) source for braces on every message.
+    """
+
+    name: str
+    literals: tuple[str, ...]
+    fields: tuple[tuple[str, str], ...]  # (name, format spec)
+    placeholders: frozenset[str]
+    mtime_ns: int
+
+    @classmethod
+    def compile(cls, path: Path) -> "EmailTemplate":
+        """
+        Read and validate a template.
+
+        Malformed braces and placeholders other than plain names with an
+        optional format spec (positional `{0}`, attribute `{a.b}`, index
+        `{a[0]}`, conversion `{a!r}` or nested `{a:{b}}` fields) are rejected
+        here, so a broken template fails when it is loaded rather than sent.
+        """
+        mtime_ns = path.stat().st_mtime_ns
+        source = path.read_text()
+
+        try:
+            parsed = list(Formatter().parse(source))
+        except ValueError as err:
+            raise ValueError(f"Invalid email template '{path.name}': {err}") from err
+
+        literals = [""]
+        fields = []
+        for literal, name, format_spec, conversion in parsed:
+            literals[-1] += literal
+            if name is None:
+                continue
+            if not name.isidentifier() or conversion or "{" in (format_spec or ""):
+                raise ValueError(f"Invalid placeholder '{{{name}}}' in email template '{path.name}'.")
+            fields.append((name, format_spec or ""))
+            literals.append("")
+
+        return cls(
+            name=path.stem,
+            literals=tuple(literals),
+            fields=tuple(fields),
+            placeholders=frozenset(name for name, _ in fields),
+            mtime_ns=mtime_ns,
+        )
+
+    def render(self, data: Mapping[str, object]) -> str:
+        missing = self.placeholders - data.keys()
+        if missing:
+            raise ValueError(
+                f"Missing data for email template '{self.name}': {', '.join(sorted(missing))}.",
+            )
+
+        parts = [self.literals[0]]
+        for (name, format_spec), literal in zip(self.fields, self.literals[1:], strict=True):
+            parts.append(format(data[name], format_spec))
+            parts.append(literal)
+        return "".join(parts)
+
+
+class TemplateCache:
+    """
+    Compiled email templates, keyed by path.
+
+    Every lookup costs one `stat()`: a template is compiled again only when
+    its modification time changed, so edits are picked up without a restart.
+    """
+
+    def __init__(self) -> None:
+        self._templates: dict[Path, EmailTemplate] = {}
+
+    def get(self, path: Path) -> EmailTemplate:
+        template = self._templates.get(path)
+        if template is None or template.mtime_ns != path.stat().st_mtime_ns:
+            template = EmailTemplate.compile(path)
+            self._templates[path] = template
+        return template
+
+    def preload(self, directory: Path) -> list[EmailTemplate]:
+        """Compile every template of `directory`, failing on the first invalid one."""
+        return [self.get(path) for path in sorted(directory.glob("*.html"))]
+
+    def clear(self) -> None:
+        self._templates.clear()
+
+
+email_templates = TemplateCache()
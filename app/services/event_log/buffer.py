@@ -0,0 +1,130 @@
+import asyncio
+from contextlib import suppress
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.dao.event_log_dao import EventLogCreate, EventLogDAO
+from app.services.logger.service import Logger
+from app.settings import settings
+
+
+class EventLogBuffer:
+    """
+    In-process buffer of event log records, written in batches.
+
+    Buffered events are inserted in their own transaction, with a single
+    multi-row INSERT (COPY for large batches, see `AbstractDAO.create_many`),
+    as soon as `batch_size` of them are waiting or every `flush_interval`
+    seconds. They are flushed on `stop`, and put back in the buffer when a
+    write fails. Before `start`, events are kept until the first flush.
+
+    Events that must commit or roll back with the business transaction are
+    recorded with that transaction's session instead, and are not buffered.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int,
+        flush_interval: float,
+        max_size: int,
+        dao_factory: Callable[[AsyncSession], EventLogDAO] = EventLogDAO,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_size = max_size
+        self.dao_factory = dao_factory
+        self._events: list[EventLogCreate] = []
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._full = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    async def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        if self.running:
+            return
+        self._session_factory = session_factory
+        self._full = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._stopping = False
+        if len(self._events) >= self.batch_size:
+            self._full.set()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic flushes and write the events still buffered."""
+        if self._task is None:
+            return
+
+        self._stopping = True
+        self._full.set()
+        await self._task
+        self._task = None
+        await self.flush()
+        self._session_factory = None
+
+    def record(self, event: EventLogCreate, *, session: AsyncSession | None = None) -> bool:
+        """
+        Record `event` and return whether it was accepted.
+
+        With a `session`, the event is added to it and commits with the
+        caller's transaction. Otherwise it is buffered, and dropped when the
+        buffer is full.
+        """
+        if session is not None:
+            self.dao_factory(session).add(event)
+            return True
+
+        if len(self._events) >= self.max_size:
+            Logger.error(f"Event log buffer is full, dropping {event.event_type} event.")
+            return False
+
+        self._events.append(event)
+        if len(self._events) >= self.batch_size:
+            self._full.set()
+        return True
+
+    async def flush(self) -> int:
+        """Write the buffered events and return how many were written."""
+        async with self._lock:
+            self._full.clear()
+            if not self._events or self._session_factory is None:
+                return 0
+
+            batch, self._events = self._events, []
+            try:
+                async with self._session_factory() as session, session.begin():
+                    await self.dao_factory(session).create_many(batch)
+            except Exception as err:
+                Logger.error(f"Failed to write {len(batch)} event(s): {err}")
+                self._requeue(batch)
+                return 0
+            return len(batch)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._full.wait(), timeout=self.flush_interval)
+            await self.flush()
+
+    def _requeue(self, batch: list[EventLogCreate]) -> None:
+        room = self.max_size - len(self._events)
+        if room < len(batch):
+            Logger.error(f"Event log buffer is full, dropping {len(batch) - room} event(s).")
+        self._events[:0] = batch[: max(room, 0)]
+
+
+event_log_buffer = EventLogBuffer(
+    batch_size=settings.event_log_batch_size,
+    flush_interval=settings.event_log_flush_interval,
+    max_size=settings.event_log_max_size,
+)
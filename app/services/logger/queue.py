@@ -0,0 +1,91 @@
+import logging
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+from app.services.logger.formatter import JSONFormatter
+
+
+class _LocalQueueHandler(QueueHandler):
+    """
+    Hand records over to the listener thread as they are.
+
+    The stock `prepare` formats the record (traceback and stack included) in
+    the calling thread so it can be pickled. The queue never leaves the
+    process, so only the message is merged here; formatting happens in the
+    listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class LogQueue:
+    """
+    Move a logger's output to a background thread.
+
+    `start` replaces the handlers a logger would reach (its own and those of
+    the ancestors it propagates to) by a queue, and hands them to a
+    `QueueListener`. Callers only pay for building the record; formatting and
+    writing happen in the listener thread. `stop` flushes the queue and puts
+    the original handlers back.
+    """
+
+    def __init__(self) -> None:
+        self._listener: QueueListener | None = None
+        self._logger: logging.Logger | None = None
+        self._handlers: list[logging.Handler] = []
+        self._propagate = True
+
+    @property
+    def running(self) -> bool:
+        return self._listener is not None
+
+    def start(self, logger: logging.Logger, *, json_output: bool = False) -> None:
+        if self._listener is not None:
+            return
+
+        if json_output:
+            handler = logging.StreamHandler(sys.stderr)
+            handler.setFormatter(JSONFormatter())
+            handlers: list[logging.Handler] = [handler]
+        else:
+            handlers = self._effective_handlers(logger)
+
+        queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+        self._logger = logger
+        self._handlers = logger.handlers[:]
+        self._propagate = logger.propagate
+        logger.handlers = [_LocalQueueHandler(queue)]
+        logger.propagate = False
+
+        self._listener = QueueListener(queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+
+    def stop(self) -> None:
+        if self._listener is None or self._logger is None:
+            return
+
+        self._listener.stop()
+        self._logger.handlers = self._handlers
+        self._logger.propagate = self._propagate
+        self._listener = None
+        self._logger = None
+
+    @staticmethod
+    def _effective_handlers(logger: logging.Logger) -> list[logging.Handler]:
+        handlers: list[logging.Handler] = []
+        current: logging.Logger | None = logger
+        while current is not None:
+            handlers.extend(current.handlers)
+            if not current.propagate:
+                break
+            current = current.parent
+        if not handlers and logging.lastResort is not None:
+            handlers.append(logging.lastResort)
+        return handlers
+
+
+log_queue = LogQueue()
@@ -1,4 +1,5 @@
 import logging
+import sys
 from enum import Enum
 
 from app.settings import settings
@@ -23,10 +24,23 @@ class Logger:
     def log(
         level: LogLevel,
         msg: object,
-        exc_info: bool = settings.exc_info,
-        stack_info: bool = settings.stack_info,
+        exc_info: bool | None = None,
+        stack_info: bool | None = None,
         stacklevel: int = settings.stacklevel,
     ) -> None:
+        """
+        Log `msg` at `level`.
+
+        Unless asked for explicitly, the stack and the exception being handled
+        are only captured from WARNING up: walking and formatting the stack
+        is far more expensive than the log line itself.
+        """
+        capture = level.value >= logging.WARNING
+        if exc_info is None:
+            exc_info = capture and settings.exc_info and sys.exc_info()[0] is not None
+        if stack_info is None:
+            stack_info = capture and settings.stack_info
+
         logger.log(
             level=level.value,
             msg=msg,
@@ -38,8 +52,8 @@ class Logger:
     @staticmethod
     def info(
         msg: object,
-        exc_info: bool = settings.exc_info,
-        stack_info: bool = settings.stack_info,
+        exc_info: bool | None = None,
+        stack_info: bool | None = None,
         stacklevel: int = settings.stacklevel,
     ) -> None:
         Logger.log(
@@ -53,8 +67,8 @@ class Logger:
     @staticmethod
     def warning(
         msg: object,
-        exc_info: bool = settings.exc_info,
-        stack_info: bool = settings.stack_info,
+        exc_info: bool | None = None,
+        stack_info: bool | None = None,
         stacklevel: int = settings.stacklevel,
     ) -> None:
         Logger.log(
@@ -68,8 +82,8 @@ class Logger:
     @staticmethod
     def error(
         msg: object,
-        exc_info: bool = settings.exc_info,
-        stack_info: bool = settings.stack_info,
+        exc_info: bool | None = None,
+        stack_info: bool | None = None,
         stacklevel: int = settings.stacklevel,
     ) -> None:
         Logger.log(
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+
+class PasswordError(StrEnum):
+
+    HASHER_BUSY = "HASHER_BUSY"
@@ -0,0 +1,102 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Callable, TypeVar
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from app.errors import DomainError
+from app.services.password.errors import PasswordError
+from app.settings import settings
+
+T = TypeVar("T")
+
+
+def check_password(
+    hasher: PasswordHasher,
+    hashed_password: str,
+    password: str,
+) -> tuple[bool, str | None]:
+    """
+    Verify `password` against `hashed_password`.
+
+    Also returns a new hash when the stored one was made with other Argon2
+    parameters than `hasher`'s, so callers can upgrade it.
+    """
+    try:
+        hasher.verify(hashed_password, password)
+    except (VerificationError, InvalidHashError):
+        return False, None
+
+    if hasher.check_needs_rehash(hashed_password):
+        return True, hasher.hash(password)
+    return True, None
+
+
+class PasswordService:
+    """
+    Argon2 hashing off the event loop.
+
+    Calls run in a bounded thread pool (argon2-cffi releases the GIL while
+    hashing). At most `max_workers + max_pending` calls are admitted at once;
+    callers wait up to `timeout` seconds for a slot, then get a
+    HASHER_BUSY error instead of piling up more work.
+    """
+
+    def __init__(
+        self,
+        *,
+        hasher: PasswordHasher,
+        max_workers: int,
+        max_pending: int,
+        timeout: float,
+    ) -> None:
+        self.hasher = hasher
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="argon2")
+        self._slots = asyncio.Semaphore(max_workers + max_pending)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.hasher.hash, password)
+
+    async def verify(self, hashed_password: str, password: str) -> bool:
+        verified, _ = await self.verify_and_update(hashed_password, password)
+        return verified
+
+    async def verify_and_update(
+        self,
+        hashed_password: str,
+        password: str,
+    ) -> tuple[bool, str | None]:
+        return await self._run(check_password, self.hasher, hashed_password, password)
+
+    async def _run(self, func: Callable[..., T], *args: object) -> T:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.timeout)
+        except TimeoutError as e:
+            raise DomainError(
+                detail={
+                    "code": PasswordError.HASHER_BUSY,
+                    "message": "Too many password operations in progress, retry later.",
+                },
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+            ) from e
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._slots.release()
+
+
+password_service = PasswordService(
+    hasher=PasswordHasher(
+        time_cost=settings.argon2_time_cost,
+        memory_cost=settings.argon2_memory_cost,
+        parallelism=settings.argon2_parallelism,
+    ),
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+    timeout=settings.password_hash_timeout,
+)
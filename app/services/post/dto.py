@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 
 @dataclass
@@ -8,3 +9,20 @@ class PostCreateDTO:
     published: bool
     author_id: int
     created_by: int
+
+
+@dataclass
+class PostListFiltersDTO:
+    author_id: int | None = None
+    published: bool | None = None
+    created_from: datetime | None = None
+    created_before: datetime | None = None
+
+
+@dataclass
+class PostSummaryDTO:
+    id: int
+    title: str
+    published: bool
+    author_id: int
+    created_at: datetime
@@ -4,3 +4,11 @@ from enum import StrEnum
 class CreatePostError(StrEnum):
     INVALID_DATA = "INVALID_DATA"
     AUTHOR_NOT_FOUND = "AUTHOR_NOT_FOUND"
+
+
+class ListPostsError(StrEnum):
+    INVALID_PAGINATION = "INVALID_PAGINATION"
+
+
+class SearchPostsError(StrEnum):
+    INVALID_PAGINATION = "INVALID_PAGINATION"
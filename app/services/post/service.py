@@ -1,10 +1,14 @@
+from typing import Any
+
 from pydantic import ValidationError
+from sqlalchemy import Row
 
-from app.db.dao.post_dao import DAOPostCreateDTO, PostDAO
+from app.db.dao.post_dao import DAOPostCreateDTO, DAOPostListFilters, PostDAO
 from app.db.dao.user_dao import UserDAO
+from app.db.pagination import Page, SortSpec
 from app.errors import DomainError
-from app.services.post.dto import PostCreateDTO
-from app.services.post.errors import CreatePostError
+from app.services.post.dto import PostCreateDTO, PostListFiltersDTO, PostSummaryDTO
+from app.services.post.errors import CreatePostError, ListPostsError, SearchPostsError
 from app.services.post.schema import CreatePostValidation
 
 
@@ -52,3 +56,68 @@ class PostService:
         )
 
         return post_id
+
+    async def list_posts(
+        self,
+        *,
+        filters: PostListFiltersDTO,
+        sort: SortSpec,
+        limit: int,
+        cursor: str | None = None,
+    ) -> Page[PostSummaryDTO]:
+        try:
+            page = await self.post_dao.get_list_page(
+                filters=DAOPostListFilters(
+                    author_id=filters.author_id,
+                    published=filters.published,
+                    created_from=filters.created_from,
+                    created_before=filters.created_before,
+                ),
+                sort=sort,
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError as e:
+            raise DomainError(
+                detail={
+                    "code": ListPostsError.INVALID_PAGINATION,
+                    "message": str(e),
+                },
+            ) from e
+
+        return self._summaries(page)
+
+    async def search_posts(
+        self,
+        *,
+        terms: str,
+        limit: int,
+        cursor: str | None = None,
+    ) -> Page[PostSummaryDTO]:
+        try:
+            page = await self.post_dao.search(terms, limit=limit, cursor=cursor)
+        except ValueError as e:
+            raise DomainError(
+                detail={
+                    "code": SearchPostsError.INVALID_PAGINATION,
+                    "message": str(e),
+                },
+            ) from e
+
+        return self._summaries(page)
+
+    @staticmethod
+    def _summaries(page: Page[Row[Any]]) -> Page[PostSummaryDTO]:
+        return Page(
+            items=[
+                PostSummaryDTO(
+                    id=row.id,
+                    title=row.title,
+                    published=row.published,
+                    author_id=row.author_id,
+                    created_at=row.created_at,
+                )
+                for row in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
@@ -5,3 +5,4 @@ class ChangePasswordError(StrEnum):
 
     INVALID_OLD_PASSWORD = "INVALID_OLD_PASSWORD"
     INVALID_NEW_PASSWORD = "INVALID_NEW_PASSWORD"
+    USER_MODIFIED = "USER_MODIFIED"
@@ -1,16 +1,21 @@
-from argon2 import PasswordHasher
+from datetime import datetime
+from http import HTTPStatus
+
 from pydantic import ValidationError
 
+from app.db.dao.abstract_dao import StaleVersionError
 from app.db.dao.user_dao import UserDAO
 from app.db.models.user_model import User
 from app.errors import DomainError
+from app.services.password.service import PasswordService
 from app.services.user.errors import ChangePasswordError
 from app.services.user.schemas import ValidatePasswordSchema
 
 
 class UserService:
-    def __init__(self, *, user_dao: UserDAO) -> None:
+    def __init__(self, *, user_dao: UserDAO, password_service: PasswordService) -> None:
         self.user_dao = user_dao
+        self.password_service = password_service
 
     async def change_password(
         self,
@@ -18,16 +23,15 @@ class UserService:
         user: User,
         old_password: str,
         new_password: str,
+        expected_updated_at: datetime | None = None,
     ) -> None:
-        try:
-            PasswordHasher().verify(user.hashed_password, old_password)
-        except Exception as e:
+        if not await self.password_service.verify(user.hashed_password, old_password):
             raise DomainError(
                 detail={
                     "code": ChangePasswordError.INVALID_OLD_PASSWORD,
                     "message": "Old password is invalid",
                 },
-            ) from e
+            )
 
         try:
             schema = ValidatePasswordSchema.model_validate({"password": new_password})
@@ -39,7 +43,17 @@ class UserService:
                 },
             ) from e
 
-        await self.user_dao.patch_password(
-            user_id=user.id,
-            password=schema.password,
-        )
+        try:
+            await self.user_dao.patch_password(
+                user_id=user.id,
+                password=schema.password,
+                expected_updated_at=expected_updated_at,
+            )
+        except StaleVersionError as e:
+            raise DomainError(
+                detail={
+                    "code": ChangePasswordError.USER_MODIFIED,
+                    "message": "The user was modified since it was read.",
+                },
+                status_code=HTTPStatus.PRECONDITION_FAILED,
+            ) from e
@@ -1,6 +1,8 @@
 import enum
+import os
 from typing import Optional
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from yarl import URL
 
@@ -28,10 +30,20 @@ class Settings(BaseSettings):
 
     host: str = "127.0.0.1"
     port: int = 8000
-    # quantity of workers for uvicorn
+    # quantity of workers for uvicorn, 0 for one per available CPU
     workers_count: int = 1
     # Enable uvicorn reloading
     reload: bool = False
+    # Server tuning, per worker process
+    server_limit_concurrency: Optional[int] = 1000  # connections and tasks, above it 503s are returned
+    server_backlog: int = 2048
+    server_keep_alive: int = 5  # in seconds, to wait for the next request on a connection
+    server_graceful_timeout: int = 30  # in seconds, for in-flight requests on shutdown
+    # Workers are restarted after serving this many requests, plus up to the jitter (0 disables it)
+    server_max_requests: int = 0
+    server_max_requests_jitter: int = 0
+    server_max_memory_mb: int = 0  # resident memory above which a worker is restarted, 0 disables it
+    server_recycle_check_interval: float = 5.0  # in seconds
 
     # Current environment
     environment: str = "local"
@@ -40,6 +52,7 @@ class Settings(BaseSettings):
     # Logging configuration
     logger_name: str = "uvicorn.error"
     log_level: LogLevel = LogLevel.INFO
+    log_json: bool = False  # one JSON object per line instead of plain text
 
     # Variables for the database
     db_host: str = "localhost"
@@ -48,6 +61,29 @@ class Settings(BaseSettings):
     db_pass: str = "api"
     db_base: str = "api"
     db_echo: bool = False
+    # Above this many rows, bulk inserts switch from INSERT ... VALUES to COPY
+    db_copy_threshold: int = 10000
+    # Connection pool, per worker process
+    db_pool_size: int = 10
+    db_pool_min_size: int = 2  # connections opened on startup
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # in seconds, to wait for a free connection
+    db_pool_recycle: int = 1800  # in seconds, -1 never recycles
+    db_pool_pre_ping: bool = True
+    db_statement_cache_size: int = 100  # prepared statements per connection, 0 for pgbouncer
+    db_statement_timeout: int = 30000  # in milliseconds, 0 disables it
+    db_slow_query_threshold: float = 0.5  # in seconds, slower statements are logged
+    # Read replicas as "host" or "host:port", with the same credentials, database and default port
+    db_replicas: list[str] = []
+    db_replica_check_interval: float = 5.0  # in seconds
+    db_replica_check_timeout: float = 2.0  # in seconds
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes, sized from the CPU count when `workers_count` is 0."""
+        if self.workers_count > 0:
+            return self.workers_count
+        return len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
 
     @property
     def db_url(self) -> URL:
@@ -65,9 +101,41 @@ class Settings(BaseSettings):
             path=f"/{self.db_base}",
         )
 
+    @property
+    def db_replica_urls(self) -> list[URL]:
+        """Assemble the database URL of every read replica."""
+        urls = []
+        for replica in self.db_replicas:
+            host, _, port = replica.partition(":")
+            urls.append(self.db_url.with_host(host).with_port(int(port) if port else self.db_port))
+        return urls
+
+    @field_validator("db_replicas")
+    @classmethod
+    def validate_db_replicas(cls, value: list[str]) -> list[str]:
+        """Reject replicas that are not "host" or "host:port"."""
+        for replica in value:
+            host, separator, port = replica.partition(":")
+            if not host or (separator and not port.isdigit()):
+                raise ValueError(f'Read replica {replica!r} is not "host" or "host:port"')
+        return value
+
+    # Limits of nested query strings such as `filter[tags][0][name]=x`
+    query_max_depth: int = 8  # segments per key
+    query_max_keys: int = 100
+    query_max_index: int = 100  # highest list index accepted
+
+    # Metrics exposed on /api/metrics
+    metrics_loop_lag_interval: float = 0.5  # in seconds, between event loop lag probes
+    metrics_token: Optional[str] = None  # bearer token of the scrapers, the endpoint is closed while unset
+
     # Sentry's configuration.
     sentry_dsn: Optional[str] = None
-    sentry_sample_rate: float = 1.0
+    sentry_sample_rate: float = 0.1  # share of ordinary transactions sent
+    sentry_route_sample_rates: dict[str, float] = {"monitoring:metrics": 0.0}  # by route name
+    sentry_record_rate: float = 0.25  # share of requests traced, 1.0 sends every failed or slow one
+    sentry_slow_request_threshold: float = 1.0  # in seconds, slower traced requests are always sent
+    sentry_traces_per_second: float = 10.0  # transactions sent per second and worker, at most
 
     # JWT configuration
     auth_secret: str = "secret"
@@ -75,9 +143,20 @@ class Settings(BaseSettings):
     auth_refresh_seconds: int = 86400
     auth_reset_seconds: int = 3600
     auth_token_type: str = "bearer"
+    # Cache of authenticated users (0 disables it)
+    auth_cache_ttl_seconds: int = 30
+    auth_cache_max_size: int = 10000
 
     reset_mail_link_expiracy: int = 24  # in hours
 
+    # Password hashing (Argon2 parameters and worker pool)
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536  # in KiB
+    argon2_parallelism: int = 4
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 100
+    password_hash_timeout: float = 5.0  # seconds to wait for a free slot
+
     # Secret key for the application
     secret_key: str = "my_secret_key"
 
@@ -89,8 +168,28 @@ class Settings(BaseSettings):
     static_host: str = "http://localhost"
     dev_email: str = "user@example.com"
     vendor_email: str = "vendor@example.com"
-
-    # Error logger
+    smtp_timeout: float = 10.0  # in seconds, per SMTP operation
+
+    # Outbound email queue
+    email_queue_workers: int = 2  # one pooled SMTP connection each
+    email_queue_batch_size: int = 20  # messages sent per connection round trip
+    email_queue_max_size: int = 1000
+    email_queue_max_retries: int = 5
+    email_queue_retry_delay: float = 1.0  # in seconds, doubled on each retry
+    email_queue_idle_timeout: float = 30.0  # close idle SMTP connections after
+    email_queue_shutdown_timeout: float = 10.0  # time allowed to drain on stop
+
+    # Buffered event log writer
+    event_log_batch_size: int = 500  # flush as soon as this many events are buffered
+    event_log_flush_interval: float = 0.5  # in seconds, flush at least this often
+    event_log_max_size: int = 10000  # events buffered beyond it are dropped
+    # Monthly event_log partitions, created ahead and archived once expired
+    event_log_partitions_ahead: int = 3  # months created after the current one
+    event_log_retention_months: int = 12  # 0 keeps every partition
+    event_log_archive_dir: str = "archive"  # gzipped NDJSON exports of the expired partitions
+    event_log_maintenance_interval: float = 3600.0  # in seconds
+
+    # Error logger (stack and exception are captured from WARNING up)
     exc_info: bool = True
     stack_info: bool = True
     stacklevel: int = 1
@@ -103,6 +202,12 @@ class Settings(BaseSettings):
 
     # Static directory
     static_dir: str = "static"
+    static_cache_max_age: int = 2592000  # in seconds, Cache-Control of static files
+
+    # Response compression, for responses and static files of at least the minimum size
+    compression_minimum_size: int = 1000  # in bytes
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4  # used when the brotli package is installed
 
 
 settings = Settings()
@@ -0,0 +1,101 @@
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from app.auth.user_cache import UserCache, invalidate_user, user_cache
+from app.db.models.user_model import User
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> UserCache:
+    return UserCache(max_size=2, ttl_seconds=30, clock=clock)
+
+
+def make_user(user_id: int) -> User:
+    return User(id=user_id, email=f"user{user_id}@example.com", first_name="John", last_name="Doe")
+
+
+def test_get_returns_detached_copy_and_counts_hits(cache: UserCache) -> None:
+    user = make_user(1)
+
+    assert cache.get("token") is None
+    cache.set("token", user)
+    cached = cache.get("token")
+
+    assert cached is not None
+    assert cached is not user
+    assert cached.email == user.email
+    assert inspect(cached).detached
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_entries_expire_after_ttl(cache: UserCache, clock: FakeClock) -> None:
+    cache.set("token", make_user(1))
+
+    clock.now += 31
+
+    assert cache.get("token") is None
+    assert cache.stats() == {"hits": 0, "misses": 1, "size": 0}
+
+
+def test_entries_never_outlive_token(cache: UserCache, clock: FakeClock) -> None:
+    cache.set("token", make_user(1), token_expires_at=clock.now + 5)
+
+    clock.now += 6
+
+    assert cache.get("token") is None
+
+
+def test_least_recently_used_entry_is_evicted(cache: UserCache) -> None:
+    cache.set("a", make_user(1))
+    cache.set("b", make_user(2))
+    cache.get("a")
+    cache.set("c", make_user(3))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_invalidate_drops_every_token_of_user(cache: UserCache) -> None:
+    cache.set("a", make_user(1))
+    cache.set("b", make_user(1))
+
+    cache.invalidate(1)
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_disabled_cache_stores_nothing(clock: FakeClock) -> None:
+    cache = UserCache(max_size=10, ttl_seconds=0, clock=clock)
+
+    cache.set("token", make_user(1))
+
+    assert cache.get("token") is None
+
+
+def test_invalidate_user_runs_again_after_commit() -> None:
+    session = Session()
+    user_cache.set("token", make_user(42))
+
+    invalidate_user(session, 42)
+    user_cache.set("token", make_user(42))
+    session.commit()
+
+    assert user_cache.get("token") is None
+    user_cache.clear()
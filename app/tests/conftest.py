@@ -0,0 +1,92 @@
+import asyncio
+from contextlib import AbstractContextManager, contextmanager
+from datetime import date
+from typing import AsyncGenerator, Callable, Generator, Iterator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.db.instrumentation import QueryStats, track_queries
+from app.db.meta import meta
+from app.db.models import load_all_models
+from app.db.partitions import add_months, create_partitions
+from app.db.pool import create_db_engine
+from app.db.utils import create_database, drop_database
+from app.settings import settings
+
+
+async def _create_schema() -> None:
+    await create_database()
+
+    engine = create_async_engine(str(settings.db_url))
+    async with engine.begin() as conn:
+        await conn.run_sync(meta.create_all)
+        today = date.today()
+        await create_partitions(conn, "event_log", start=add_months(today, -1), end=add_months(today, 1))
+    await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def _database() -> Generator[None, None, None]:
+    """
+    Create a throwaway test database for the whole session.
+
+    Tests depending on it are skipped when Postgres is not reachable, so the
+    service unit tests keep running without a database.
+    """
+    original_base = settings.db_base
+    settings.db_base = f"{original_base}_test"
+    load_all_models()
+
+    try:
+        asyncio.run(_create_schema())
+    except OSError as err:
+        settings.db_base = original_base
+        pytest.skip(f"Postgres is not available: {err}")
+
+    yield
+
+    asyncio.run(drop_database())
+    settings.db_base = original_base
+
+
+@pytest_asyncio.fixture
+async def db_engine(_database: None) -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_db_engine()
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db_session_factory(
+    db_engine: AsyncEngine,
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    yield async_sessionmaker(db_engine, expire_on_commit=False)
+
+    async with db_engine.begin() as conn:
+        for table in reversed(meta.sorted_tables):
+            await conn.execute(table.delete())
+
+
+@pytest.fixture
+def query_budget() -> Callable[[int], AbstractContextManager[QueryStats]]:
+    """
+    Fail when the block runs more than `max_queries` statements.
+
+    Usage: `with query_budget(2): await client.get("/api/users/me")`
+    """
+
+    @contextmanager
+    def budget(max_queries: int) -> Iterator[QueryStats]:
+        with track_queries(record=True) as stats:
+            yield stats
+        if stats.count > max_queries:
+            pytest.fail("\n".join([f"{stats.count} queries, budget is {max_queries}:", *(stats.statements or [])]))
+
+    return budget
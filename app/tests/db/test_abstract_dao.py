@@ -0,0 +1,196 @@
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.consts import EventLogType
+from app.db.dao.event_log_dao import EventLogCreate, EventLogDAO
+from app.db.dao.post_dao import DAOPostCreateDTO, DAOPostUpdateDTO, DAOPublishedUpdateDTO, PostDAO
+from app.db.models.event_log_model import EventLog
+from app.db.models.post_model import Post
+from app.db.models.user_model import User
+from app.settings import settings
+
+ROWS = 12
+
+
+@pytest.fixture(params=["insert", "copy"])
+def insert_path(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run the test through the multi-row INSERT, then through COPY."""
+    monkeypatch.setattr(settings, "db_copy_threshold", ROWS + 1 if request.param == "insert" else ROWS)
+    return str(request.param)
+
+
+@pytest_asyncio.fixture
+async def author(db_session_factory: async_sessionmaker[AsyncSession]) -> AsyncGenerator[User, None]:
+    async with db_session_factory() as session, session.begin():
+        user = User(
+            email="writer@example.com",
+            hashed_password="-",
+            first_name="Bulk",
+            last_name="Writer",
+            permissions=[],
+        )
+        session.add(user)
+    yield user
+
+
+@pytest.mark.asyncio
+async def test_create_many_returns_post_ids_in_input_order(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    author: User,
+    insert_path: str,
+) -> None:
+    items = [
+        DAOPostCreateDTO(
+            title=f"Post {index}",
+            content="...",
+            published=index % 2 == 0,
+            author_id=author.id,
+            created_by=author.id,
+        )
+        for index in reversed(range(ROWS))
+    ]
+
+    async with db_session_factory() as session, session.begin():
+        ids = await PostDAO(session).create_many(items)
+
+    async with db_session_factory() as session:
+        posts = {post.id: post for post in (await session.scalars(select(Post))).all()}
+
+    assert len(ids) == len(set(ids)) == ROWS, insert_path
+    assert [posts[key].title for key in ids] == [item.title for item in items]
+    assert [posts[key].published for key in ids] == [item.published for item in items]
+    # Column defaults are applied on both paths: client side (`is_active`) and server side
+    assert all(post.is_active and post.created_at is not None for post in posts.values())
+
+
+@pytest.mark.asyncio
+async def test_create_many_encodes_event_logs_in_input_order(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    author: User,
+    insert_path: str,
+) -> None:
+    items = [
+        EventLogCreate(
+            event_type=EventLogType.USER_LOGGED_IN if index % 2 else EventLogType.USER_LOGGED_OUT,
+            details={"index": index, "tags": ["bulk", str(index)], "nested": {"ok": True}},
+            created_by=author.id,
+        )
+        for index in range(ROWS)
+    ]
+
+    async with db_session_factory() as session, session.begin():
+        ids = await EventLogDAO(session).create_many(items)
+
+    async with db_session_factory() as session:
+        events = {event.id: event for event in (await session.scalars(select(EventLog))).all()}
+
+    assert len(ids) == len(set(ids)) == ROWS, insert_path
+    assert [events[key].details for key in ids] == [item.details for item in items]
+    assert [events[key].event_type for key in ids] == [item.event_type for item in items]
+    assert all(event.is_active for event in events.values())
+
+
+@pytest.mark.asyncio
+async def test_create_many_without_items(db_session_factory: async_sessionmaker[AsyncSession]) -> None:
+    async with db_session_factory() as session:
+        assert await PostDAO(session).create_many([]) == []
+
+
+@pytest_asyncio.fixture
+async def post(db_session_factory: async_sessionmaker[AsyncSession], author: User) -> Post:
+    async with db_session_factory() as session, session.begin():
+        post = Post(title="Title", content="...", published=False, author_id=author.id)
+        session.add(post)
+    return post
+
+
+@pytest.mark.asyncio
+async def test_update_refreshes_loaded_instance(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    author: User,
+    post: Post,
+) -> None:
+    async with db_session_factory() as session, session.begin():
+        loaded = await session.get(Post, post.id)
+        assert loaded is not None
+
+        await PostDAO(session).update(
+            key=post.id,
+            updates=DAOPostUpdateDTO(title="New title", content="New", published=True, updated_by=author.id),
+        )
+
+        # The instance already in the session is refreshed, not left stale
+        assert (loaded.title, loaded.content, loaded.published) == ("New title", "New", True)
+        assert loaded.updated_by == author.id
+        assert loaded.updated_at > post.updated_at
+
+    async with db_session_factory() as session:
+        stored = await session.get(Post, post.id)
+    assert stored is not None
+    assert stored.title == "New title"
+
+
+@pytest.mark.asyncio
+async def test_update_unknown_row(db_session_factory: async_sessionmaker[AsyncSession], author: User) -> None:
+    async with db_session_factory() as session:
+        with pytest.raises(ValueError, match="Model not found"):
+            await PostDAO(session).update(
+                key=-1,
+                updates=DAOPublishedUpdateDTO(published=True, updated_by=author.id),
+            )
+
+
+@pytest.mark.asyncio
+async def test_archive_and_restore(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    author: User,
+    post: Post,
+) -> None:
+    async with db_session_factory() as session, session.begin():
+        loaded = await session.get(Post, post.id)
+        assert loaded is not None
+        dao = PostDAO(session)
+
+        await dao.archive(post.id, updated_by=author.id)
+        assert loaded.is_active is False
+        assert await dao.get_by_id(post.id) is None
+
+        await dao.restore(post.id, updated_by=author.id)
+        assert loaded.is_active is True
+        assert loaded.updated_by == author.id
+
+    async with db_session_factory() as session:
+        assert await PostDAO(session).get_by_id(post.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_archive_and_restore_reject_current_state(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    author: User,
+    post: Post,
+) -> None:
+    async with db_session_factory() as session, session.begin():
+        dao = PostDAO(session)
+
+        with pytest.raises(ValueError, match="Model is already restored"):
+            await dao.restore(post.id, updated_by=author.id)
+
+        await dao.archive(post.id, updated_by=author.id)
+        with pytest.raises(ValueError, match="Model is already archived"):
+            await dao.archive(post.id, updated_by=author.id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("operation", ["archive", "restore"])
+async def test_archive_and_restore_unknown_row(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    author: User,
+    operation: str,
+) -> None:
+    async with db_session_factory() as session:
+        with pytest.raises(ValueError, match="Model not found"):
+            await getattr(PostDAO(session), operation)(-1, updated_by=author.id)
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+from contextlib import AbstractContextManager
+from typing import Callable
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.instrumentation import QueryStats, normalize_sql, track_queries
+from app.settings import settings
+
+
+def test_normalize_sql_replaces_literals_and_parameters() -> None:
+    statement = """
+        SELECT users.id FROM users
+        WHERE users.email = 'a@b.c' AND users.id IN ($1, $2, $3) AND users.age > 18 AND x::text = :name
+    """
+
+    assert normalize_sql(statement) == (
+        "SELECT users.id FROM users WHERE users.email = ? AND users.id IN (?, ...) AND users.age > ? AND x::text = ?"
+    )
+
+
+@pytest.mark.asyncio
+async def test_track_queries_nests_and_follows_child_tasks(db_engine: AsyncEngine) -> None:
+    async def select_one() -> None:
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    with track_queries(record=True) as outer:
+        await select_one()
+        with track_queries() as inner:
+            await asyncio.gather(select_one(), select_one())
+
+    await select_one()
+
+    assert outer.count == 3
+    assert outer.statements == ["SELECT 1"] * 3
+    assert inner.count == 2
+    assert inner.statements is None
+    assert 0 < inner.duration <= outer.duration
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_logged_with_their_call_site(
+    db_engine: AsyncEngine,
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    monkeypatch.setattr(settings, "db_slow_query_threshold", 0.05)
+
+    async with db_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        await conn.execute(text("SELECT pg_sleep(0.1), 'secret'"))
+
+    slow = [record for record in caplog.records if record.levelno == logging.WARNING]
+    assert len(slow) == 1
+    assert slow[0].statement == "SELECT pg_sleep(?), ?"  # type: ignore[attr-defined]
+    assert slow[0].call_site.startswith(  # type: ignore[attr-defined]
+        "app/tests/db/test_instrumentation.py:",
+    )
+    assert "test_slow_queries_are_logged_with_their_call_site" in slow[0].call_site  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_query_budget_fails_when_exceeded(
+    db_engine: AsyncEngine,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    with pytest.raises(pytest.fail.Exception, match="2 queries, budget is 1"), query_budget(1):
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
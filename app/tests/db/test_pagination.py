@@ -0,0 +1,114 @@
+from datetime import date, datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.dao.post_dao import PostDAO
+from app.db.models.post_model import Post
+from app.db.models.user_model import User
+from app.db.pagination import SortSpec, decode_cursor, encode_cursor
+
+# Few distinct values, so that pages split runs of equal sort keys
+MIXED_SORT: SortSpec = [("published", "asc"), ("title", "desc")]
+
+
+def test_cursor_round_trip() -> None:
+    sort: SortSpec = [("created_at", "desc"), ("published", "asc"), ("id", "desc")]
+    values = [datetime(2024, 1, 2, 9, 30), True, 42]
+
+    token = encode_cursor(sort=sort, values=values)
+
+    assert decode_cursor(token, sort=sort) == values
+
+
+def test_cursor_keeps_dates() -> None:
+    sort: SortSpec = [("day", "asc"), ("id", "asc")]
+
+    token = encode_cursor(sort=sort, values=[date(2024, 5, 1), 1])
+
+    assert decode_cursor(token, sort=sort) == [date(2024, 5, 1), 1]
+
+
+def test_cursor_rejects_tampered_payload() -> None:
+    sort: SortSpec = [("id", "asc")]
+    token = encode_cursor(sort=sort, values=[10])
+    forged = encode_cursor(sort=sort, values=[99999]).split(".")[0]
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(f"{forged}.{token.split('.')[1]}", sort=sort)
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "a.b.c", "é.é"])
+def test_cursor_rejects_malformed_token(token: str) -> None:
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(token, sort=[("id", "asc")])
+
+
+def test_cursor_rejects_other_sort() -> None:
+    token = encode_cursor(sort=[("id", "asc")], values=[10])
+
+    with pytest.raises(ValueError, match="does not match"):
+        decode_cursor(token, sort=[("id", "desc")])
+
+
+@pytest_asyncio.fixture
+async def posts(db_session_factory: async_sessionmaker[AsyncSession]) -> list[Post]:
+    async with db_session_factory() as session, session.begin():
+        author = User(email="pages@example.com", hashed_password="-", first_name="Page", last_name="Er", permissions=[])
+        session.add(author)
+        await session.flush()
+        posts = [
+            Post(
+                title=f"Title {index % 3}",
+                content="...",
+                published=index % 2 == 0,
+                author_id=author.id,
+                is_active=index % 7 != 0,
+            )
+            for index in range(25)
+        ]
+        session.add_all(posts)
+    return posts
+
+
+@pytest.mark.asyncio
+async def test_get_page_walks_duplicate_sort_keys_in_mixed_directions(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    posts: list[Post],
+) -> None:
+    # published asc, then title desc, then id desc (the tie-breaker follows the last direction)
+    expected = sorted((post for post in posts if post.is_active), key=lambda post: -post.id)
+    expected.sort(key=lambda post: post.title, reverse=True)
+    expected.sort(key=lambda post: post.published)
+
+    seen: list[int] = []
+    cursor = None
+    async with db_session_factory() as session:
+        while True:
+            page = await PostDAO(session).get_page(sort=MIXED_SORT, limit=4, cursor=cursor)
+            assert len(page.items) <= 4
+            seen += [post.id for post in page.items]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+    assert seen == [post.id for post in expected]
+
+
+@pytest.mark.asyncio
+async def test_get_page_rejects_foreign_cursors(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    posts: list[Post],
+) -> None:
+    async with db_session_factory() as session:
+        dao = PostDAO(session)
+        cursor = (await dao.get_page(sort=MIXED_SORT, limit=4)).next_cursor
+        assert cursor is not None
+        signature = cursor.split(".")[1]
+        forged = encode_cursor(sort=[*MIXED_SORT, ("id", "desc")], values=[True, "Title 0", 1]).split(".")[0]
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await dao.get_page(sort=MIXED_SORT, limit=4, cursor=f"{forged}.{signature}")
+        with pytest.raises(ValueError, match="does not match"):
+            await dao.get_page(sort=[("published", "asc"), ("title", "asc")], limit=4, cursor=cursor)
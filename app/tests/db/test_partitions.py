@@ -0,0 +1,121 @@
+import asyncio
+import gzip
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockFixture
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.partitions import PartitionMaintenance, add_months, create_partitions, partition_name, partition_tables
+
+
+@pytest.mark.parametrize(
+    "month, months, expected",
+    [
+        (date(2025, 3, 17), 0, date(2025, 3, 1)),
+        (date(2025, 11, 1), 3, date(2026, 2, 1)),
+        (date(2025, 1, 31), -1, date(2024, 12, 1)),
+        (date(2025, 3, 1), -27, date(2022, 12, 1)),
+    ],
+)
+def test_add_months(month: date, months: int, expected: date) -> None:
+    assert add_months(month, months) == expected
+
+
+def test_partition_name() -> None:
+    assert partition_name("event_log", date(2025, 3, 1)) == "event_log_y2025m03"
+
+
+def _maintenance(db_engine: AsyncEngine, archive_dir: Path) -> PartitionMaintenance:
+    return PartitionMaintenance(
+        db_engine,
+        "event_log",
+        months_ahead=2,
+        retention_months=2,
+        archive_dir=archive_dir,
+        interval=3600,
+    )
+
+
+async def _insert_event(db_engine: AsyncEngine, created_at: date) -> None:
+    async with db_engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO event_log (event_type, details, is_active, created_at) "
+                "VALUES ('user_logged_in', '{\"ip\": \"10.0.0.1\"}', true, :created_at)",
+            ),
+            {"created_at": created_at},
+        )
+
+
+@pytest.mark.asyncio
+async def test_maintenance_creates_upcoming_partitions(db_engine: AsyncEngine, tmp_path: Path) -> None:
+    maintenance = _maintenance(db_engine, tmp_path)
+
+    assert await maintenance.run() == []
+
+    month = add_months(date.today(), 0)
+    async with db_engine.connect() as conn:
+        tables = await partition_tables(conn, "event_log")
+    assert tables[partition_name("event_log", add_months(month, 2))] == (add_months(month, 2), True)
+
+
+@pytest.mark.asyncio
+async def test_maintenance_archives_expired_partitions(db_engine: AsyncEngine, tmp_path: Path) -> None:
+    old, older = add_months(date.today(), -4), add_months(date.today(), -5)
+    async with db_engine.begin() as conn:
+        await create_partitions(conn, "event_log", start=older, end=old)
+        # Left detached by an interrupted run
+        await conn.execute(text(f'ALTER TABLE event_log DETACH PARTITION "{partition_name("event_log", older)}"'))
+    await _insert_event(db_engine, old)
+    await _insert_event(db_engine, add_months(date.today(), 0))
+
+    archives = await _maintenance(db_engine, tmp_path).run()
+
+    assert archives == [
+        tmp_path / f"{partition_name('event_log', older)}.ndjson.gz",
+        tmp_path / f"{partition_name('event_log', old)}.ndjson.gz",
+    ]
+    with gzip.open(archives[1], "rt") as file:
+        rows = [json.loads(line) for line in file]
+    assert [(row["event_type"], row["details"]) for row in rows] == [("user_logged_in", {"ip": "10.0.0.1"})]
+
+    async with db_engine.connect() as conn:
+        tables = await partition_tables(conn, "event_log")
+        remaining = (await conn.execute(text("SELECT count(*) FROM event_log"))).scalar_one()
+    assert partition_name("event_log", old) not in tables
+    assert partition_name("event_log", older) not in tables
+    assert remaining == 1
+
+
+@pytest.mark.asyncio
+async def test_maintenance_skips_while_another_worker_runs_it(db_engine: AsyncEngine, tmp_path: Path) -> None:
+    maintenance = _maintenance(db_engine, tmp_path)
+    async with db_engine.begin() as conn:
+        assert await maintenance._lock(conn)  # noqa: SLF001
+
+        assert await maintenance.run() == []
+
+
+@pytest.mark.asyncio
+async def test_maintenance_runs_on_start_then_periodically(
+    db_engine: AsyncEngine,
+    tmp_path: Path,
+    mocker: MockFixture,
+) -> None:
+    maintenance = _maintenance(db_engine, tmp_path)
+    maintenance.interval = 0.01
+    run = mocker.spy(maintenance, "run")
+
+    await maintenance.start()
+    await maintenance.start()
+    assert run.call_count == 1
+
+    async with asyncio.timeout(5):
+        while run.call_count < 3:
+            await asyncio.sleep(0.01)
+    await maintenance.stop()
+    await maintenance.stop()
@@ -0,0 +1,82 @@
+import pytest
+from sqlalchemy import func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.db.models.user_model import User
+from app.db.readonly import ReadOnlySessionError, readonly_session_factory
+
+
+@pytest.fixture
+def readonly_factory(
+    db_engine: AsyncEngine,
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> async_sessionmaker[AsyncSession]:
+    return readonly_session_factory(db_engine)
+
+
+def _user() -> User:
+    return User(
+        email="reader@example.com",
+        hashed_password="-",
+        first_name="Read",
+        last_name="Only",
+        permissions=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_readonly_session_reads_committed_data(
+    readonly_factory: async_sessionmaker[AsyncSession],
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with db_session_factory() as session, session.begin():
+        session.add(_user())
+
+    async with readonly_factory() as session:
+        count = await session.scalar(select(func.count()).select_from(User))
+
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_readonly_session_autocommits(readonly_factory: async_sessionmaker[AsyncSession]) -> None:
+    async with readonly_factory() as session:
+        first = await session.scalar(text("SELECT now()"))
+        await session.execute(text("SELECT pg_sleep(0.01)"))
+        second = await session.scalar(text("SELECT now()"))
+
+    assert first != second
+
+
+@pytest.mark.asyncio
+async def test_readonly_session_refuses_flush(readonly_factory: async_sessionmaker[AsyncSession]) -> None:
+    async with readonly_factory() as session:
+        session.add(_user())
+
+        with pytest.raises(ReadOnlySessionError, match="flush"):
+            await session.flush()
+
+
+@pytest.mark.asyncio
+async def test_readonly_session_refuses_write_statements(
+    readonly_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with readonly_factory() as session:
+        with pytest.raises(ReadOnlySessionError, match="write statement"):
+            await session.execute(update(User).values(first_name="Nope"))
+
+
+@pytest.mark.asyncio
+async def test_readonly_session_restores_pool_isolation(
+    readonly_factory: async_sessionmaker[AsyncSession],
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with readonly_factory() as session:
+        await session.execute(text("SELECT 1"))
+
+    async with db_session_factory() as session:
+        first = await session.scalar(text("SELECT now()"))
+        await session.execute(text("SELECT pg_sleep(0.01)"))
+        second = await session.scalar(text("SELECT now()"))
+
+    assert first == second
@@ -0,0 +1,68 @@
+from typing import Any
+
+import pytest
+from fastapi import HTTPException, Request
+from pydantic import BaseModel
+from starlette.datastructures import QueryParams
+
+from app.dependencies.validate_query_params import build_nested_structure, validate_query_params
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("page=2", {"page": "2"}),
+        ("filter[name]=x&filter[age][gte]=18", {"filter": {"name": "x", "age": {"gte": "18"}}}),
+        ("filter.name=x", {"filter": {"name": "x"}}),
+        ("sort[0]=title&sort[1]=id", {"sort": ["title", "id"]}),
+        ("tags[1][id]=3&tags[0][id]=2", {"tags": [{"id": "2"}, {"id": "3"}]}),
+        ("ids[2]=9", {"ids": [None, None, "9"]}),
+        ("0=x", {"0": "x"}),
+        ("[]=x&page=1", {"page": "1"}),
+    ],
+)
+def test_build_nested_structure(query: str, expected: dict[str, Any]) -> None:
+    assert build_nested_structure(QueryParams(query)) == expected
+
+
+@pytest.mark.parametrize(
+    ("query", "error"),
+    [
+        ("a=1&a[b]=2", "'a\\[b\\]' conflicts"),
+        ("a[b]=2&a=1", "'a' conflicts"),
+        ("a[0]=1&a[b]=2", "'a\\[b\\]' conflicts"),
+        ("x[101]=1", "List index 101 is above the limit of 100"),
+        ("a[b][c][d]=1", "nested deeper than 3"),
+        ("a=1&b=2&c=3&d=4", "Too many query parameters"),
+    ],
+)
+def test_build_nested_structure_rejects(query: str, error: str) -> None:
+    with pytest.raises(ValueError, match=error):
+        build_nested_structure(QueryParams(query), max_depth=3, max_keys=3)
+
+
+class Filters(BaseModel):
+    page: int
+    sort: list[str] = []
+
+
+def _request(query: str) -> Request:
+    return Request({"type": "http", "query_string": query.encode(), "headers": []})
+
+
+@pytest.mark.asyncio
+async def test_validate_query_params_builds_model() -> None:
+    dependency = validate_query_params(Filters)
+
+    assert await dependency(_request("page=2&sort[0]=title")) == Filters(page=2, sort=["title"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("query", ["page=first", "page=1&sort[1000]=id"])
+async def test_validate_query_params_rejects_invalid_query(query: str) -> None:
+    dependency = validate_query_params(Filters)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await dependency(_request(query))
+
+    assert exc_info.value.status_code == 422
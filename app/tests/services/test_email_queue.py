@@ -0,0 +1,251 @@
+import asyncio
+import smtplib
+import socket
+import threading
+from typing import Any, Generator
+
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import SMTP, Envelope, Session
+from pytest_mock import MockFixture
+
+from app.services.email.dto import EmailMessageData
+from app.services.email.queue import EmailQueue
+from app.services.email.service import EmailService
+from app.settings import settings
+from app.tests.utils import wait_for
+
+
+class RecordingHandler:
+
+    def __init__(self) -> None:
+        self.messages: list[Envelope] = []
+        self.sessions: set[int] = set()
+
+    async def handle_DATA(  # noqa: N802
+        self,
+        server: SMTP,
+        session: Session,
+        envelope: Envelope,
+    ) -> str:
+        self.messages.append(envelope)
+        self.sessions.add(id(session))
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_handler(monkeypatch: pytest.MonkeyPatch) -> Generator[RecordingHandler, None, None]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+
+    monkeypatch.setattr(EmailService, "host", "127.0.0.1")
+    monkeypatch.setattr(EmailService, "port", port)
+    monkeypatch.setattr(EmailService, "username", None)
+    monkeypatch.setattr(EmailService, "password", None)
+    monkeypatch.setattr(EmailService, "use_starttls", False)
+    monkeypatch.setattr(settings, "dev_email", None)
+
+    yield handler
+    controller.stop()
+
+
+def _queue(**overrides: Any) -> EmailQueue:
+    options: dict[str, Any] = {
+        "workers": 1,
+        "batch_size": 10,
+        "max_size": 100,
+        "max_retries": 2,
+        "retry_delay": 0,
+        "idle_timeout": 5,
+        "shutdown_timeout": 5,
+    }
+    options.update(overrides)
+    return EmailQueue(**options)
+
+
+def _message(subject: str = "Hello") -> EmailMessageData:
+    return EmailMessageData(receivers=["to@example.com"], subject=subject, html="<p>Hi</p>")
+
+
+@pytest.mark.asyncio
+async def test_queue_sends_batch_over_one_connection(smtp_handler: RecordingHandler) -> None:
+    queue = _queue()
+    await queue.start()
+    await queue.start()
+
+    for index in range(3):
+        assert await queue.enqueue(_message(f"Message {index}"))
+    await queue.stop()
+
+    assert len(smtp_handler.messages) == 3
+    assert len(smtp_handler.sessions) == 1
+    assert not queue.running
+
+
+@pytest.mark.asyncio
+async def test_queue_reconnects_after_idle_timeout(smtp_handler: RecordingHandler) -> None:
+    queue = _queue(idle_timeout=0.05)
+    await queue.start()
+
+    await queue.enqueue(_message("First"))
+    await wait_for(lambda: len(smtp_handler.messages) == 1)
+    await asyncio.sleep(0.2)
+    await queue.enqueue(_message("Second"))
+    await queue.stop()
+
+    assert len(smtp_handler.messages) == 2
+    assert len(smtp_handler.sessions) == 2
+
+
+@pytest.mark.asyncio
+async def test_queue_retries_failed_messages(
+    smtp_handler: RecordingHandler,
+    mocker: MockFixture,
+) -> None:
+    send = EmailService.send
+    calls = 0
+
+    def flaky_send(self: EmailService, *args: Any, **kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        return send(self, *args, **kwargs)
+
+    mocker.patch.object(EmailService, "send", flaky_send)
+    queue = _queue()
+    await queue.start()
+
+    await queue.enqueue(_message())
+    await wait_for(lambda: len(smtp_handler.messages) == 1)
+    await queue.stop()
+
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_queue_gives_up_after_max_retries(mocker: MockFixture) -> None:
+    service = mocker.MagicMock()
+    service.create_sender.return_value.is_alive = True
+    service.send.side_effect = OSError("Connection refused")
+    logger = mocker.patch("app.services.email.queue.Logger")
+    queue = _queue(service_factory=lambda: service)
+    await queue.start()
+
+    await queue.enqueue(_message())
+    await wait_for(lambda: logger.error.called)
+    await queue.stop()
+
+    assert service.send.call_count == 3
+    assert "after 3 attempts" in logger.error.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_queue_drops_invalid_messages_without_retry(
+    smtp_handler: RecordingHandler,
+    mocker: MockFixture,
+) -> None:
+    logger = mocker.patch("app.services.email.queue.Logger")
+    queue = _queue()
+    await queue.start()
+
+    await queue.enqueue(EmailMessageData(receivers=["to@example.com"], subject="Broken", tpl="x"))
+    await queue.enqueue(_message())
+    await queue.stop()
+
+    assert len(smtp_handler.messages) == 1
+    assert "Dropping email 'Broken'" in logger.error.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_queue_rejects_messages_when_full(mocker: MockFixture) -> None:
+    logger = mocker.patch("app.services.email.queue.Logger")
+    queue = _queue(workers=0, max_size=1, shutdown_timeout=0)
+    await queue.start()
+
+    assert await queue.enqueue(_message())
+    assert not await queue.enqueue(_message())
+    await queue.stop()
+
+    logger.error.assert_called_once()
+    assert "Dropping 1 queued email(s)" in logger.warning.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_stop_drops_pending_retries(mocker: MockFixture) -> None:
+    service = mocker.MagicMock()
+    service.send.side_effect = smtplib.SMTPException("Try again later")
+    logger = mocker.patch("app.services.email.queue.Logger")
+    queue = _queue(retry_delay=60, service_factory=lambda: service)
+    await queue.start()
+
+    await queue.enqueue(_message())
+    await wait_for(lambda: service.send.called)
+    await asyncio.sleep(0.05)
+    await queue.stop()
+    await queue.stop()
+
+    assert "waiting for a retry" in logger.warning.call_args.args[0]
+
+
+@pytest.mark.asyncio
+async def test_enqueue_sends_inline_when_not_started(mocker: MockFixture) -> None:
+    service = mocker.MagicMock()
+    queue = _queue(service_factory=lambda: service)
+    message = _message()
+
+    assert await queue.enqueue(message)
+
+    service.send.assert_called_once_with(message)
+
+
+@pytest.mark.asyncio
+async def test_stop_forgets_a_dropped_connection(mocker: MockFixture) -> None:
+    service = mocker.MagicMock()
+    email_sender = service.create_sender.return_value
+    email_sender.is_alive = True
+    email_sender.close.side_effect = smtplib.SMTPServerDisconnected()
+    queue = _queue(service_factory=lambda: service)
+    await queue.start()
+    await asyncio.sleep(0)
+
+    await queue.stop()
+
+    assert email_sender.connection is None
+
+
+@pytest.mark.asyncio
+async def test_stop_closes_an_abandoned_connection_after_its_send(mocker: MockFixture) -> None:
+    loop_thread = threading.current_thread()
+    release = threading.Event()
+    events: list[str] = []
+
+    def send(*args: Any, **kwargs: Any) -> None:
+        release.wait(5)
+        events.append("send")
+
+    def close() -> None:
+        events.append("close on the loop" if threading.current_thread() is loop_thread else "close")
+
+    service = mocker.MagicMock()
+    service.send.side_effect = send
+    email_sender = service.create_sender.return_value
+    email_sender.is_alive = True
+    email_sender.close.side_effect = close
+    queue = _queue(service_factory=lambda: service, shutdown_timeout=0.05)
+    await queue.start()
+    await queue.enqueue(_message())
+    await wait_for(lambda: service.send.called)
+
+    await queue.stop()
+
+    # The connection is left to the thread still sending over it
+    assert events == []
+    release.set()
+    await wait_for(lambda: len(events) == 2)
+    assert events == ["send", "close"]
@@ -0,0 +1,93 @@
+import os
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockFixture
+
+from app.services.email.service import EmailService
+from app.services.email.template import EmailTemplate, TemplateCache
+
+
+@pytest.fixture
+def template_path(tmp_path: Path) -> Path:
+    path = tmp_path / "welcome.html"
+    path.write_text("<style>p {{ color: red; }}</style><p>Hello {name}, see {static_host}</p>")
+    return path
+
+
+def test_compile_collects_placeholders(template_path: Path) -> None:
+    template = EmailTemplate.compile(template_path)
+
+    assert template.name == "welcome"
+    assert template.placeholders == {"name", "static_host"}
+    assert template.render({"name": "Alice", "static_host": "https://x", "extra": 1}) == (
+        "<style>p { color: red; }</style><p>Hello Alice, see https://x</p>"
+    )
+
+
+@pytest.mark.parametrize(
+    ("source", "error"),
+    [
+        ("Hello {name", "Invalid email template 'bad.html'"),
+        ("Hello {0}", r"Invalid placeholder '\{0\}'"),
+        ("Hello {}", r"Invalid placeholder '\{\}'"),
+        ("Hello {user.name}", r"Invalid placeholder '\{user.name\}'"),
+        ("Hello {name!r}", r"Invalid placeholder '\{name\}'"),
+        ("Hello {name:{width}}", r"Invalid placeholder '\{name\}'"),
+    ],
+)
+def test_compile_rejects_invalid_templates(tmp_path: Path, source: str, error: str) -> None:
+    path = tmp_path / "bad.html"
+    path.write_text(source)
+
+    with pytest.raises(ValueError, match=error):
+        EmailTemplate.compile(path)
+
+
+def test_render_applies_format_specs(tmp_path: Path) -> None:
+    path = tmp_path / "invoice.html"
+    path.write_text("Total: {amount:.2f} EUR")
+
+    assert EmailTemplate.compile(path).render({"amount": 12.5}) == "Total: 12.50 EUR"
+
+
+def test_render_reports_missing_data(template_path: Path) -> None:
+    template = EmailTemplate.compile(template_path)
+
+    with pytest.raises(ValueError, match="'welcome': name, static_host"):
+        template.render({})
+
+
+def test_cache_compiles_once_until_file_changes(template_path: Path, mocker: MockFixture) -> None:
+    cache = TemplateCache()
+    compile_spy = mocker.spy(EmailTemplate, "compile")
+
+    first = cache.get(template_path)
+    assert cache.get(template_path) is first
+    assert compile_spy.call_count == 1
+
+    template_path.write_text("Bye {name}")
+    stat = template_path.stat()
+    os.utime(template_path, ns=(stat.st_atime_ns, first.mtime_ns + 1_000_000))
+
+    assert cache.get(template_path).placeholders == {"name"}
+    assert compile_spy.call_count == 2
+
+    cache.clear()
+    cache.get(template_path)
+    assert compile_spy.call_count == 3
+
+
+def test_preload_compiles_every_template(tmp_path: Path, template_path: Path) -> None:
+    (tmp_path / "reset.html").write_text("Reset {url}")
+    (tmp_path / "notes.txt").write_text("{not a template")
+
+    templates = TemplateCache().preload(tmp_path)
+
+    assert [template.name for template in templates] == ["reset", "welcome"]
+
+
+def test_preload_ships_valid_templates() -> None:
+    templates = TemplateCache().preload(EmailService.template_dir())
+
+    assert "reset_password" in [template.name for template in templates]
@@ -0,0 +1,215 @@
+from typing import Any, AsyncIterator, Callable, Self, cast
+from unittest.mock import MagicMock
+
+import pytest
+import pytest_asyncio
+from argon2 import PasswordHasher
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.consts import EventLogType
+from app.db.dao.event_log_dao import EventLogCreate, EventLogDAO
+from app.db.models.event_log_model import EventLog
+from app.db.models.user_model import User
+from app.services.event_log.buffer import EventLogBuffer
+from app.tests.utils import wait_for
+
+
+class FakeDAO:
+    """Records the batches instead of writing them, failing while `failing` is set."""
+
+    batches: list[list[EventLogCreate]]
+    added: list[EventLogCreate]
+    failing = False
+
+    def __init__(self, session: Any) -> None:
+        self.session = session
+
+    async def create_many(self, items: list[EventLogCreate]) -> list[int]:
+        if FakeDAO.failing:
+            raise OSError("connection lost")
+        FakeDAO.batches.append(list(items))
+        return list(range(len(items)))
+
+    def add(self, data: EventLogCreate) -> None:
+        FakeDAO.added.append(data)
+
+
+class FakeSession:
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        return
+
+    def begin(self) -> Self:
+        return self
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_dao() -> None:
+    FakeDAO.batches = []
+    FakeDAO.added = []
+    FakeDAO.failing = False
+
+
+def _buffer(*, batch_size: int = 3, flush_interval: float = 60) -> EventLogBuffer:
+    return EventLogBuffer(
+        batch_size=batch_size,
+        flush_interval=flush_interval,
+        max_size=5,
+        dao_factory=cast(Callable[[AsyncSession], EventLogDAO], FakeDAO),
+    )
+
+
+def _event(created_by: int = 1) -> EventLogCreate:
+    return EventLogCreate(event_type=EventLogType.USER_LOGGED_OUT, details={"n": created_by}, created_by=created_by)
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_full_batches_at_once() -> None:
+    buffer = _buffer()
+    await buffer.start(MagicMock(return_value=FakeSession()))
+    await buffer.start(MagicMock())
+    assert buffer.running
+
+    for created_by in range(3):
+        assert buffer.record(_event(created_by))
+
+    await wait_for(lambda: len(FakeDAO.batches) == 1)
+    assert [event.created_by for event in FakeDAO.batches[0]] == [0, 1, 2]
+    assert len(buffer) == 0
+
+    await buffer.stop()
+    await buffer.stop()
+    assert not buffer.running
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_every_interval() -> None:
+    buffer = _buffer(flush_interval=0.01)
+    await buffer.start(MagicMock(return_value=FakeSession()))
+
+    buffer.record(_event())
+
+    await wait_for(lambda: len(FakeDAO.batches) == 1)
+    await buffer.stop()
+
+
+@pytest.mark.asyncio
+async def test_buffer_keeps_events_until_started_and_flushes_on_stop() -> None:
+    buffer = _buffer()
+    for created_by in range(4):
+        buffer.record(_event(created_by))
+    assert await buffer.flush() == 0
+
+    await buffer.start(MagicMock(return_value=FakeSession()))
+    await wait_for(lambda: len(FakeDAO.batches) == 1)
+    buffer.record(_event(4))
+    await buffer.stop()
+
+    assert [len(batch) for batch in FakeDAO.batches] == [4, 1]
+
+
+@pytest.mark.asyncio
+async def test_buffer_drops_events_beyond_max_size() -> None:
+    buffer = _buffer(batch_size=10)
+
+    accepted = [buffer.record(_event(created_by)) for created_by in range(6)]
+
+    assert accepted == [True] * 5 + [False]
+    assert len(buffer) == 5
+
+
+@pytest.mark.asyncio
+async def test_buffer_puts_events_back_when_a_write_fails() -> None:
+    buffer = _buffer(batch_size=10)
+    await buffer.start(MagicMock(return_value=FakeSession()))
+    for created_by in range(3):
+        buffer.record(_event(created_by))
+
+    FakeDAO.failing = True
+    assert await buffer.flush() == 0
+    assert len(buffer) == 3
+
+    buffer.record(_event(3))
+    buffer.record(_event(4))
+    assert await buffer.flush() == 0
+    assert len(buffer) == 5
+
+    FakeDAO.failing = False
+    await buffer.stop()
+    assert [event.created_by for event in FakeDAO.batches[0]] == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_buffer_drops_failed_events_that_no_longer_fit(monkeypatch: pytest.MonkeyPatch) -> None:
+    buffer = _buffer(batch_size=10)
+    await buffer.start(MagicMock(return_value=FakeSession()))
+    for created_by in range(3):
+        buffer.record(_event(created_by))
+
+    async def record_then_fail(self: FakeDAO, items: list[EventLogCreate]) -> list[int]:
+        for created_by in range(3, 6):
+            buffer.record(_event(created_by))
+        raise OSError("connection lost")
+
+    monkeypatch.setattr(FakeDAO, "create_many", record_then_fail)
+    assert await buffer.flush() == 0
+
+    assert len(buffer) == 5
+    monkeypatch.undo()
+    await buffer.stop()
+    assert [event.created_by for event in FakeDAO.batches[0]] == [0, 1, 3, 4, 5]
+
+
+def test_buffer_records_durable_events_in_the_given_session() -> None:
+    buffer = _buffer()
+
+    assert buffer.record(_event(), session=MagicMock())
+
+    assert FakeDAO.added == [_event()]
+    assert len(buffer) == 0
+
+
+@pytest_asyncio.fixture
+async def user(db_session_factory: async_sessionmaker[AsyncSession]) -> AsyncIterator[User]:
+    async with db_session_factory() as session, session.begin():
+        user = User(
+            email="events@example.com",
+            hashed_password=PasswordHasher().hash("Secret1@Password"),
+            first_name="Jane",
+            last_name="Doe",
+            permissions=[],
+            is_active=True,
+            is_superuser=False,
+            is_verified=True,
+        )
+        session.add(user)
+    yield user
+
+
+@pytest.mark.asyncio
+async def test_buffer_writes_batches_to_the_event_log(
+    db_session_factory: async_sessionmaker[AsyncSession],
+    user: User,
+) -> None:
+    buffer = EventLogBuffer(batch_size=100, flush_interval=60, max_size=1000)
+    await buffer.start(db_session_factory)
+    for _ in range(10):
+        buffer.record(_event(user.id))
+
+    async with db_session_factory() as session, session.begin():
+        buffer.record(
+            EventLogCreate(event_type=EventLogType.USER_LOGGED_IN, details={}, created_by=user.id),
+            session=session,
+        )
+        await session.rollback()
+
+    await buffer.stop()
+
+    async with db_session_factory() as session:
+        events = (await session.execute(select(EventLog))).scalars().all()
+    assert len(events) == 10
+    assert {event.event_type for event in events} == {EventLogType.USER_LOGGED_OUT}
@@ -0,0 +1,110 @@
+import json
+import logging
+import sys
+import threading
+from typing import Generator
+
+import pytest
+
+from app.services.logger.formatter import JSONFormatter
+from app.services.logger.queue import LogQueue
+
+
+class RecordingHandler(logging.Handler):
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[str] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+@pytest.fixture
+def parent_logger() -> Generator[logging.Logger, None, None]:
+    parent = logging.getLogger("test_log_queue")
+    parent.setLevel(logging.INFO)
+    parent.propagate = False
+    yield parent
+    parent.handlers.clear()
+
+
+def test_log_queue_writes_from_listener_thread(parent_logger: logging.Logger) -> None:
+    handler = RecordingHandler()
+    parent_logger.addHandler(handler)
+    logger = logging.getLogger("test_log_queue.child")
+    log_queue = LogQueue()
+
+    log_queue.start(logger)
+    log_queue.start(logger)
+    assert log_queue.running
+    logger.info("Hello %s", "world")
+    log_queue.stop()
+    log_queue.stop()
+
+    assert [record.getMessage() for record in handler.records] == ["Hello world"]
+    assert threading.current_thread().name not in handler.threads
+    assert logger.handlers == []
+    assert logger.propagate
+
+
+def test_log_queue_keeps_exception_for_the_formatter(parent_logger: logging.Logger) -> None:
+    handler = RecordingHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    parent_logger.addHandler(handler)
+    log_queue = LogQueue()
+
+    log_queue.start(parent_logger)
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        parent_logger.error("Failed", exc_info=True)
+    log_queue.stop()
+
+    assert "RuntimeError: boom" in handler.format(handler.records[0])
+
+
+def test_log_queue_falls_back_to_last_resort(
+    parent_logger: logging.Logger,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    log_queue = LogQueue()
+
+    log_queue.start(parent_logger)
+    parent_logger.warning("Nobody is listening")
+    log_queue.stop()
+
+    assert capsys.readouterr().err == "Nobody is listening\n"
+
+
+def test_log_queue_json_output(
+    parent_logger: logging.Logger,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    log_queue = LogQueue()
+
+    log_queue.start(parent_logger, json_output=True)
+    parent_logger.warning("Quota at %d%%", 90, extra={"user_id": 7}, stack_info=True)
+    log_queue.stop()
+
+    line = json.loads(capsys.readouterr().err)
+    assert line["level"] == "WARNING"
+    assert line["logger"] == "test_log_queue"
+    assert line["message"] == "Quota at 90%"
+    assert line["user_id"] == 7
+    assert line["stack_info"].startswith("Stack (most recent call last)")
+
+
+def test_json_formatter_includes_exception() -> None:
+    try:
+        raise ValueError("bad value")
+    except ValueError:
+        record = logging.LogRecord("test", logging.ERROR, __file__, 1, "Failed", None, sys.exc_info())
+
+    line = json.loads(JSONFormatter().format(record))
+
+    assert line["message"] == "Failed"
+    assert "ValueError: bad value" in line["exc_info"]
+    assert "stack_info" not in line
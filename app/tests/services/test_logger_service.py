@@ -99,3 +99,30 @@ def test_logger_with_custom_params_calls_standard_logger(
             stacklevel=custom_stacklevel,
         )
 
+
+@pytest.mark.parametrize(
+    "log_method, expected_stack_info",
+    [
+        ("info", False),
+        ("warning", True),
+        ("error", True),
+    ],
+)
+def test_logger_captures_stack_from_warning_up(log_method: str, expected_stack_info: bool) -> None:
+    with patch("app.services.logger.service.logger.log") as mock_std_logger:
+        getattr(Logger, log_method)("Default params test")
+
+    kwargs = mock_std_logger.call_args.kwargs
+    assert kwargs["stack_info"] is expected_stack_info
+    assert kwargs["exc_info"] is False
+
+
+def test_logger_captures_handled_exception_from_warning_up() -> None:
+    with patch("app.services.logger.service.logger.log") as mock_std_logger:
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            Logger.info("Handled quietly")
+            Logger.error("Handled loudly")
+
+    assert [call.kwargs["exc_info"] for call in mock_std_logger.call_args_list] == [False, True]
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+from http import HTTPStatus
+
+import pytest
+from argon2 import PasswordHasher
+from pytest_mock import MockerFixture
+
+from app.errors import DomainError
+from app.services.password.errors import PasswordError
+from app.services.password.service import PasswordService, check_password
+
+
+def fast_hasher(time_cost: int = 1) -> PasswordHasher:
+    return PasswordHasher(time_cost=time_cost, memory_cost=8, parallelism=1)
+
+
+@pytest.fixture
+def password_service() -> PasswordService:
+    return PasswordService(hasher=fast_hasher(), max_workers=2, max_pending=2, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(password_service: PasswordService) -> None:
+    hashed = await password_service.hash("Valid1@Password")
+
+    assert hashed.startswith("$argon2id$")
+    assert await password_service.verify(hashed, "Valid1@Password")
+    assert not await password_service.verify(hashed, "Wrong1@Password")
+
+
+@pytest.mark.asyncio
+async def test_verify_rejects_invalid_hash(password_service: PasswordService) -> None:
+    assert not await password_service.verify("not-a-hash", "Valid1@Password")
+
+
+@pytest.mark.asyncio
+async def test_verify_and_update_rehashes_outdated_hash(password_service: PasswordService) -> None:
+    outdated = fast_hasher(time_cost=2).hash("Valid1@Password")
+
+    verified, new_hash = await password_service.verify_and_update(outdated, "Valid1@Password")
+
+    assert verified
+    assert new_hash is not None
+    assert not password_service.hasher.check_needs_rehash(new_hash)
+
+
+def test_check_password_keeps_current_hash() -> None:
+    hasher = fast_hasher()
+
+    assert check_password(hasher, hasher.hash("secret"), "secret") == (True, None)
+
+
+@pytest.mark.asyncio
+async def test_saturated_service_raises_busy_error(mocker: MockerFixture) -> None:
+    release = threading.Event()
+    hasher = mocker.MagicMock()
+    hasher.hash.side_effect = lambda _: str(release.wait(5))
+    service = PasswordService(hasher=hasher, max_workers=1, max_pending=0, timeout=0.01)
+
+    blocked = asyncio.create_task(service.hash("first"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(DomainError) as exc_info:
+        await service.hash("second")
+
+    release.set()
+    await blocked
+
+    assert exc_info.value.detail["code"] == PasswordError.HASHER_BUSY
+    assert exc_info.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
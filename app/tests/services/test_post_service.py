@@ -5,11 +5,12 @@ from unittest.mock import AsyncMock
 import pytest
 from pytest_mock import MockerFixture
 
-from app.db.dao.post_dao import DAOPostCreateDTO
+from app.db.dao.post_dao import DAOPostCreateDTO, DAOPostListFilters
 from app.db.models.user_model import User
+from app.db.pagination import Page
 from app.errors import DomainError
-from app.services.post.dto import PostCreateDTO
-from app.services.post.errors import CreatePostError
+from app.services.post.dto import PostCreateDTO, PostListFiltersDTO, PostSummaryDTO
+from app.services.post.errors import CreatePostError, ListPostsError, SearchPostsError
 from app.services.post.service import PostService
 
 
@@ -129,3 +130,91 @@ async def test_create_post_with_non_existent_author(
     err = exc_info.value
     assert err.detail["code"] == CreatePostError.AUTHOR_NOT_FOUND
     assert "Author not found." in err.detail["message"]
+
+
+@pytest.mark.asyncio
+async def test_list_posts_maps_rows_to_summaries(
+    post_service: PostService,
+    mocker: MockerFixture,
+) -> None:
+    created_at = datetime(2024, 1, 1, 9, 0, 0)
+    row = mocker.MagicMock(id=4, title="A title", published=True, author_id=2, created_at=created_at)
+    post_service.post_dao.get_list_page = cast(
+        AsyncMock,
+        mocker.AsyncMock(return_value=Page(items=[row], next_cursor="next")),
+    )
+
+    page = await post_service.list_posts(
+        filters=PostListFiltersDTO(author_id=2, published=True),
+        sort=[("created_at", "desc")],
+        limit=1,
+        cursor="current",
+    )
+
+    assert page == Page(
+        items=[PostSummaryDTO(id=4, title="A title", published=True, author_id=2, created_at=created_at)],
+        next_cursor="next",
+    )
+    post_service.post_dao.get_list_page.assert_awaited_once_with(
+        filters=DAOPostListFilters(author_id=2, published=True),
+        sort=[("created_at", "desc")],
+        limit=1,
+        cursor="current",
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_posts_with_invalid_cursor(
+    post_service: PostService,
+    mocker: MockerFixture,
+) -> None:
+    post_service.post_dao.get_list_page = cast(
+        AsyncMock,
+        mocker.AsyncMock(side_effect=ValueError("Invalid cursor")),
+    )
+
+    with pytest.raises(DomainError) as exc_info:
+        await post_service.list_posts(filters=PostListFiltersDTO(), sort=[], limit=10, cursor="bad")
+
+    err = exc_info.value
+    assert err.detail["code"] == ListPostsError.INVALID_PAGINATION
+    assert err.detail["message"] == "Invalid cursor"
+
+
+@pytest.mark.asyncio
+async def test_search_posts_maps_rows_to_summaries(
+    post_service: PostService,
+    mocker: MockerFixture,
+) -> None:
+    created_at = datetime(2024, 1, 1, 9, 0, 0)
+    row = mocker.MagicMock(id=4, title="A title", published=True, author_id=2, created_at=created_at, rank=0.5)
+    post_service.post_dao.search = cast(
+        AsyncMock,
+        mocker.AsyncMock(return_value=Page(items=[row], next_cursor=None)),
+    )
+
+    page = await post_service.search_posts(terms="title", limit=5)
+
+    assert page == Page(
+        items=[PostSummaryDTO(id=4, title="A title", published=True, author_id=2, created_at=created_at)],
+        next_cursor=None,
+    )
+    post_service.post_dao.search.assert_awaited_once_with("title", limit=5, cursor=None)
+
+
+@pytest.mark.asyncio
+async def test_search_posts_with_invalid_cursor(
+    post_service: PostService,
+    mocker: MockerFixture,
+) -> None:
+    post_service.post_dao.search = cast(
+        AsyncMock,
+        mocker.AsyncMock(side_effect=ValueError("Invalid cursor")),
+    )
+
+    with pytest.raises(DomainError) as exc_info:
+        await post_service.search_posts(terms="title", limit=5, cursor="bad")
+
+    err = exc_info.value
+    assert err.detail["code"] == SearchPostsError.INVALID_PAGINATION
+    assert err.detail["message"] == "Invalid cursor"
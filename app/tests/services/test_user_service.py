@@ -1,8 +1,11 @@
+from datetime import datetime
+from http import HTTPStatus
 from unittest.mock import AsyncMock
 
 import pytest
 from pytest_mock import MockerFixture
 
+from app.db.dao.abstract_dao import StaleVersionError
 from app.db.models.user_model import User
 from app.errors import DomainError
 from app.services.user.errors import ChangePasswordError
@@ -13,13 +16,13 @@ from app.services.user.service import UserService
 @pytest.fixture
 def user_service(mocker: MockerFixture) -> UserService:
     mock_user_dao = mocker.MagicMock()
-    return UserService(user_dao=mock_user_dao)
+    mock_password_service = mocker.MagicMock()
+    return UserService(user_dao=mock_user_dao, password_service=mock_password_service)
 
 
 @pytest.mark.asyncio
 async def test_change_password_success(
     user_service: UserService,
-    mocker: MockerFixture,
 ) -> None:
     user_id = 1
     hashed_password = "old_hash"
@@ -28,10 +31,7 @@ async def test_change_password_success(
 
     user = User(id=user_id, hashed_password=hashed_password)
 
-    mock_hasher = mocker.MagicMock()
-    mock_hasher.verify.return_value = True
-    mocker.patch("app.services.user.service.PasswordHasher", return_value=mock_hasher)
-
+    user_service.password_service.verify = AsyncMock(return_value=True)
     user_service.user_dao.patch_password = AsyncMock()
 
     await user_service.change_password(
@@ -40,17 +40,17 @@ async def test_change_password_success(
         new_password=new_password,
     )
 
-    mock_hasher.verify.assert_called_once_with(hashed_password, old_password)
+    user_service.password_service.verify.assert_awaited_once_with(hashed_password, old_password)
     user_service.user_dao.patch_password.assert_awaited_once_with(
         user_id=user_id,
         password=new_password,
+        expected_updated_at=None,
     )
 
 
 @pytest.mark.asyncio
 async def test_change_password_wrong_old_password(
     user_service: UserService,
-    mocker: MockerFixture,
 ) -> None:
     user_id = 1
     hashed_password = "stored_hash"
@@ -59,9 +59,7 @@ async def test_change_password_wrong_old_password(
 
     user = User(id=user_id, hashed_password=hashed_password)
 
-    mock_hasher = mocker.MagicMock()
-    mock_hasher.verify.side_effect = Exception("Invalid password")
-    mocker.patch("app.services.user.service.PasswordHasher", return_value=mock_hasher)
+    user_service.password_service.verify = AsyncMock(return_value=False)
 
     with pytest.raises(DomainError) as exc_info:
         await user_service.change_password(
@@ -72,13 +70,12 @@ async def test_change_password_wrong_old_password(
 
     err = exc_info.value
     assert err.detail["code"] == ChangePasswordError.INVALID_OLD_PASSWORD
-    mock_hasher.verify.assert_called_once_with(hashed_password, wrong_password)
+    user_service.password_service.verify.assert_awaited_once_with(hashed_password, wrong_password)
 
 
 @pytest.mark.asyncio
 async def test_change_password_invalid_new_password(
     user_service: UserService,
-    mocker: MockerFixture,
 ) -> None:
     user_id = 1
     hashed_password = "stored_hash"
@@ -87,9 +84,7 @@ async def test_change_password_invalid_new_password(
 
     user = User(id=user_id, hashed_password=hashed_password)
 
-    mock_hasher = mocker.MagicMock()
-    mock_hasher.verify.return_value = True
-    mocker.patch("app.services.user.service.PasswordHasher", return_value=mock_hasher)
+    user_service.password_service.verify = AsyncMock(return_value=True)
 
     with pytest.raises(DomainError) as exc_info:
         await user_service.change_password(
@@ -100,7 +95,7 @@ async def test_change_password_invalid_new_password(
 
     err = exc_info.value
     assert err.detail["code"] == ChangePasswordError.INVALID_NEW_PASSWORD
-    mock_hasher.verify.assert_called_once_with(hashed_password, old_password)
+    user_service.password_service.verify.assert_awaited_once_with(hashed_password, old_password)
 
 
 def test_valid_password_schema() -> None:
@@ -124,3 +119,30 @@ def test_invalid_password_schema(password: str, expected_error: str) -> None:
     with pytest.raises(ValueError) as exc_info:
         ValidatePasswordSchema(password=password)
     assert expected_error in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_change_password_of_a_modified_user(
+    user_service: UserService,
+) -> None:
+    user = User(id=1, hashed_password="old_hash")
+    read_at = datetime(2025, 1, 1)
+
+    user_service.password_service.verify = AsyncMock(return_value=True)
+    user_service.user_dao.patch_password = AsyncMock(side_effect=StaleVersionError("Model was modified"))
+
+    with pytest.raises(DomainError) as exc_info:
+        await user_service.change_password(
+            user=user,
+            old_password="correct_password",
+            new_password="Valid1@Password",
+            expected_updated_at=read_at,
+        )
+
+    assert exc_info.value.status_code == HTTPStatus.PRECONDITION_FAILED
+    assert exc_info.value.detail["code"] == ChangePasswordError.USER_MODIFIED
+    user_service.user_dao.patch_password.assert_awaited_once_with(
+        user_id=1,
+        password="Valid1@Password",
+        expected_updated_at=read_at,
+    )
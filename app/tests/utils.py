@@ -0,0 +1,9 @@
+import asyncio
+from typing import Callable
+
+
+async def wait_for(predicate: Callable[[], bool], timeout: float = 5) -> None:
+    """Poll `predicate` until it holds, failing with `TimeoutError` after `timeout` seconds."""
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
@@ -0,0 +1,70 @@
+from typing import Any, AsyncGenerator, Generator
+
+import pytest
+import pytest_asyncio
+from argon2 import PasswordHasher
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.auth.user_cache import user_cache
+from app.db.models.post_model import Post
+from app.db.models.user_model import User
+from app.db.readonly import readonly_session_factory
+from app.web.application import get_app
+
+AUTHOR_PASSWORD = "Old1@Password"
+
+
+@pytest.fixture(autouse=True)
+def _clear_user_cache() -> Generator[None, None, None]:
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+@pytest.fixture
+def statements(db_engine: AsyncEngine) -> list[str]:
+    executed: list[str] = []
+
+    def record(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    return executed
+
+
+@pytest_asyncio.fixture
+async def author(db_session_factory: async_sessionmaker[AsyncSession]) -> User:
+    async with db_session_factory() as session, session.begin():
+        user = User(
+            email="author@example.com",
+            hashed_password=PasswordHasher().hash(AUTHOR_PASSWORD),
+            first_name="Jane",
+            last_name="Doe",
+            permissions=[],
+            is_active=True,
+            is_superuser=False,
+            is_verified=True,
+        )
+        session.add(user)
+        await session.flush()
+        session.add_all(
+            Post(title=f"Post {i}", content="...", published=True, author_id=user.id) for i in range(20)
+        )
+    return user
+
+
+@pytest_asyncio.fixture
+async def client(
+    db_engine: AsyncEngine,
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncClient, None]:
+    app: FastAPI = get_app()
+    app.state.db_engine = db_engine
+    app.state.db_session_factory = db_session_factory
+    app.state.db_readonly_session_factory = readonly_session_factory(db_engine)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
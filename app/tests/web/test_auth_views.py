@@ -0,0 +1,49 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.consts import EventLogType
+from app.db.models.event_log_model import EventLog
+from app.db.models.user_model import User
+from app.tests.web.conftest import AUTHOR_PASSWORD
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "username, password, expected_status",
+    [
+        ("author@example.com", AUTHOR_PASSWORD, 200),
+        ("author@example.com", "Wrong1@Password", 400),
+        ("nobody@example.com", AUTHOR_PASSWORD, 400),
+    ],
+)
+async def test_login(
+    client: AsyncClient,
+    author: User,
+    username: str,
+    password: str,
+    expected_status: int,
+) -> None:
+    response = await client.post(
+        "/api/auth/login",
+        data={"username": username, "password": password},
+    )
+
+    assert response.status_code == expected_status
+
+
+@pytest.mark.asyncio
+async def test_login_records_event_with_its_transaction(
+    client: AsyncClient,
+    author: User,
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await client.post(
+        "/api/auth/login",
+        data={"username": "author@example.com", "password": AUTHOR_PASSWORD},
+    )
+
+    async with db_session_factory() as session:
+        events = (await session.execute(select(EventLog))).scalars().all()
+    assert [(event.event_type, event.created_by) for event in events] == [(EventLogType.USER_LOGGED_IN, author.id)]
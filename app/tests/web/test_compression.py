@@ -0,0 +1,167 @@
+import gzip
+import os
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Mount, Route
+
+from app.web.compression import CompressionMiddleware, choose_encoding
+from app.web.static import PrecompressedStaticFiles
+
+BIG = {"items": ["compressible"] * 200}
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "available", "expected"),
+    [
+        ("gzip, deflate, br", ("br", "gzip"), "br"),
+        ("gzip, deflate, br", ("gzip",), "gzip"),
+        ("br;q=0.5, gzip", ("br", "gzip"), "gzip"),
+        ("gzip;q=0", ("gzip",), None),
+        ("gzip;q=oops", ("gzip",), None),
+        ("identity", ("gzip",), None),
+        ("", ("gzip",), None),
+    ],
+)
+def test_choose_encoding(accept_encoding: str, available: tuple[str, ...], expected: str | None) -> None:
+    assert choose_encoding(accept_encoding, available) == expected
+
+
+async def _big(request: Request) -> Response:
+    return JSONResponse(BIG, headers={"ETag": '"v1"'})
+
+
+async def _small(request: Request) -> Response:
+    return JSONResponse({"id": 1})
+
+
+async def _encoded(request: Request) -> Response:
+    return Response(gzip.compress(b"x" * 2000), media_type="text/plain", headers={"Content-Encoding": "gzip"})
+
+
+async def _image(request: Request) -> Response:
+    return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+
+async def _stream(request: Request) -> Response:
+    async def chunks() -> AsyncIterator[bytes]:
+        for _ in range(10):
+            yield b"line of text\n" * 20
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+@pytest.fixture
+def static_dir(tmp_path: Path) -> Path:
+    (tmp_path / "page.html").write_text("<p>hello</p>" * 200)
+    (tmp_path / "tiny.css").write_text("p{}")
+    return tmp_path
+
+
+@pytest.fixture
+def static_files(static_dir: Path) -> PrecompressedStaticFiles:
+    return PrecompressedStaticFiles(directory=static_dir, minimum_size=100, max_age=3600)
+
+
+@pytest.fixture
+def client(static_files: PrecompressedStaticFiles) -> AsyncClient:
+    app = Starlette(
+        routes=[
+            Route("/big", _big),
+            Route("/small", _small),
+            Route("/encoded", _encoded),
+            Route("/image", _image),
+            Route("/stream", _stream),
+            Mount("/static", static_files),
+        ],
+    )
+    app.add_middleware(CompressionMiddleware, minimum_size=500, gzip_level=6, brotli_quality=4)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_large_responses_are_compressed(client: AsyncClient) -> None:
+    response = await client.get("/big", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == BIG
+
+
+@pytest.mark.asyncio
+async def test_streamed_responses_are_compressed(client: AsyncClient) -> None:
+    response = await client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == "line of text\n" * 200
+
+
+@pytest.mark.parametrize(
+    ("path", "accept_encoding"),
+    [("/big", ""), ("/small", "gzip"), ("/image", "gzip")],
+)
+@pytest.mark.asyncio
+async def test_responses_sent_as_they_are(client: AsyncClient, path: str, accept_encoding: str) -> None:
+    response = await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_encoded_responses_are_not_compressed_twice(client: AsyncClient) -> None:
+    response = await client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+
+    assert response.text == "x" * 2000
+
+
+@pytest.mark.asyncio
+async def test_static_files_are_served_precompressed(
+    client: AsyncClient,
+    static_files: PrecompressedStaticFiles,
+) -> None:
+    assert static_files.precompress() == 1
+
+    response = await client.get("/static/page.html", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].endswith('-gzip"')
+    assert response.headers["cache-control"] == "public, max-age=3600"
+    assert "last-modified" in response.headers
+    assert response.text == "<p>hello</p>" * 200
+
+    cached = await client.get(
+        "/static/page.html",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+    )
+    assert cached.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_static_files_fall_back_to_the_file(
+    client: AsyncClient,
+    static_files: PrecompressedStaticFiles,
+    static_dir: Path,
+) -> None:
+    static_files.precompress()
+
+    identity = await client.get("/static/page.html", headers={"Accept-Encoding": ""})
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["vary"] == "Accept-Encoding"
+
+    tiny = await client.get("/static/tiny.css", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in tiny.headers
+    assert tiny.headers["cache-control"] == "public, max-age=3600"
+
+    page = static_dir / "page.html"
+    page.write_text("<p>changed</p>" * 200)
+    os.utime(page, (0, 1))
+    changed = await client.get("/static/page.html", headers={"Accept-Encoding": "gzip"})
+    assert changed.text == "<p>changed</p>" * 200
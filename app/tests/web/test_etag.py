@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.db.models.post_model import Post
+from app.web.etag import check_not_modified, etag_for, expected_version, parse_etag
+
+UPDATED_AT = datetime(2025, 3, 1, 12, 30, 15, 123456)
+
+
+def _post() -> Post:
+    return Post(id=7, updated_at=UPDATED_AT)
+
+
+def _request(**headers: str) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "headers": raw})
+
+
+def test_etag_round_trips() -> None:
+    etag = etag_for(_post())
+
+    assert etag.startswith('W/"7-')
+    assert parse_etag(etag) == (7, UPDATED_AT)
+    assert parse_etag('"not-ours"') is None
+
+
+def test_check_not_modified_tags_the_response() -> None:
+    response = Response()
+
+    check_not_modified(_request(if_none_match='W/"7-1"'), response, _post())
+
+    assert response.headers["ETag"] == etag_for(_post())
+
+
+@pytest.mark.parametrize("if_none_match", [etag_for(_post()), etag_for(_post()).removeprefix("W/"), "*"])
+def test_check_not_modified_raises_304(if_none_match: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        check_not_modified(_request(if_none_match=if_none_match), Response(), _post())
+
+    assert exc_info.value.status_code == 304
+
+
+def test_expected_version() -> None:
+    assert expected_version(_request(), _post()) is None
+    assert expected_version(_request(if_match="*"), _post()) is None
+    assert expected_version(_request(if_match=f'"a", {etag_for(_post())}'), _post()) == UPDATED_AT
+
+    with pytest.raises(HTTPException) as exc_info:
+        expected_version(_request(if_match='W/"8-1"'), _post())
+    assert exc_info.value.status_code == 412
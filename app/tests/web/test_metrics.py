@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.types import Receive, Scope, Send
+
+from app.web.metrics import LATENCY_BUCKETS, Histogram, LoopLagMonitor, MetricsMiddleware, RequestMetrics
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.samples("latency", (("route", "a"),)) == [
+        'latency_bucket{route="a",le="0.1"} 2',
+        'latency_bucket{route="a",le="1"} 3',
+        'latency_bucket{route="a",le="+Inf"} 4',
+        'latency_sum{route="a"} 3.65',
+        'latency_count{route="a"} 4',
+    ]
+
+
+def test_render_escapes_label_values() -> None:
+    metrics = RequestMetrics()
+    metrics.observe('a"b\\c', "GET", 200, 0.01, 10)
+
+    assert 'http_responses_total{route="a\\"b\\\\c",method="GET",status="200"} 1' in metrics.render()
+
+
+async def _app(scope: Scope, receive: Receive, send: Send) -> None:
+    if scope["path"] == "/boom":
+        raise RuntimeError("boom")
+    await send({"type": "http.response.start", "status": 201, "headers": []})
+    await send({"type": "http.response.body", "body": b"hello", "more_body": True})
+    await send({"type": "http.response.body", "body": b" world"})
+
+
+@pytest.mark.asyncio
+async def test_middleware_records_status_size_and_latency() -> None:
+    metrics = RequestMetrics()
+    transport = ASGITransport(app=MetricsMiddleware(_app, metrics))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.post("/")
+        with pytest.raises(RuntimeError):
+            await client.get("/boom")
+
+    assert metrics.in_flight == 0
+    assert metrics.responses == {("unmatched", "POST", 201): 1, ("unmatched", "GET", 500): 1}
+    assert metrics.sizes["unmatched", "POST"].sum == 11
+    assert metrics.durations["unmatched", "POST"].count == 1
+    assert len(metrics.durations["unmatched", "POST"].counts) == len(LATENCY_BUCKETS) + 1
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_measures_blocking() -> None:
+    monitor = LoopLagMonitor(interval=0.01)
+    await monitor.start()
+    await asyncio.sleep(0.02)
+    # Block the loop while the monitor is sleeping
+    time.sleep(0.05)
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+
+    assert monitor.max_lag >= 0.03
+    assert "event_loop_lag_seconds_max" in "\n".join(monitor.render())
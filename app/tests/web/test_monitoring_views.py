@@ -0,0 +1,78 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.auth_token import generate_token
+from app.consts import Permission
+from app.db.models.user_model import User
+from app.settings import settings
+
+
+@pytest_asyncio.fixture
+async def monitor_headers(db_session_factory: async_sessionmaker[AsyncSession]) -> dict[str, str]:
+    async with db_session_factory() as session, session.begin():
+        user = User(
+            email="monitor@example.com",
+            hashed_password="-",
+            first_name="Mon",
+            last_name="Itor",
+            permissions=[Permission.MONITOR],
+            is_active=True,
+            is_verified=True,
+        )
+        session.add(user)
+    return {"Authorization": f"Bearer {generate_token(user.id)}"}
+
+
+@pytest.mark.asyncio
+async def test_get_db_pool_stats(client: AsyncClient, monitor_headers: dict[str, str]) -> None:
+    response = await client.get("/api/monitoring/db-pool", headers=monitor_headers)
+
+    assert response.status_code == 200
+    assert response.json()["size"] == 10
+
+
+@pytest.mark.asyncio
+async def test_get_db_pool_stats_requires_monitor_permission(client: AsyncClient, author: User) -> None:
+    response = await client.get("/api/monitoring/db-pool")
+    assert response.status_code == 401
+
+    response = await client.get(
+        "/api/monitoring/db-pool",
+        headers={"Authorization": f"Bearer {generate_token(author.id)}"},
+    )
+    assert response.status_code == 403
+
+
+@pytest.fixture
+def metrics_token(monkeypatch: pytest.MonkeyPatch) -> str:
+    monkeypatch.setattr(settings, "metrics_token", "scrape-token")
+    return "scrape-token"
+
+
+@pytest.mark.asyncio
+async def test_get_metrics(client: AsyncClient, monitor_headers: dict[str, str], metrics_token: str) -> None:
+    await client.get("/api/monitoring/db-pool", headers=monitor_headers)
+
+    response = await client.get("/api/metrics", headers={"Authorization": f"Bearer {metrics_token}"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_seconds_count{route="monitoring:db_pool",method="GET"}' in response.text
+    assert "db_pool_size 10" in response.text
+    assert "event_loop_lag_seconds " in response.text
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_requires_scrape_token(client: AsyncClient, metrics_token: str) -> None:
+    assert (await client.get("/api/metrics")).status_code == 401
+    response = await client.get("/api/metrics", headers={"Authorization": "Bearer wrong-token"})
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_get_metrics_is_closed_without_configured_token(client: AsyncClient) -> None:
+    response = await client.get("/api/metrics", headers={"Authorization": "Bearer anything"})
+
+    assert response.status_code == 403
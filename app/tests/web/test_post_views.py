@@ -0,0 +1,220 @@
+from datetime import datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.auth.auth_token import generate_token
+from app.db.models.post_model import Post
+from app.db.models.user_model import User
+
+
+@pytest.fixture
+def headers(author: User) -> dict[str, str]:
+    return {"Authorization": f"Bearer {generate_token(author.id)}"}
+
+
+@pytest.mark.asyncio
+async def test_list_posts_pages_through_active_posts(
+    client: AsyncClient,
+    headers: dict[str, str],
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with db_session_factory() as session, session.begin():
+        await session.execute(update(Post).where(Post.title == "Post 19").values(is_active=False))
+
+    ids: list[int] = []
+    params: dict[str, str | int] = {"limit": 8}
+    while True:
+        response = await client.get("/api/posts", params=params, headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        ids += [item["id"] for item in body["items"]]
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert len(ids) == 19
+    assert ids == sorted(ids, reverse=True)
+    assert set(body["items"][0]) == {"id", "title", "published", "author_id", "created_at"}
+
+
+@pytest.mark.asyncio
+async def test_list_posts_filters_and_sorts(
+    client: AsyncClient,
+    author: User,
+    headers: dict[str, str],
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with db_session_factory() as session, session.begin():
+        session.add_all(
+            Post(
+                title=f"Dated {day}",
+                content="...",
+                published=day % 2 == 0,
+                author_id=author.id,
+                created_at=datetime(2024, 1, day),
+            )
+            for day in range(1, 7)
+        )
+
+    response = await client.get(
+        "/api/posts",
+        params={
+            "filter[author_id]": author.id,
+            "filter[published]": "true",
+            "filter[created_at][gte]": "2024-01-02T00:00:00",
+            "filter[created_at][lt]": "2024-01-06T00:00:00",
+            "sort": "created_at,asc",
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()["items"]] == ["Dated 2", "Dated 4"]
+
+    # Aware timestamps are compared in UTC
+    response = await client.get(
+        "/api/posts",
+        params={
+            "filter[author_id]": author.id,
+            "filter[created_at][gte]": "2024-01-03T00:00:00Z",
+            "filter[created_at][lt]": "2024-01-05T02:00:00+02:00",
+            "sort": "created_at,asc",
+        },
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()["items"]] == ["Dated 3", "Dated 4"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"sort": "title,asc"},
+        {"sort": "created_at"},
+        {"sort[0][0]": "content", "sort[0][1]": "asc"},
+        {"limit": 0},
+        {"limit": 101},
+        {"filter[published]": "maybe"},
+    ],
+)
+async def test_list_posts_rejects_invalid_query(
+    client: AsyncClient,
+    headers: dict[str, str],
+    params: dict[str, str | int],
+) -> None:
+    response = await client.get("/api/posts", params=params, headers=headers)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == next(iter(params)).split("[")[0]
+
+
+@pytest.mark.asyncio
+async def test_list_posts_rejects_cursor_of_another_sort(
+    client: AsyncClient,
+    headers: dict[str, str],
+) -> None:
+    response = await client.get("/api/posts", params={"limit": 5}, headers=headers)
+    cursor = response.json()["next_cursor"]
+
+    response = await client.get(
+        "/api/posts",
+        params={"limit": 5, "cursor": cursor, "sort": "created_at,desc"},
+        headers=headers,
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "INVALID_PAGINATION"
+
+
+@pytest.mark.asyncio
+async def test_list_posts_requires_authentication(client: AsyncClient) -> None:
+    response = await client.get("/api/posts")
+
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_search_posts_ranks_and_pages_matches(
+    client: AsyncClient,
+    author: User,
+    headers: dict[str, str],
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with db_session_factory() as session, session.begin():
+        session.add_all(
+            [
+                Post(title="Gardening", content="Tomatoes need sun", published=True, author_id=author.id),
+                Post(title="Tomatoes", content="Growing tomatoes at home", published=True, author_id=author.id),
+                Post(title="Cooking", content="A tomato sauce", published=True, author_id=author.id),
+                Post(title="Tomato soup", content="...", published=True, author_id=author.id, is_active=False),
+                Post(title="Cooking", content="Potatoes only", published=True, author_id=author.id),
+            ],
+        )
+
+    titles: list[str] = []
+    params: dict[str, str | int] = {"q": "tomatoes", "limit": 1}
+    while True:
+        response = await client.get("/api/posts/search", params=params, headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        titles += [item["title"] for item in body["items"]]
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    # Stemmed, so "tomato" matches too; title matches rank first
+    assert titles[0] == "Tomatoes"
+    assert sorted(titles[1:]) == ["Cooking", "Gardening"]
+
+
+@pytest.mark.asyncio
+async def test_search_posts_supports_web_search_syntax(
+    client: AsyncClient,
+    author: User,
+    headers: dict[str, str],
+    db_session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    async with db_session_factory() as session, session.begin():
+        session.add_all(
+            [
+                Post(title="Red apples", content="...", published=True, author_id=author.id),
+                Post(title="Green apples", content="...", published=True, author_id=author.id),
+                Post(title="Apples, red and green", content="...", published=True, author_id=author.id),
+            ],
+        )
+
+    response = await client.get("/api/posts/search", params={"q": '"red apples" -green'}, headers=headers)
+
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()["items"]] == ["Red apples"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("params", [{}, {"q": "   "}, {"q": "x" * 201}, {"q": "post", "limit": 0}])
+async def test_search_posts_rejects_invalid_query(
+    client: AsyncClient,
+    headers: dict[str, str],
+    params: dict[str, str | int],
+) -> None:
+    response = await client.get("/api/posts/search", params=params, headers=headers)
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_posts_rejects_listing_cursor(
+    client: AsyncClient,
+    headers: dict[str, str],
+) -> None:
+    response = await client.get("/api/posts", params={"limit": 5}, headers=headers)
+    cursor = response.json()["next_cursor"]
+
+    response = await client.get("/api/posts/search", params={"q": "post", "cursor": cursor}, headers=headers)
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "INVALID_PAGINATION"
@@ -0,0 +1,87 @@
+import asyncio
+import os
+import signal
+
+import pytest
+from pytest_mock import MockFixture
+
+from app.settings import settings
+from app.web.metrics import RequestMetrics
+from app.web.recycler import WorkerRecycler, create_worker_recycler, resident_memory_mb
+
+
+def _recycler(metrics: RequestMetrics, **limits: int) -> WorkerRecycler:
+    options = {"max_requests": 0, "max_requests_jitter": 0, "max_memory_mb": 0} | limits
+    return WorkerRecycler(**options, check_interval=0.01, metrics=metrics)
+
+
+def test_request_limit_is_jittered_per_worker() -> None:
+    limits = {_recycler(RequestMetrics(), max_requests=100, max_requests_jitter=10).max_requests for _ in range(50)}
+
+    assert min(limits) >= 100
+    assert max(limits) <= 110
+    assert len(limits) > 1
+
+
+def test_recycles_after_max_requests() -> None:
+    metrics = RequestMetrics()
+    recycler = _recycler(metrics, max_requests=2)
+
+    metrics.observe("user:me", "GET", 200, 0.01, 10)
+    assert recycler.reason() is None
+    metrics.observe("user:me", "GET", 200, 0.01, 10)
+    assert recycler.reason() == "served 2 requests"
+
+
+def test_recycles_above_max_memory(mocker: MockFixture) -> None:
+    memory = mocker.patch("app.web.recycler.resident_memory_mb", return_value=100.0)
+    recycler = _recycler(RequestMetrics(), max_memory_mb=200)
+
+    assert recycler.reason() is None
+    memory.return_value = 250.0
+    assert recycler.reason() == "uses 250 MB"
+    memory.return_value = None
+    assert recycler.reason() is None
+
+
+def test_resident_memory_is_read_from_proc() -> None:
+    memory = resident_memory_mb()
+
+    assert memory is None or memory > 1
+
+
+@pytest.mark.asyncio
+async def test_worker_terminates_itself_once(mocker: MockFixture) -> None:
+    kill = mocker.patch("app.web.recycler.os.kill")
+    metrics = RequestMetrics()
+    recycler = _recycler(metrics, max_requests=1)
+    metrics.observe("user:me", "GET", 200, 0.01, 10)
+
+    await recycler.start()
+    await asyncio.sleep(0.05)
+    await recycler.stop()
+
+    kill.assert_called_once_with(os.getpid(), signal.SIGTERM)
+
+
+@pytest.mark.asyncio
+async def test_disabled_recycler_does_not_start() -> None:
+    recycler = _recycler(RequestMetrics())
+
+    await recycler.start()
+
+    assert not recycler.enabled
+    assert recycler._task is None  # noqa: SLF001
+
+
+def test_single_process_is_never_recycled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "server_max_requests", 100)
+    monkeypatch.setattr(settings, "server_max_memory_mb", 100)
+    monkeypatch.setattr(settings, "workers_count", 1)
+
+    assert not create_worker_recycler().enabled
+
+    monkeypatch.setattr(settings, "workers_count", 0)
+    monkeypatch.setattr(os, "sched_getaffinity", lambda _: {0, 1, 2, 3}, raising=False)
+    assert settings.workers == 4
+    assert create_worker_recycler().enabled
@@ -0,0 +1,55 @@
+import json
+from datetime import UTC, datetime
+
+from pydantic import BaseModel
+
+from app.consts import Permission
+from app.web.api.user.schemas import GetMeResponse, UserRead
+from app.web.responses import PydanticJSONResponse
+
+CREATED_AT = datetime(2025, 3, 1, 12, 30, 15, tzinfo=UTC)
+
+
+class _Event(BaseModel):
+    user: UserRead
+    created_at: datetime
+
+
+def _user(user_id: int = 1) -> UserRead:
+    return UserRead(
+        id=user_id,
+        first_name="Ada",
+        last_name="Lovelace",
+        email="ada@example.com",
+        permissions=[Permission.CREATE_USER],
+    )
+
+
+def test_renders_models_like_model_dump_json() -> None:
+    event = _Event(user=_user(), created_at=CREATED_AT)
+
+    response = PydanticJSONResponse(event)
+
+    assert response.body == event.model_dump_json().encode()
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_renders_lists_and_dicts_of_models() -> None:
+    users = [_user(1), _user(2)]
+
+    body = json.loads(bytes(PydanticJSONResponse({"items": users, "total": 2}).body))
+
+    assert body["total"] == 2
+    assert [item["id"] for item in body["items"]] == [1, 2]
+
+
+def test_renders_datetimes_and_enums_natively() -> None:
+    body = json.loads(bytes(PydanticJSONResponse({"at": CREATED_AT, "permission": Permission.CREATE_USER}).body))
+
+    assert body == {"at": "2025-03-01T12:30:15Z", "permission": Permission.CREATE_USER.value}
+
+
+def test_get_me_response_validates_from_attributes() -> None:
+    user = _user()
+
+    assert GetMeResponse.model_validate(user).email == "ada@example.com"
@@ -0,0 +1,117 @@
+from typing import Any, cast
+
+import pytest
+from fastapi import FastAPI
+from pytest_mock import MockFixture
+from sentry_sdk.types import Event
+from sentry_sdk.utils import transaction_from_function
+
+from app.web.tracing import TokenBucket, TraceSampler
+
+
+async def _get_post() -> None:
+    return
+
+
+async def _list_posts() -> None:
+    return
+
+
+async def _metrics() -> None:
+    return
+
+
+def _sampler(traces_per_second: float = 100.0) -> TraceSampler:
+    app = FastAPI()
+    app.add_api_route("/api/posts/{post_id}", _get_post, name="post:get")
+    app.add_api_route("/api/posts", _list_posts, name="post:list")
+    app.add_api_route("/api/metrics", _metrics, name="monitoring:metrics")
+    return TraceSampler(
+        app.routes,
+        default_rate=0.0,
+        route_rates={"post:get": 1.0, "post:list": 0.1, "monitoring:metrics": 0.0},
+        record_rate=0.25,
+        slow_threshold=1.0,
+        traces_per_second=traces_per_second,
+    )
+
+
+def _event(
+    endpoint: Any = _get_post,
+    *,
+    status: str = "ok",
+    status_code: int = 200,
+    duration: float = 0.1,
+) -> Event:
+    event = {
+        "transaction": transaction_from_function(endpoint),
+        "start_timestamp": "2025-01-01T00:00:00.000000Z",
+        "timestamp": f"2025-01-01T00:00:{duration:09.6f}Z",
+        "contexts": {"trace": {"status": status, "data": {"http.response.status_code": status_code}}},
+    }
+    return cast(Event, event)
+
+
+def _asgi_scope(path: str) -> dict[str, Any]:
+    return {"type": "http", "method": "GET", "path": path, "root_path": ""}
+
+
+def test_token_bucket_refills_over_time(mocker: MockFixture) -> None:
+    clock = mocker.patch("app.web.tracing.time.monotonic", return_value=0.0)
+    bucket = TokenBucket(rate=2.0, capacity=2.0)
+
+    assert [bucket.take() for _ in range(3)] == [True, True, False]
+    clock.return_value = 0.5
+    assert [bucket.take() for _ in range(2)] == [True, False]
+
+
+def test_traces_sampler_records_at_least_the_record_rate() -> None:
+    sampler = _sampler()
+
+    assert sampler.traces_sampler({"asgi_scope": _asgi_scope("/api/posts/1")}) == 1.0
+    assert sampler.traces_sampler({"asgi_scope": _asgi_scope("/api/posts")}) == 0.25
+    assert sampler.traces_sampler({"asgi_scope": _asgi_scope("/api/metrics")}) == 0.0
+    assert sampler.traces_sampler({"asgi_scope": _asgi_scope("/nowhere")}) == 0.0
+    assert sampler.traces_sampler({"parent_sampled": False, "asgi_scope": _asgi_scope("/api/posts/1")}) == 0.0
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        _event(_metrics, status="internal_error", status_code=500),
+        _event(_metrics, status="unknown", status_code=503),
+        _event(_metrics, duration=1.5),
+        _event(_get_post),
+    ],
+)
+def test_errors_slow_requests_and_sampled_routes_are_sent(event: Event) -> None:
+    assert _sampler().before_send_transaction(event, {}) is event
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        _event(_metrics),
+        _event(_metrics, status="not_found", status_code=404),
+        cast(Event, {"transaction": "unknown", "contexts": {}}),
+    ],
+)
+def test_ordinary_requests_of_unsampled_routes_are_dropped(event: Event) -> None:
+    assert _sampler().before_send_transaction(event, {}) is None
+
+
+def test_sent_transactions_are_limited_by_the_budget() -> None:
+    sampler = _sampler(traces_per_second=1.0)
+
+    assert sampler.before_send_transaction(_event(status="internal_error"), {}) is not None
+    assert sampler.before_send_transaction(_event(status="internal_error"), {}) is None
+    assert sampler.before_send_transaction(_event(), {}) is None
+
+
+@pytest.mark.parametrize(("roll", "sent"), [(0.39, True), (0.41, False)])
+def test_ordinary_requests_are_sent_so_the_route_rate_is_met(mocker: MockFixture, roll: float, sent: bool) -> None:
+    mocker.patch("app.web.tracing.random.random", return_value=roll)
+    event = _event(_list_posts)
+
+    # Recorded 25% of the time, so sent 40% of that to reach the route's 10%
+    assert (_sampler().before_send_transaction(event, {}) is event) is sent
@@ -0,0 +1,168 @@
+from contextlib import AbstractContextManager
+from typing import Callable
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from starlette.types import Message, Receive, Scope, Send
+
+from app.auth.auth_token import generate_token
+from app.auth.user_cache import user_cache
+from app.db.instrumentation import QueryStats
+from app.db.models.user_model import User
+from app.db.readonly import readonly_session_factory
+from app.tests.web.conftest import AUTHOR_PASSWORD
+from app.web.application import get_app
+
+
+@pytest.mark.asyncio
+async def test_get_me_does_not_load_user_posts(
+    client: AsyncClient,
+    author: User,
+    statements: list[str],
+) -> None:
+    response = await client.get(
+        "/api/users/me",
+        headers={"Authorization": f"Bearer {generate_token(author.id)}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["email"] == "author@example.com"
+    assert len(statements) == 1, statements
+
+
+@pytest.mark.asyncio
+async def test_get_me_serves_authenticated_user_from_cache(
+    client: AsyncClient,
+    author: User,
+    statements: list[str],
+) -> None:
+    headers = {"Authorization": f"Bearer {generate_token(author.id)}"}
+
+    await client.get("/api/users/me", headers=headers)
+    statements.clear()
+    response = await client.get("/api/users/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["email"] == "author@example.com"
+    assert statements == []
+    assert user_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_patch_password_invalidates_cached_user(
+    client: AsyncClient,
+    author: User,
+    statements: list[str],
+) -> None:
+    headers = {"Authorization": f"Bearer {generate_token(author.id)}"}
+    await client.get("/api/users/me", headers=headers)
+
+    response = await client.patch(
+        "/api/users/me/password",
+        headers=headers,
+        json={"old_password": AUTHOR_PASSWORD, "new_password": "New1@Password"},
+    )
+    statements.clear()
+    await client.get("/api/users/me", headers=headers)
+
+    assert response.status_code == 200
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_me_query_budget_and_server_timing(
+    client: AsyncClient,
+    author: User,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    with query_budget(1) as stats:
+        response = await client.get(
+            "/api/users/me",
+            headers={"Authorization": f"Bearer {generate_token(author.id)}"},
+        )
+
+    assert stats.count == 1
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert 'desc="queries=1"' in response.headers["Server-Timing"]
+
+
+@pytest.mark.asyncio
+async def test_get_me_answers_304_while_the_etag_is_current(client: AsyncClient, author: User) -> None:
+    headers = {"Authorization": f"Bearer {generate_token(author.id)}"}
+
+    response = await client.get("/api/users/me", headers=headers)
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    cached = await client.get("/api/users/me", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+
+    await client.patch(
+        "/api/users/me/password",
+        headers=headers,
+        json={"old_password": AUTHOR_PASSWORD, "new_password": "New1@Password"},
+    )
+    changed = await client.get("/api/users/me", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_patch_password_checks_if_match(client: AsyncClient, author: User) -> None:
+    headers = {"Authorization": f"Bearer {generate_token(author.id)}"}
+    etag = (await client.get("/api/users/me", headers=headers)).headers["ETag"]
+
+    first = await client.patch(
+        "/api/users/me/password",
+        headers={**headers, "If-Match": etag},
+        json={"old_password": AUTHOR_PASSWORD, "new_password": "New1@Password"},
+    )
+    # The cached user still carries the old ETag until its entry is dropped
+    second = await client.patch(
+        "/api/users/me/password",
+        headers={**headers, "If-Match": etag},
+        json={"old_password": "New1@Password", "new_password": "New2@Password"},
+    )
+    unrelated = await client.patch(
+        "/api/users/me/password",
+        headers={**headers, "If-Match": '"something-else"'},
+        json={"old_password": "New1@Password", "new_password": "New2@Password"},
+    )
+
+    assert first.status_code == 200
+    assert second.status_code == 412
+    assert second.json()["detail"]["code"] == "USER_MODIFIED"
+    assert unrelated.status_code == 412
+
+
+@pytest.mark.asyncio
+async def test_read_only_route_releases_connection_before_responding(
+    db_engine: AsyncEngine,
+    db_session_factory: async_sessionmaker[AsyncSession],
+    author: User,
+) -> None:
+    app = get_app()
+    app.state.db_engine = db_engine
+    app.state.db_session_factory = db_session_factory
+    app.state.db_readonly_session_factory = readonly_session_factory(db_engine)
+    checked_out: list[int] = []
+
+    async def recording_app(scope: Scope, receive: Receive, send: Send) -> None:
+        async def recording_send(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                checked_out.append(db_engine.pool.checkedout())  # type: ignore[attr-defined]
+            await send(message)
+
+        await app(scope, receive, recording_send)
+
+    async with AsyncClient(transport=ASGITransport(app=recording_app), base_url="http://test") as client:
+        response = await client.get(
+            "/api/users/me",
+            headers={"Authorization": f"Bearer {generate_token(author.id)}"},
+        )
+
+    assert response.status_code == 200
+    assert checked_out == [0]
@@ -7,6 +7,7 @@ from fastapi_users.db import SQLAlchemyUserDatabase
 
 from app.auth.auth_backend import BearerResponseRefresh
 from app.auth.auth_token import decode_token, generate_token
+from app.auth.user_cache import invalidate_user
 from app.consts import Permission
 from app.db.models.user_model import User
 from app.dependencies.auth_dependencies import auth_backend_refresh, can, fastapi_users
@@ -79,6 +80,7 @@ async def refresh_jwt_token(
     hasher = hashlib.sha3_256()
     hasher.update(new_refresh_token.encode())
     user.refresh_token = hasher.hexdigest()
+    invalidate_user(user_db.session, user_id)
     Logger.info(f"User {user.email} refreshed his tokens.")
 
     return BearerResponseRefresh(
@@ -0,0 +1,5 @@
+"""API for monitoring the application."""
+
+from app.web.api.monitoring.views import router
+
+__all__ = ["router"]
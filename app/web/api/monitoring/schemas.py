@@ -0,0 +1,12 @@
+# GET /monitoring/db-pool
+from pydantic import BaseModel
+
+
+class DBPoolStatsResponseSchema(BaseModel):
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    acquisitions: int
+    wait_seconds_total: float
+    wait_seconds_max: float
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import PlainTextResponse
+
+from app.consts import Permission
+from app.db.pool import pool_stats
+from app.dependencies.auth_dependencies import can
+from app.dependencies.metrics_auth import verify_metrics_token
+from app.web.api.monitoring.schemas import DBPoolStatsResponseSchema
+from app.web.metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get(
+    "/monitoring/db-pool",
+    tags=["monitoring"],
+    summary="Monitoring: Database pool",
+    name="monitoring:db_pool",
+    response_model=DBPoolStatsResponseSchema,
+    dependencies=[Depends(can(Permission.MONITOR))],
+)
+async def get_db_pool_stats(request: Request) -> DBPoolStatsResponseSchema:
+    """Live state of this worker's database connection pool."""
+    return DBPoolStatsResponseSchema(**pool_stats(request.app.state.db_engine))
+
+
+@router.get(
+    "/metrics",
+    tags=["monitoring"],
+    summary="Monitoring: Prometheus metrics",
+    name="monitoring:metrics",
+    response_class=PlainTextResponse,
+    dependencies=[Depends(verify_metrics_token)],
+)
+async def get_metrics(request: Request) -> PlainTextResponse:
+    """Request, database and event loop metrics of this worker, in the Prometheus text format."""
+    return PlainTextResponse(render_metrics(request.app), media_type="text/plain; version=0.0.4")
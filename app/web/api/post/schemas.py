@@ -1,7 +1,15 @@
-# POST /posts
-from pydantic import BaseModel
+from datetime import UTC, datetime
+from typing import Annotated, Any
+
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, StringConstraints, field_validator
+
+from app.utils import SortDirection, parse_sort
+
+# Fields the listing can be sorted on: each is served by an index (see `Post`)
+POST_SORT_FIELDS = ("id", "created_at")
 
 
+# POST /posts
 class CreatePostPayloadSchema(BaseModel):
     title: str
     content: str
@@ -11,3 +19,74 @@ class CreatePostPayloadSchema(BaseModel):
 
 class CreatePostResponseSchema(BaseModel):
     id: int
+
+
+# GET /posts
+class DateRangeSchema(BaseModel):
+    gte: datetime | None = None
+    lt: datetime | None = None
+
+    @field_validator("gte", "lt")
+    @classmethod
+    def to_naive_utc(cls, value: datetime | None) -> datetime | None:
+        # `Post.created_at` is stored without time zone, in UTC
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(UTC).replace(tzinfo=None)
+
+
+class PostFiltersSchema(BaseModel):
+    author_id: PositiveInt | None = None
+    published: bool | None = None
+    created_at: DateRangeSchema = DateRangeSchema()
+
+
+class ListPostsQuerySchema(BaseModel):
+    """Query of `GET /posts?filter[author_id]=2&filter[created_at][gte]=...&sort=created_at,desc`."""
+
+    filter: PostFiltersSchema = PostFiltersSchema()
+    sort: list[tuple[str, SortDirection]] = [("id", "desc")]
+    limit: int = Field(default=20, ge=1, le=100)
+    cursor: str | None = None
+
+    @field_validator("sort", mode="before")
+    @classmethod
+    def parse_sort_string(cls, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+        return parse_sort(value) or [("id", "desc")]
+
+    @field_validator("sort")
+    @classmethod
+    def validate_sort(cls, value: list[tuple[str, SortDirection]]) -> list[tuple[str, SortDirection]]:
+        # Checked once parsed, whichever form the sort was given in (`sort=...` or `sort[0][0]=...`)
+        for field, _ in value:
+            if field not in POST_SORT_FIELDS:
+                raise ValueError(f"Posts can only be sorted on {', '.join(POST_SORT_FIELDS)}")
+        return value
+
+
+class PostSummarySchema(BaseModel):
+    id: int
+    title: str
+    published: bool
+    author_id: int
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ListPostsResponseSchema(BaseModel):
+    items: list[PostSummarySchema]
+    next_cursor: str | None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# GET /posts/search
+class SearchPostsQuerySchema(BaseModel):
+    """Query of `GET /posts/search?q="exact phrase" -excluded&limit=20`."""
+
+    q: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)]
+    limit: int = Field(default=20, ge=1, le=100)
+    cursor: str | None = None
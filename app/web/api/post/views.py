@@ -5,12 +5,20 @@ from app.db.dao.post_dao import PostDAO
 from app.db.dao.user_dao import UserDAO
 from app.db.models.user_model import User
 from app.dependencies.auth_dependencies import current_active_user
-from app.dependencies.db import get_db_session
+from app.dependencies.db import get_db_session, read_only
+from app.dependencies.validate_query_params import validate_query_params
 from app.errors import DomainError
 from app.services.logger.service import Logger
-from app.services.post.dto import PostCreateDTO
+from app.services.post.dto import PostCreateDTO, PostListFiltersDTO
 from app.services.post.service import PostService
-from app.web.api.post.schemas import CreatePostPayloadSchema, CreatePostResponseSchema
+from app.web.api.post.schemas import (
+    CreatePostPayloadSchema,
+    CreatePostResponseSchema,
+    ListPostsQuerySchema,
+    ListPostsResponseSchema,
+    SearchPostsQuerySchema,
+)
+from app.web.responses import PydanticJSONResponse
 
 router = APIRouter()
 
@@ -23,6 +31,70 @@ def get_post_service(
     return PostService(post_dao=post_dao, user_dao=user_dao)
 
 
+@router.get(
+    "/posts",
+    tags=["posts"],
+    summary="Posts: List",
+    name="post:list",
+    response_model=ListPostsResponseSchema,
+    dependencies=[Depends(read_only)],
+)
+async def list_posts(
+    query: ListPostsQuerySchema = Depends(validate_query_params(ListPostsQuerySchema)),
+    user: User = Depends(current_active_user),
+    service: PostService = Depends(get_post_service),
+) -> PydanticJSONResponse:
+    """List active posts, one keyset page at a time: pass `next_cursor` back as `cursor`."""
+
+    try:
+        page = await service.list_posts(
+            filters=PostListFiltersDTO(
+                author_id=query.filter.author_id,
+                published=query.filter.published,
+                created_from=query.filter.created_at.gte,
+                created_before=query.filter.created_at.lt,
+            ),
+            sort=query.sort,
+            limit=query.limit,
+            cursor=query.cursor,
+        )
+
+        return PydanticJSONResponse(ListPostsResponseSchema.model_validate(page))
+    except DomainError as e:
+        Logger.warning(e)
+        raise HTTPException(**e.to_http_args()) from e
+    except Exception as e:
+        Logger.error(e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR) from e
+
+
+@router.get(
+    "/posts/search",
+    tags=["posts"],
+    summary="Posts: Search",
+    name="post:search",
+    response_model=ListPostsResponseSchema,
+    dependencies=[Depends(read_only)],
+)
+async def search_posts(
+    query: SearchPostsQuerySchema = Depends(validate_query_params(SearchPostsQuerySchema)),
+    user: User = Depends(current_active_user),
+    service: PostService = Depends(get_post_service),
+) -> PydanticJSONResponse:
+    """Full text search of the active posts' title and content, best matches first."""
+
+    try:
+        page = await service.search_posts(terms=query.q, limit=query.limit, cursor=query.cursor)
+
+        return PydanticJSONResponse(ListPostsResponseSchema.model_validate(page))
+    except DomainError as e:
+        Logger.warning(e)
+        raise HTTPException(**e.to_http_args()) from e
+    except Exception as e:
+        Logger.error(e)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR) from e
+
+
 @router.post(
     "/posts",
     tags=["posts"],
@@ -34,7 +106,7 @@ async def create_post(
     payload: CreatePostPayloadSchema,
     user: User = Depends(current_active_user),
     service: PostService = Depends(get_post_service),
-) -> CreatePostResponseSchema:
+) -> PydanticJSONResponse:
     """Get current user."""
 
     try:
@@ -48,8 +120,10 @@ async def create_post(
             ),
         )
 
-        return CreatePostResponseSchema(
-            id=post_id,
+        return PydanticJSONResponse(
+            CreatePostResponseSchema(
+                id=post_id,
+            ),
         )
     except DomainError as e:
         Logger.warning(e)
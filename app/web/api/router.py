@@ -1,9 +1,10 @@
 from fastapi.routing import APIRouter
 
-from app.web.api import auth, post, user
+from app.web.api import auth, monitoring, post, user
 
 api_router = APIRouter()
 
 api_router.include_router(user.router)
 api_router.include_router(auth.router)
 api_router.include_router(post.router)
+api_router.include_router(monitoring.router)
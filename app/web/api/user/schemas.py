@@ -10,6 +10,8 @@ class UserSchema(BaseModel):
     email: EmailStr
     is_active: bool = True
 
+    model_config = ConfigDict(from_attributes=True)
+
 
 # GET /users/me
 class GetMeResponse(UserSchema):
@@ -1,23 +1,24 @@
-from typing import Any
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.dao.user_dao import UserDAO
 from app.db.models.user_model import User
 from app.dependencies.auth_dependencies import current_active_user
-from app.dependencies.db import get_db_session
+from app.dependencies.db import get_db_session, read_only
 from app.errors import DomainError
 from app.services.logger.service import Logger
+from app.services.password.service import password_service
 from app.services.user.service import UserService
 from app.web.api.user.schemas import GetMeResponse, UpdatePasswordPayloadSchema
+from app.web.etag import check_not_modified, expected_version
+from app.web.responses import PydanticJSONResponse
 
 router = APIRouter()
 
 
 def get_user_service(db_session: AsyncSession = Depends(get_db_session)) -> UserService:
     dao = UserDAO(session=db_session)
-    return UserService(user_dao=dao)
+    return UserService(user_dao=dao, password_service=password_service)
 
 
 @router.get(
@@ -26,13 +27,17 @@ def get_user_service(db_session: AsyncSession = Depends(get_db_session)) -> User
     summary="User: Me",
     name="user:me",
     response_model=GetMeResponse,
+    dependencies=[Depends(read_only)],
 )
 async def get_me(
+    request: Request,
+    response: Response,
     user: User = Depends(current_active_user),
-) -> Any:
-    """Get current user."""
+) -> PydanticJSONResponse:
+    """Get current user, or 304 when `If-None-Match` holds its current ETag."""
 
-    return user
+    check_not_modified(request, response, user)
+    return PydanticJSONResponse(GetMeResponse.model_validate(user), headers=response.headers)
 
 
 @router.patch(
@@ -42,17 +47,20 @@ async def get_me(
     name="user:patch_password",
 )
 async def patch_user_password(
+    request: Request,
     updates: UpdatePasswordPayloadSchema,
     service: UserService = Depends(get_user_service),
     user: User = Depends(current_active_user),
 ) -> None:
-    """Patch user password."""
+    """Patch user password, only if the user still has the ETag given in `If-Match`."""
 
+    expected_updated_at = expected_version(request, user)
     try:
         await service.change_password(
             user=user,
             old_password=updates.old_password,
             new_password=updates.new_password,
+            expected_updated_at=expected_updated_at,
         )
     except DomainError as e:
         Logger.warning(e)
@@ -3,21 +3,35 @@ import logging
 import sentry_sdk
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import UJSONResponse
-from fastapi.staticfiles import StaticFiles
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.logging import LoggingIntegration
 
 from app.lifespan import lifespan_setup
 from app.settings import settings
 from app.web.api.router import api_router
+from app.web.compression import CompressionMiddleware
+from app.web.metrics import MetricsMiddleware
+from app.web.responses import PydanticJSONResponse
+from app.web.server_timing import ServerTimingMiddleware
+from app.web.static import PrecompressedStaticFiles
+from app.web.tracing import create_trace_sampler
 
 
 def get_app() -> FastAPI:
+    app = FastAPI(
+        title=settings.app_name,
+        lifespan=lifespan_setup,
+        docs_url="/api/docs",
+        redoc_url="/api/redoc",
+        openapi_url="/api/openapi.json",
+        default_response_class=PydanticJSONResponse,
+    )
     if settings.sentry_dsn:
+        sampler = create_trace_sampler(app.routes)
         sentry_sdk.init(
             dsn=settings.sentry_dsn,
-            traces_sample_rate=settings.sentry_sample_rate,
+            traces_sampler=sampler.traces_sampler,
+            before_send_transaction=sampler.before_send_transaction,
             environment=settings.environment,
             integrations=[
                 FastApiIntegration(transaction_style="endpoint"),
@@ -29,14 +43,6 @@ def get_app() -> FastAPI:
                 ),
             ],
         )
-    app = FastAPI(
-        title=settings.app_name,
-        lifespan=lifespan_setup,
-        docs_url="/api/docs",
-        redoc_url="/api/redoc",
-        openapi_url="/api/openapi.json",
-        default_response_class=UJSONResponse,
-    )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=[settings.frontend_url],
@@ -44,8 +50,23 @@ def get_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    static_dir = settings.static_dir
-    app.mount("/static", StaticFiles(directory=static_dir, html=True), name="static")
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.compression_minimum_size,
+        gzip_level=settings.compression_gzip_level,
+        brotli_quality=settings.compression_brotli_quality,
+    )
+    app.add_middleware(ServerTimingMiddleware)
+    # Added last so it wraps every other middleware
+    app.add_middleware(MetricsMiddleware)
+    static_files = PrecompressedStaticFiles(
+        directory=settings.static_dir,
+        html=True,
+        minimum_size=settings.compression_minimum_size,
+        max_age=settings.static_cache_max_age,
+    )
+    app.state.static_files = static_files
+    app.mount("/static", static_files, name="static")
 
     app.include_router(router=api_router, prefix="/api")
 
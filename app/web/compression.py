@@ -0,0 +1,204 @@
+import importlib
+import zlib
+from types import ModuleType
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+def _optional_import(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# Brotli is used when the `brotli` package is installed, gzip otherwise
+brotli = _optional_import("brotli")
+
+_COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+
+def supported_encodings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str, available: tuple[str, ...] | None = None) -> str | None:
+    """
+    Preferred encoding of `available` in an `Accept-Encoding` header.
+
+    The highest quality value wins; at equal quality the order of
+    `available` decides. `identity` and `*` are not taken into account.
+    """
+    if not accept_encoding:
+        return None
+    if available is None:
+        available = supported_encodings()
+
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name.strip().lower()] = quality
+
+    best = None
+    best_quality = 0.0
+    for encoding in available:
+        quality = qualities.get(encoding, 0.0)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class Compressor:
+    """Incremental gzip or brotli compression of a response body."""
+
+    def __init__(self, encoding: str, *, gzip_level: int, brotli_quality: int) -> None:
+        if encoding == "br" and brotli is not None:
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+            self._gzip = None
+        else:
+            self._brotli = None
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self._gzip is not None:
+            return self._gzip.compress(data)
+        return bytes(self._brotli.process(data))
+
+    def finish(self) -> bytes:
+        if self._gzip is not None:
+            return self._gzip.flush()
+        return bytes(self._brotli.finish())
+
+
+def compress(data: bytes, encoding: str, *, gzip_level: int, brotli_quality: int) -> bytes:
+    compressor = Compressor(encoding, gzip_level=gzip_level, brotli_quality=brotli_quality)
+    return compressor.compress(data) + compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    Pure ASGI middleware compressing responses with gzip or brotli.
+
+    The encoding is negotiated with `Accept-Encoding`. Responses that are
+    already encoded, whose type does not compress well, or that are smaller
+    than `minimum_size` are sent as they are. Streamed responses are
+    compressed chunk by chunk. A strong `ETag` is made weak, since the
+    encoded body is no longer byte-for-byte the tagged one.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int,
+        gzip_level: int,
+        brotli_quality: int,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def should_compress(self, headers: MutableHeaders, body: bytes, more_body: bool) -> bool:
+        if "content-encoding" in headers or not is_compressible(headers.get("content-type", "")):
+            return False
+        length = headers.get("content-length")
+        size = int(length) if length is not None else (len(body) if not more_body else self.minimum_size)
+        return size >= self.minimum_size
+
+
+class _CompressingResponder:
+    """Send wrapper of one response, deciding on its first body chunk whether to compress it."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if self._start is None or self._passthrough:
+            await self._send(message)
+            return
+        if message["type"] != "http.response.body":
+            if self._compressor is None:
+                await self._pass_through(self._start, message)
+            else:
+                await self._send(message)
+            return
+
+        if self._compressor is None:
+            await self._start_body(self._start, message)
+            return
+
+        more_body: bool = message.get("more_body", False)
+        data = self._compressor.compress(message.get("body", b""))
+        if not more_body:
+            data += self._compressor.finish()
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    async def _pass_through(self, start: Message, message: Message) -> None:
+        self._passthrough = True
+        await self._send(start)
+        await self._send(message)
+
+    async def _start_body(self, start: Message, message: Message) -> None:
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        headers = MutableHeaders(raw=start["headers"])
+        if not self.middleware.should_compress(headers, body, more_body):
+            await self._pass_through(start, message)
+            return
+
+        middleware = self.middleware
+        self._compressor = Compressor(
+            self.encoding,
+            gzip_level=middleware.gzip_level,
+            brotli_quality=middleware.brotli_quality,
+        )
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+        if more_body:
+            del headers["Content-Length"]
+            await self._send(start)
+            await self._send({"type": "http.response.body", "body": self._compressor.compress(body), "more_body": True})
+            return
+
+        body = self._compressor.compress(body) + self._compressor.finish()
+        headers["Content-Length"] = str(len(body))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": body})
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.db.models.abstract_model import AbstractModel
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def etag_for(model: AbstractModel) -> str:
+    """
+    Weak ETag of a row: its id and `updated_at`, to the microsecond.
+
+    It changes with every update made through `AbstractDAO` or the ORM,
+    without serializing the resource. Being weak, it survives response
+    compression.
+    """
+    return f'W/"{model.id}-{(model.updated_at - _EPOCH) // _MICROSECOND}"'
+
+
+def parse_etag(etag: str) -> tuple[int, datetime] | None:
+    """Id and `updated_at` encoded in an `etag_for` tag, None for any other tag."""
+    opaque = etag.strip().removeprefix("W/").strip('"')
+    key, _, micros = opaque.partition("-")
+    if not key.isdigit() or not micros.isdigit():
+        return None
+    return int(key), _EPOCH + timedelta(microseconds=int(micros))
+
+
+def _matches(header: str, etag: str) -> bool:
+    # Weak comparison for both headers: the tags are versions, not content hashes
+    opaque = etag.removeprefix("W/")
+    tags = [tag.strip() for tag in header.split(",")]
+    return any(tag == "*" or tag.removeprefix("W/") == opaque for tag in tags)
+
+
+def check_not_modified(request: Request, response: Response, model: AbstractModel) -> None:
+    """
+    Tag `response` with the ETag of `model`, or answer 304 Not Modified.
+
+    Call it before building the response body: when `If-None-Match` holds
+    the current tag, an `HTTPException(304)` ends the request there.
+    """
+    etag = etag_for(model)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _matches(if_none_match, etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
+
+def expected_version(request: Request, model: AbstractModel) -> datetime | None:
+    """
+    The `updated_at` an update of `model` must find, from `If-Match`.
+
+    Returns None without the header or with `*`. Answers 412 Precondition
+    Failed right away when no tag of the header is a version of `model`;
+    pass the result as `expected_updated_at` to `AbstractDAO.update`, which
+    checks it atomically.
+    """
+    if_match = request.headers.get("if-match")
+    if if_match is None or if_match.strip() == "*":
+        return None
+
+    for tag in if_match.split(","):
+        parsed = parse_etag(tag)
+        if parsed is not None and parsed[0] == model.id:
+            return parsed[1]
+    raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED)
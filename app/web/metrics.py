@@ -0,0 +1,242 @@
+import asyncio
+import time
+from bisect import bisect_left
+from typing import Sequence
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.auth.user_cache import user_cache
+from app.db.pool import InstrumentedPool, pool_stats
+from app.db.replicas import ReplicaSet
+from app.settings import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100.0, 1_000.0, 10_000.0, 100_000.0, 1_000_000.0, 10_000_000.0)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _sample(name: str, value: float, labels: Labels = ()) -> str:
+    if not labels:
+        return f"{name} {value:g}"
+    rendered = ",".join(f'{key}="{_escape(label)}"' for key, label in labels)
+    return f"{name}{{{rendered}}} {value:g}"
+
+
+def _header(name: str, kind: str, help_text: str) -> list[str]:
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+
+
+class Histogram:
+    """Fixed-bucket histogram, cheap enough to update on every request."""
+
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self, name: str, labels: Labels) -> list[str]:
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        lines = []
+        cumulative = 0
+        for bound, count in zip(bounds, self.counts, strict=True):
+            cumulative += count
+            lines.append(_sample(f"{name}_bucket", cumulative, (*labels, ("le", bound))))
+        lines.append(_sample(f"{name}_sum", self.sum, labels))
+        lines.append(_sample(f"{name}_count", self.count, labels))
+        return lines
+
+
+class RequestMetrics:
+    """Per-route request counters and histograms of this worker process."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.served = 0
+        self.durations: dict[tuple[str, str], Histogram] = {}
+        self.sizes: dict[tuple[str, str], Histogram] = {}
+        self.responses: dict[tuple[str, str, int], int] = {}
+
+    def observe(self, route: str, method: str, status: int, duration: float, size: int) -> None:
+        self.served += 1
+        key = (route, method)
+        durations = self.durations.get(key)
+        if durations is None:
+            durations = self.durations[key] = Histogram(LATENCY_BUCKETS)
+            self.sizes[key] = Histogram(SIZE_BUCKETS)
+        durations.observe(duration)
+        self.sizes[key].observe(size)
+
+        response_key = (route, method, status)
+        self.responses[response_key] = self.responses.get(response_key, 0) + 1
+
+    def clear(self) -> None:
+        self.durations.clear()
+        self.sizes.clear()
+        self.responses.clear()
+
+    def render(self) -> list[str]:
+        lines = _header("http_requests_in_flight", "gauge", "Requests being served.")
+        lines.append(_sample("http_requests_in_flight", self.in_flight))
+
+        lines += _header("http_responses_total", "counter", "Responses by route, method and status.")
+        for (route, method, status), count in sorted(self.responses.items()):
+            labels = (("route", route), ("method", method), ("status", str(status)))
+            lines.append(_sample("http_responses_total", count, labels))
+
+        lines += _header("http_request_duration_seconds", "histogram", "Request latency by route.")
+        for (route, method), histogram in sorted(self.durations.items()):
+            lines += histogram.samples("http_request_duration_seconds", (("route", route), ("method", method)))
+
+        lines += _header("http_response_size_bytes", "histogram", "Response body size by route.")
+        for (route, method), histogram in sorted(self.sizes.items()):
+            lines += histogram.samples("http_response_size_bytes", (("route", route), ("method", method)))
+
+        return lines
+
+
+class LoopLagMonitor:
+    """
+    Measure event loop lag: how late a sleep of `interval` seconds wakes up.
+
+    A lag that grows means something blocks the loop (CPU-bound work or
+    synchronous I/O in a coroutine).
+    """
+
+    def __init__(self, *, interval: float) -> None:
+        self.interval = interval
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._measure_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _measure_forever(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lag = max(time.perf_counter() - start - self.interval, 0.0)
+            self.max_lag = max(self.max_lag, self.lag)
+
+    def render(self) -> list[str]:
+        lines = _header("event_loop_lag_seconds", "gauge", "Delay of the last event loop wake-up.")
+        lines.append(_sample("event_loop_lag_seconds", self.lag))
+        lines += _header("event_loop_lag_seconds_max", "gauge", "Largest event loop delay seen.")
+        lines.append(_sample("event_loop_lag_seconds_max", self.max_lag))
+        return lines
+
+
+request_metrics = RequestMetrics()
+loop_lag = LoopLagMonitor(interval=settings.metrics_loop_lag_interval)
+
+
+def _render_db(app: FastAPI) -> list[str]:
+    engine = getattr(app.state, "db_engine", None)
+    if engine is None or not isinstance(engine.pool, InstrumentedPool):
+        return []
+
+    stats = pool_stats(engine)
+    lines = []
+    for key, kind, help_text in (
+        ("size", "gauge", "Connections the pool keeps open."),
+        ("checked_out", "gauge", "Connections in use."),
+        ("checked_in", "gauge", "Idle connections."),
+        ("overflow", "gauge", "Connections opened above the pool size."),
+        ("acquisitions", "counter", "Connection checkouts."),
+        ("wait_seconds_total", "counter", "Time spent waiting for a connection."),
+        ("wait_seconds_max", "gauge", "Longest wait for a connection."),
+    ):
+        name = f"db_pool_{key}"
+        lines += _header(name, kind, help_text)
+        lines.append(_sample(name, stats[key]))  # type: ignore[literal-required]
+
+    replicas: ReplicaSet | None = getattr(app.state, "db_replicas", None)
+    if replicas is not None and replicas.engines:
+        lines += _header("db_replica_up", "gauge", "Whether a read replica passed its last health check.")
+        for engine, up in zip(replicas.engines, replicas.healthy, strict=True):
+            lines.append(_sample("db_replica_up", int(up), (("replica", f"{engine.url.host}:{engine.url.port}"),)))
+
+    return lines
+
+
+def _render_user_cache() -> list[str]:
+    stats = user_cache.stats()
+    lines = _header("user_cache_hits_total", "counter", "Authenticated users served from the cache.")
+    lines.append(_sample("user_cache_hits_total", stats["hits"]))
+    lines += _header("user_cache_misses_total", "counter", "Authenticated users loaded from the database.")
+    lines.append(_sample("user_cache_misses_total", stats["misses"]))
+    lines += _header("user_cache_size", "gauge", "Cached authenticated users.")
+    lines.append(_sample("user_cache_size", stats["size"]))
+    return lines
+
+
+def render_metrics(app: FastAPI) -> str:
+    """Metrics of this worker process, in the Prometheus text format."""
+    lines = request_metrics.render()
+    lines += loop_lag.render()
+    lines += _render_db(app)
+    lines += _render_user_cache()
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware feeding `request_metrics`.
+
+    Requests are labelled with the name of the route that served them
+    (`user:me`, `post:create`...), so paths with parameters do not create
+    one series each; requests no route matched are labelled `unmatched`.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        metrics = self.metrics
+        metrics.in_flight += 1
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            metrics.in_flight -= 1
+            route = scope.get("route")
+            name = getattr(route, "name", None) or "unmatched"
+            metrics.observe(name, scope["method"], status, duration, size)
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import os
+import random
+import signal
+from pathlib import Path
+
+from app.settings import settings
+from app.web.metrics import RequestMetrics, request_metrics
+
+logger = logging.getLogger(settings.logger_name)
+
+_STATM = Path("/proc/self/statm")
+
+
+def resident_memory_mb() -> float | None:
+    """Resident memory of this process, None where `/proc` is not available."""
+    try:
+        pages = int(_STATM.read_text().split()[1])
+    except OSError:
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class WorkerRecycler:
+    """
+    Restart this worker once it has served enough requests or grown too big.
+
+    The worker sends itself SIGTERM: uvicorn stops accepting connections,
+    lets in-flight requests finish and exits, and its supervisor starts a
+    fresh process. Each worker draws its own request limit within
+    `max_requests_jitter`, so workers started together are not all
+    restarted at once. A limit of 0 disables the matching check.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_requests: int,
+        max_requests_jitter: int,
+        max_memory_mb: int,
+        check_interval: float,
+        metrics: RequestMetrics = request_metrics,
+    ) -> None:
+        self.max_requests = max_requests + random.randint(0, max_requests_jitter) if max_requests else 0  # noqa: S311
+        self.max_memory_mb = max_memory_mb
+        self.check_interval = check_interval
+        self.metrics = metrics
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.max_requests or self.max_memory_mb)
+
+    async def start(self) -> None:
+        if self._task is None and self.enabled:
+            self._task = asyncio.create_task(self._check_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def reason(self) -> str | None:
+        """Why this worker should be restarted, None while it should not."""
+        if self.max_requests and self.metrics.served >= self.max_requests:
+            return f"served {self.metrics.served} requests"
+        if self.max_memory_mb:
+            memory = resident_memory_mb()
+            if memory is not None and memory >= self.max_memory_mb:
+                return f"uses {memory:.0f} MB"
+        return None
+
+    async def _check_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            reason = self.reason()
+            if reason is not None:
+                logger.info("Restarting worker %d: it %s.", os.getpid(), reason)
+                os.kill(os.getpid(), signal.SIGTERM)
+                return
+
+
+def create_worker_recycler() -> WorkerRecycler:
+    """
+    Recycler configured from `Settings`.
+
+    It is disabled with a single process: there is no supervisor to start
+    a replacement, so stopping the worker would stop the server.
+    """
+    multiprocess = settings.workers > 1 and not settings.reload
+    return WorkerRecycler(
+        max_requests=settings.server_max_requests if multiprocess else 0,
+        max_requests_jitter=settings.server_max_requests_jitter,
+        max_memory_mb=settings.server_max_memory_mb if multiprocess else 0,
+        check_interval=settings.server_recycle_check_interval,
+    )
@@ -0,0 +1,19 @@
+from typing import Any
+
+import pydantic_core
+from starlette.responses import JSONResponse
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response serialized by pydantic-core, straight to bytes.
+
+    Models, and lists or dicts of them, are serialized as `model_dump_json`
+    would, without being dumped to dicts first; datetimes, enums, UUIDs and
+    decimals are handled natively. Endpoints returning an instance of this
+    class with a validated schema skip FastAPI's own dump of the response
+    model, while `response_model` still documents it.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
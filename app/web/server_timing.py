@@ -0,0 +1,40 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.db.instrumentation import track_queries
+
+
+class ServerTimingMiddleware:
+    """
+    Pure ASGI middleware adding a `Server-Timing` header to every response.
+
+    It reports the database statements the request ran before its response
+    started (`db`, with their count) and the time spent in the application
+    until then (`app`), both in milliseconds, so browsers' developer tools
+    show them next to the network timings.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    elapsed = (time.perf_counter() - start) * 1000
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration * 1000:.2f};desc="queries={stats.count}", app;dur={elapsed:.2f}',
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,107 @@
+import mimetypes
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, PathLike, StaticFiles
+from starlette.types import Scope
+
+from app.web.compression import choose_encoding, compress, is_compressible, supported_encodings
+
+
+@dataclass(frozen=True)
+class _Precompressed:
+
+    mtime: float
+    size: int
+    media_type: str
+    bodies: dict[str, bytes]
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    Static files served with long-lived caching headers and precompressed.
+
+    `precompress` compresses every compressible file of at least
+    `minimum_size` bytes once, at the highest level, and keeps the results
+    in memory; they are served to clients accepting the encoding, and
+    dropped when the file changes on disk. Every response carries `ETag`,
+    `Last-Modified` and a `Cache-Control` of `max_age` seconds, so repeat
+    fetches are answered with a 304.
+    """
+
+    def __init__(self, *, minimum_size: int, max_age: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.minimum_size = minimum_size
+        self.cache_control = f"public, max-age={max_age}"
+        self._precompressed: dict[str, _Precompressed] = {}
+
+    def precompress(self) -> int:
+        """Compress the eligible files, returning how many were."""
+        self._precompressed.clear()
+        for directory in self.all_directories:
+            for root, _, files in os.walk(directory):
+                for name in files:
+                    self._precompress_file(Path(root) / name)
+        return len(self._precompressed)
+
+    def _precompress_file(self, path: Path) -> None:
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        stat_result = path.stat()
+        if not is_compressible(media_type) or stat_result.st_size < self.minimum_size:
+            return
+
+        data = path.read_bytes()
+        self._precompressed[str(path.resolve())] = _Precompressed(
+            mtime=stat_result.st_mtime,
+            size=stat_result.st_size,
+            media_type=media_type,
+            bodies={
+                encoding: compress(data, encoding, gzip_level=9, brotli_quality=11)
+                for encoding in supported_encodings()
+            },
+        )
+
+    def file_response(
+        self,
+        full_path: PathLike,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        precompressed = self._precompressed.get(str(Path(full_path).resolve()))
+        if precompressed is not None and (
+            precompressed.mtime != stat_result.st_mtime or precompressed.size != stat_result.st_size
+        ):
+            precompressed = None
+
+        encoding = None
+        if precompressed is not None:
+            encoding = choose_encoding(request_headers.get("accept-encoding", ""), tuple(precompressed.bodies))
+        if precompressed is None or encoding is None:
+            response = super().file_response(full_path, stat_result, scope, status_code)
+            response.headers["Cache-Control"] = self.cache_control
+            if precompressed is not None:
+                response.headers.add_vary_header("Accept-Encoding")
+            return response
+
+        identity = FileResponse(full_path, stat_result=stat_result)
+        response = Response(
+            precompressed.bodies[encoding],
+            status_code=status_code,
+            headers={
+                "ETag": f'{identity.headers["etag"][:-1]}-{encoding}"',
+                "Last-Modified": identity.headers["last-modified"],
+                "Cache-Control": self.cache_control,
+                "Content-Encoding": encoding,
+                "Vary": "Accept-Encoding",
+            },
+            media_type=precompressed.media_type,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,142 @@
+import random
+import time
+from datetime import datetime
+from typing import Any, Sequence
+
+from sentry_sdk.types import Event, Hint
+from sentry_sdk.utils import transaction_from_function
+from starlette.routing import BaseRoute, Match, Route
+
+from app.settings import settings
+
+# Trace statuses Sentry gives to 5xx responses and unhandled exceptions
+_ERROR_STATUSES = frozenset(("internal_error", "unknown_error", "unavailable", "deadline_exceeded", "data_loss"))
+
+
+class TokenBucket:
+    """Allow `rate` operations per second, with bursts of up to `capacity`."""
+
+    def __init__(self, *, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def take(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class TraceSampler:
+    """
+    Decide which transactions are recorded and sent to Sentry.
+
+    Recording spans is what costs CPU, so only a share of the requests is
+    recorded (`traces_sampler`): the route's rate, raised to `record_rate`.
+    Whether a request failed or was slow is only known once it is over, so
+    the final decision is taken when the transaction is sent
+    (`before_send_transaction`): recorded requests that failed or were slow
+    are always kept, the others so that the route's rate is met overall.
+    Routes whose rate is 0 are never recorded, and every kept transaction
+    takes a token from a global budget of `traces_per_second`.
+    """
+
+    def __init__(
+        self,
+        routes: Sequence[BaseRoute],
+        *,
+        default_rate: float,
+        route_rates: dict[str, float],
+        record_rate: float,
+        slow_threshold: float,
+        traces_per_second: float,
+    ) -> None:
+        self.routes = routes
+        self.default_rate = default_rate
+        self.route_rates = route_rates
+        self.record_rate = record_rate
+        self.slow_threshold = slow_threshold
+        self.budget = TokenBucket(rate=traces_per_second, capacity=max(traces_per_second, 1.0))
+        self._route_names: dict[str, str] = {}
+
+    def traces_sampler(self, sampling_context: dict[str, Any]) -> float:
+        parent_sampled = sampling_context.get("parent_sampled")
+        if parent_sampled is not None:
+            return float(parent_sampled)
+
+        route_name = None
+        scope = sampling_context.get("asgi_scope")
+        if scope is not None:
+            for route in self.routes:
+                match, _ = route.matches(scope)
+                if match == Match.FULL:
+                    route_name = getattr(route, "name", None)
+                    break
+        return self.recorded_share(self.rate(route_name))
+
+    def before_send_transaction(self, event: Event, hint: Hint) -> Event | None:
+        if self.is_error(event) or self.duration(event) >= self.slow_threshold:
+            return event if self.budget.take() else None
+
+        rate = self.rate(self.route_name(event.get("transaction")))
+        if rate <= 0:
+            return None
+        if random.random() < rate / self.recorded_share(rate) and self.budget.take():  # noqa: S311
+            return event
+        return None
+
+    def recorded_share(self, rate: float) -> float:
+        return max(rate, self.record_rate) if rate > 0 else 0.0
+
+    def rate(self, route_name: str | None) -> float:
+        if route_name is None:
+            return self.default_rate
+        return self.route_rates.get(route_name, self.default_rate)
+
+    def route_name(self, transaction: str | None) -> str | None:
+        """Route name of a transaction named after its endpoint (`transaction_style="endpoint"`)."""
+        if not self._route_names:
+            self._route_names = {
+                name: route.name
+                for route in self.routes
+                if isinstance(route, Route) and (name := transaction_from_function(route.endpoint)) is not None
+            }
+        return self._route_names.get(transaction or "")
+
+    @staticmethod
+    def is_error(event: Event) -> bool:
+        trace: dict[str, Any] = event.get("contexts", {}).get("trace", {})
+        return (
+            trace.get("status") in _ERROR_STATUSES
+            or trace.get("data", {}).get("http.response.status_code", 0) >= 500
+        )
+
+    @staticmethod
+    def duration(event: Event) -> float:
+        start, end = event.get("start_timestamp"), event.get("timestamp")
+        if start is None or end is None:
+            return 0.0
+        return (_as_datetime(end) - _as_datetime(start)).total_seconds()
+
+
+def _as_datetime(value: Any) -> datetime:
+    # Recent SDKs hand the timestamps over already serialized
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def create_trace_sampler(routes: Sequence[BaseRoute]) -> TraceSampler:
+    return TraceSampler(
+        routes,
+        default_rate=settings.sentry_sample_rate,
+        route_rates=settings.sentry_route_sample_rates,
+        record_rate=settings.sentry_record_rate,
+        slow_threshold=settings.sentry_slow_request_threshold,
+        traces_per_second=settings.sentry_traces_per_second,
+    )
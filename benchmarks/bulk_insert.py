@@ -0,0 +1,88 @@
+"""
+Compare `AbstractDAO.create` in a loop against `AbstractDAO.create_many`.
+
+Runs against the database configured in `Settings`, inside a transaction
+that is rolled back at the end of each measure.
+
+Usage: python -m benchmarks.bulk_insert [rows ...]
+"""
+
+import asyncio
+import sys
+import time
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.dao.post_dao import DAOPostCreateDTO, PostDAO
+from app.db.models.user_model import User
+from app.settings import settings
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def _posts(author_id: int, count: int) -> list[DAOPostCreateDTO]:
+    return [
+        DAOPostCreateDTO(
+            title=f"Post {index}",
+            content="Lorem ipsum dolor sit amet",
+            published=index % 2 == 0,
+            author_id=author_id,
+            created_by=author_id,
+        )
+        for index in range(count)
+    ]
+
+
+async def _create_loop(dao: PostDAO, items: list[DAOPostCreateDTO]) -> None:
+    for item in items:
+        await dao.create(item)
+
+
+async def _create_many(dao: PostDAO, items: list[DAOPostCreateDTO]) -> None:
+    await dao.create_many(items)
+
+
+async def _measure(
+    session_factory: async_sessionmaker[AsyncSession],
+    count: int,
+    run: Callable[[PostDAO, list[DAOPostCreateDTO]], Awaitable[None]],
+) -> float:
+    async with session_factory() as session, session.begin():
+        author = User(
+            email="bench@example.com",
+            hashed_password="-",  # noqa: S106
+            first_name="Bench",
+            last_name="Mark",
+            permissions=[],
+        )
+        session.add(author)
+        await session.flush()
+
+        items = _posts(author.id, count)
+        start = time.perf_counter()
+        await run(PostDAO(session), items)
+        elapsed = time.perf_counter() - start
+
+        await session.rollback()
+
+    return count / elapsed
+
+
+async def main(sizes: list[int]) -> None:
+    engine = create_async_engine(str(settings.db_url))
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    sys.stdout.write(f"{'rows':>8} {'create loop':>14} {'create_many':>14} {'speedup':>8}\n")
+    for count in sizes:
+        loop_rate = await _measure(session_factory, count, _create_loop)
+        many_rate = await _measure(session_factory, count, _create_many)
+        sys.stdout.write(
+            f"{count:>8} {loop_rate:>10.0f} r/s {many_rate:>10.0f} r/s {many_rate / loop_rate:>7.1f}x\n",
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES))
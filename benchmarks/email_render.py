@@ -0,0 +1,56 @@
+"""
+Compare per-render template reads against the compiled template cache.
+
+The baseline reads the file and runs `str.format` on every render, as
+`EmailService` used to; the cached path is what it does now.
+
+Usage: python -m benchmarks.email_render [renders ...]
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from app.services.email.service import EmailService
+from app.services.email.template import TemplateCache
+
+DEFAULT_COUNTS = [1_000, 10_000, 100_000]
+
+DATA = {
+    "user": "Jane Doe",
+    "url": "https://example.com/reset-password?reset_token=token&email=jane@example.com",
+    "reset_mail_link_expiracy": 24,
+    "static_host": "https://static.example.com",
+}
+
+
+def _read_and_format(path: Path) -> str:
+    with path.open("r") as f:
+        template = f.read()
+    return template.format(**DATA)
+
+
+def _measure(count: int, render: Callable[[], str]) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        render()
+    return count / (time.perf_counter() - start)
+
+
+def main(counts: list[int]) -> None:
+    path = EmailService.template_dir() / "reset_password.html"
+    cache = TemplateCache()
+
+    sys.stdout.write(f"{'renders':>8} {'read + format':>16} {'cached':>14} {'speedup':>8}\n")
+    for count in counts:
+        uncached_rate = _measure(count, lambda: _read_and_format(path))
+        cached_rate = _measure(count, lambda: cache.get(path).render(DATA))
+        sys.stdout.write(
+            f"{count:>8} {uncached_rate:>12.0f} r/s {cached_rate:>10.0f} r/s "
+            f"{cached_rate / uncached_rate:>7.1f}x\n",
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_COUNTS)
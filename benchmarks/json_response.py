@@ -0,0 +1,85 @@
+"""
+Compare the ways of rendering a response model to JSON bytes.
+
+`dict + ujson` is what FastAPI did with `UJSONResponse`: the validated
+model is dumped to JSON-compatible dicts, which ujson then encodes.
+`model_dump_json` is what `PydanticJSONResponse` does when an endpoint
+returns it with a schema: the model is serialized straight to bytes.
+Payloads are lists of users, with a datetime and an enum per item.
+
+Usage: python -m benchmarks.json_response [items ...]
+"""
+
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Callable
+
+from fastapi.responses import UJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+from app.consts import Permission
+from app.web.api.user.schemas import UserRead
+from app.web.responses import PydanticJSONResponse
+
+DEFAULT_ITEMS = [1, 100, 10_000]
+
+
+class _Item(UserRead):
+    last_login: datetime
+    role: Permission
+
+
+class _Page(BaseModel):
+    items: list[_Item]
+
+
+_ADAPTER = TypeAdapter(_Page)
+
+
+def _payload(items: int) -> _Page:
+    now = datetime.now(UTC)
+    return _Page(
+        items=[
+            _Item(
+                id=index,
+                first_name="Ada",
+                last_name=f"Lovelace {index}",
+                email=f"user{index}@example.com",
+                permissions=[Permission.CREATE_USER],
+                last_login=now - timedelta(minutes=index),
+                role=Permission.ADMINISTRATE,
+            )
+            for index in range(items)
+        ],
+    )
+
+
+def _dict_ujson(page: _Page) -> Response:
+    return UJSONResponse(_ADAPTER.dump_python(page, mode="json"))
+
+
+def _model_dump_json(page: _Page) -> Response:
+    return PydanticJSONResponse(page)
+
+
+def _measure(render: Callable[[_Page], Response], page: _Page) -> float:
+    rounds = max(10, 100_000 // max(len(page.items), 1))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        render(page)
+    return (time.perf_counter() - start) / rounds * 1_000_000
+
+
+def main(items_list: list[int]) -> None:
+    sys.stdout.write(f"{'items':>7} {'dict + ujson':>14} {'model_dump_json':>16} {'speedup':>8}\n")
+    for items in items_list:
+        page = _payload(items)
+        baseline = _measure(_dict_ujson, page)
+        direct = _measure(_model_dump_json, page)
+        sys.stdout.write(f"{items:>7} {baseline:>11.1f} us {direct:>13.1f} us {baseline / direct:>7.1f}x\n")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_ITEMS)
@@ -0,0 +1,61 @@
+"""
+Measure the per-call cost of `Logger.info` on the calling thread.
+
+The baseline is the previous behaviour: stack and exception info captured on
+every call, formatted and written synchronously. It is compared with the
+current defaults, going through the `LogQueue` listener thread.
+
+Usage: python -m benchmarks.logging_overhead [calls ...]
+"""
+
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from app.services.logger.queue import log_queue
+from app.services.logger.service import Logger, logger
+
+DEFAULT_CALLS = [1_000, 10_000, 100_000]
+
+
+def _measure(calls: int, log: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        log()
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def _baseline() -> None:
+    Logger.info("User bench@example.com logged in.", exc_info=True, stack_info=True)
+
+
+def _current() -> None:
+    Logger.info("User bench@example.com logged in.")
+
+
+def main(calls_list: list[int]) -> None:
+    with Path(os.devnull).open("w") as devnull:
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+        logger.handlers = [handler]
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+
+        sys.stdout.write(f"{'calls':>8} {'sync + stack':>14} {'queued':>10} {'speedup':>8}\n")
+        for calls in calls_list:
+            baseline = _measure(calls, _baseline)
+
+            log_queue.start(logger)
+            current = _measure(calls, _current)
+            log_queue.stop()
+
+            sys.stdout.write(
+                f"{calls:>8} {baseline:>11.1f} us {current:>7.1f} us {baseline / current:>7.1f}x\n",
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_CALLS)
@@ -0,0 +1,58 @@
+"""
+Measure the per-request cost of `MetricsMiddleware`.
+
+A bare ASGI application is called directly, then wrapped in the middleware,
+without any server or client in between, so the difference is the time the
+middleware adds to each request.
+
+Usage: python -m benchmarks.metrics_overhead [requests ...]
+"""
+
+import asyncio
+import sys
+import time
+
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.web.metrics import MetricsMiddleware, RequestMetrics
+
+DEFAULT_REQUESTS = [10_000, 100_000]
+
+ROUTE = APIRoute("/users/me", lambda: None, name="user:me")
+
+
+async def _app(scope: Scope, receive: Receive, send: Send) -> None:
+    scope["route"] = ROUTE
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b'{"id":1}'})
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message: Message) -> None:
+    return
+
+
+async def _measure(requests: int, app: ASGIApp) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        scope: Scope = {"type": "http", "method": "GET", "path": "/api/users/me"}
+        await app(scope, _receive, _send)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def main(requests_list: list[int]) -> None:
+    wrapped = MetricsMiddleware(_app, RequestMetrics())
+
+    sys.stdout.write(f"{'requests':>9} {'bare':>9} {'metrics':>9} {'overhead':>9}\n")
+    for requests in requests_list:
+        bare = await _measure(requests, _app)
+        measured = await _measure(requests, wrapped)
+        sys.stdout.write(f"{requests:>9} {bare:>6.2f} us {measured:>6.2f} us {measured - bare:>6.2f} us\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or DEFAULT_REQUESTS))
@@ -0,0 +1,150 @@
+"""
+Compare OFFSET paging of full `Post` models against the keyset post listing.
+
+Seeds `rows` posts (1M by default) inside a transaction that is rolled back
+at the end, then times pages of `PAGE_SIZE` posts sorted by `created_at`
+at increasing depths: full `Post` models selected with an OFFSET, against
+`PostDAO.get_list_page` with the cursor of the row before the page. The
+listing filtered on one author is timed the same way. Runs against the
+database configured in `Settings`, which must be migrated.
+
+Usage: python -m benchmarks.post_listing [rows] [repeats]
+"""
+
+import asyncio
+import sys
+import time
+from statistics import quantiles
+from typing import Awaitable, Callable
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.dao.post_dao import DAOPostListFilters, PostDAO
+from app.db.models import load_all_models
+from app.db.models.post_model import Post
+from app.db.pagination import SortSpec, encode_cursor
+from app.settings import settings
+
+DEFAULT_ROWS = 1_000_000
+DEFAULT_REPEATS = 50
+AUTHORS = 100
+PAGE_SIZE = 20
+SORT: SortSpec = [("created_at", "desc"), ("id", "desc")]
+
+
+async def _seed(session: AsyncSession, rows: int) -> int:
+    await session.execute(
+        text(
+            'INSERT INTO "user" (email, hashed_password, first_name, last_name, permissions, '
+            "is_active, is_superuser, is_verified) "
+            "SELECT 'bench' || n || '@example.com', '-', 'Bench', 'Mark', '{}', true, false, true "
+            "FROM generate_series(1, :authors) n",
+        ),
+        {"authors": AUTHORS},
+    )
+    result = await session.execute(text("""SELECT min(id) FROM "user" WHERE email LIKE 'bench%'"""))
+    first_author = result.scalar_one()
+    await session.execute(
+        text(
+            "INSERT INTO post (title, content, published, author_id, is_active, created_at) "
+            "SELECT 'Post ' || n, 'Lorem ipsum dolor sit amet', n % 2 = 0, :first_author + n % :authors, "
+            "n % 7 <> 0, now() - n * interval '30 seconds' "
+            "FROM generate_series(1, :rows) n",
+        ),
+        {"first_author": first_author, "authors": AUTHORS, "rows": rows},
+    )
+    await session.execute(text("ANALYZE post"))
+    return int(first_author)
+
+
+async def _cursor_at(session: AsyncSession, depth: int, author_id: int | None) -> str | None:
+    """Cursor of the listing page starting at `depth`."""
+    if depth == 0:
+        return None
+    row = (
+        await session.execute(
+            text(
+                "SELECT created_at, id FROM post WHERE is_active IS TRUE "
+                "AND (CAST(:author_id AS INTEGER) IS NULL OR author_id = :author_id) "
+                "ORDER BY created_at DESC, id DESC OFFSET :offset LIMIT 1",
+            ),
+            {"author_id": author_id, "offset": depth - 1},
+        )
+    ).one()
+    return encode_cursor(sort=SORT, values=list(row))
+
+
+async def _timings(run: Callable[[], Awaitable[object]], repeats: int) -> tuple[float, float]:
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await run()
+        durations.append((time.perf_counter() - start) * 1000)
+    cuts = quantiles(durations, n=20)
+    return cuts[9], cuts[18]
+
+
+async def _measure(
+    session: AsyncSession,
+    label: str,
+    depth: int,
+    repeats: int,
+    author_id: int | None = None,
+) -> None:
+    dao = PostDAO(session)
+    cursor = await _cursor_at(session, depth, author_id)
+    filters = DAOPostListFilters(author_id=author_id)
+
+    query = (
+        select(Post)
+        .where(Post.is_active.is_(True), *(() if author_id is None else (Post.author_id == author_id,)))
+        .order_by(Post.created_at.desc(), Post.id.desc())
+        .offset(depth)
+        .limit(PAGE_SIZE)
+    )
+
+    async def offset_page() -> object:
+        return (await session.execute(query)).scalars().fetchall()
+
+    async def keyset_page() -> object:
+        return await dao.get_list_page(filters=filters, sort=SORT, limit=PAGE_SIZE, cursor=cursor)
+
+    offset_p50, offset_p95 = await _timings(offset_page, repeats)
+    keyset_p50, keyset_p95 = await _timings(keyset_page, repeats)
+    sys.stdout.write(
+        f"{label:>8} {depth:>8} {offset_p50:>9.2f} {offset_p95:>9.2f} {keyset_p50:>9.2f} {keyset_p95:>9.2f}\n",
+    )
+
+
+async def main(rows: int, repeats: int) -> None:
+    load_all_models()
+    engine = create_async_engine(str(settings.db_url))
+
+    async with AsyncSession(engine) as session, session.begin():
+        start = time.perf_counter()
+        first_author = await _seed(session, rows)
+        sys.stdout.write(f"Seeded {rows} posts in {time.perf_counter() - start:.1f}s\n\n")
+
+        sys.stdout.write(
+            f"{'listing':>8} {'depth':>8} {'offset':>9} {'p95':>9} {'keyset':>9} {'p95':>9}  (ms)\n",
+        )
+        depths = [0, rows // 100, rows // 10, rows * 8 // 10]
+        for depth in depths:
+            await _measure(session, "all", depth, repeats)
+        for depth in [0, rows // AUTHORS // 2]:
+            await _measure(session, "author", depth, repeats, author_id=first_author)
+
+        await session.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(
+        main(
+            args[0] if args else DEFAULT_ROWS,
+            args[1] if len(args) > 1 else DEFAULT_REPEATS,
+        ),
+    )
@@ -0,0 +1,138 @@
+"""
+Compare `ILIKE '%term%'` against `PostDAO.search` on the post title and content.
+
+Seeds `rows` posts (1M by default) of words drawn from a skewed vocabulary,
+from `word0` (in most posts) to `word999` (in a few hundred), inside a transaction
+that is rolled back at the end. Each query is then run `repeats` times for
+its first page of `PAGE_SIZE` posts, and for the search its second page too,
+and the p50 and p95 latencies are reported. Runs against the database
+configured in `Settings`, which must be migrated.
+
+Usage: python -m benchmarks.post_search [rows] [repeats]
+"""
+
+import asyncio
+import sys
+import time
+from statistics import quantiles
+from typing import Awaitable, Callable
+
+from sqlalchemy import or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.db.dao.post_dao import LIST_COLUMNS, PostDAO
+from app.db.models import load_all_models
+from app.db.models.post_model import Post
+from app.settings import settings
+
+DEFAULT_ROWS = 1_000_000
+DEFAULT_REPEATS = 20
+PAGE_SIZE = 20
+VOCABULARY = 1_000
+
+# Search terms, and the substring matched by the ILIKE baseline
+QUERIES = {
+    "common": ("word3", "word3"),
+    "uncommon": ("word120", "word120"),
+    "rare": ("word870", "word870"),
+    "absent": ("word1000", "word1000"),
+    "two terms": ("word15 word400", "word400"),
+    "phrase": ('"word1 word2"', "word1 word2"),
+}
+
+
+async def _seed(session: AsyncSession, rows: int) -> None:
+    # Low word numbers are the most frequent: the index is cubed from a uniform draw
+    words = (
+        "(SELECT string_agg('word' || floor(power(random(), 3) * :vocabulary)::int, ' ') "
+        "FROM generate_series(1, {count} + n * 0))"
+    )
+    await session.execute(text("SELECT setseed(0.5)"))
+    await session.execute(
+        text(
+            'INSERT INTO "user" (email, hashed_password, first_name, last_name, permissions, '
+            "is_active, is_superuser, is_verified) "
+            "VALUES ('bench@example.com', '-', 'Bench', 'Mark', '{}', true, false, true)",
+        ),
+    )
+    await session.execute(
+        text(
+            "INSERT INTO post (title, content, published, author_id, is_active) "  # noqa: S608
+            f"SELECT {words.format(count=4)}, {words.format(count=30)}, true, "
+            """(SELECT id FROM "user" WHERE email = 'bench@example.com'), n % 7 <> 0 """
+            "FROM generate_series(1, :rows) n",
+        ),
+        {"vocabulary": VOCABULARY, "rows": rows},
+    )
+    # Rows inserted since the last VACUUM wait in the GIN pending list, which searches scan linearly
+    await session.execute(text("SELECT gin_clean_pending_list('ix_post_active_search_vector')"))
+    await session.execute(text("ANALYZE post"))
+
+
+async def _timings(run: Callable[[], Awaitable[object]], repeats: int) -> tuple[float, float]:
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await run()
+        durations.append((time.perf_counter() - start) * 1000)
+    cuts = quantiles(durations, n=20)
+    return cuts[9], cuts[18]
+
+
+async def _measure(session: AsyncSession, label: str, terms: str, substring: str, repeats: int) -> None:
+    dao = PostDAO(session)
+    pattern = f"%{substring}%"
+    ilike = (
+        select(*LIST_COLUMNS)
+        .where(Post.is_active.is_(True), or_(Post.title.ilike(pattern), Post.content.ilike(pattern)))
+        .order_by(Post.id.desc())
+        .limit(PAGE_SIZE)
+    )
+    cursor = (await dao.search(terms, limit=PAGE_SIZE)).next_cursor
+
+    async def ilike_page() -> object:
+        return (await session.execute(ilike)).all()
+
+    async def search_page() -> object:
+        return await dao.search(terms, limit=PAGE_SIZE)
+
+    async def search_next_page() -> object:
+        return await dao.search(terms, limit=PAGE_SIZE, cursor=cursor)
+
+    ilike_p50, ilike_p95 = await _timings(ilike_page, repeats)
+    search_p50, search_p95 = await _timings(search_page, repeats)
+    next_p50, next_p95 = await _timings(search_next_page, repeats)
+    sys.stdout.write(
+        f"{label:>10} {ilike_p50:>9.1f} {ilike_p95:>9.1f} {search_p50:>9.1f} {search_p95:>9.1f} "
+        f"{next_p50:>9.1f} {next_p95:>9.1f}\n",
+    )
+
+
+async def main(rows: int, repeats: int) -> None:
+    load_all_models()
+    engine = create_async_engine(str(settings.db_url))
+
+    async with AsyncSession(engine) as session, session.begin():
+        start = time.perf_counter()
+        await _seed(session, rows)
+        sys.stdout.write(f"Seeded {rows} posts in {time.perf_counter() - start:.1f}s\n\n")
+
+        sys.stdout.write(
+            f"{'query':>10} {'ilike':>9} {'p95':>9} {'search':>9} {'p95':>9} {'page 2':>9} {'p95':>9}  (ms)\n",
+        )
+        for label, (terms, substring) in QUERIES.items():
+            await _measure(session, label, terms, substring, repeats)
+
+        await session.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    asyncio.run(
+        main(
+            args[0] if args else DEFAULT_ROWS,
+            args[1] if len(args) > 1 else DEFAULT_REPEATS,
+        ),
+    )
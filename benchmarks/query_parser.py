@@ -0,0 +1,85 @@
+"""
+Compare `build_nested_structure` with the previous benedict-based parser.
+
+The previous parser ran a regex per key, set a benedict keypath and went
+through a JSON round trip. It needs `python-benedict`, which is no longer a
+dependency: install it to get the comparison, otherwise only the current
+parser is measured.
+
+Usage: python -m benchmarks.query_parser [iterations]
+"""
+
+import json
+import re
+import sys
+import time
+from typing import Any, Callable
+
+from starlette.datastructures import QueryParams
+
+from app.dependencies.validate_query_params import build_nested_structure
+
+QUERIES = {
+    "flat": "page=2&limit=20&sort=created_at",
+    "filters": (
+        "filter[title][ilike]=report&filter[published]=true"
+        "&filter[created_at][gte]=2024-01-01&sort[0]=-created_at&sort[1]=id&page=3"
+    ),
+    "nested lists": "&".join(
+        f"filter[or][{index}][author][email]=user{index}@example.com" for index in range(10)
+    ),
+}
+
+
+def _legacy_parser() -> Callable[[QueryParams], dict[str, Any]] | None:
+    try:
+        from benedict import benedict  # type: ignore  # noqa: PLC0415
+    except ImportError:
+        return None
+
+    def create_path(params: list[str]) -> str:
+        path_parts = []
+        for item in params:
+            if str(item).isdigit():
+                path_parts.append(f"[{item}]")
+            else:
+                path_parts.append(f".{item}" if path_parts else item)
+        return "".join(path_parts)
+
+    def parse(data: QueryParams) -> dict[str, Any]:
+        result = benedict()
+        for key, value in data.items():
+            result[create_path(re.findall(r"([^\[\]]+)", key))] = value
+        return json.loads(result.to_json())  # type: ignore[no-any-return]
+
+    return parse
+
+
+def _measure(iterations: int, parse: Callable[[QueryParams], dict[str, Any]], query: str) -> float:
+    params = QueryParams(query)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse(params)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main(iterations: int) -> None:
+    legacy = _legacy_parser()
+    if legacy is None:
+        sys.stdout.write("python-benedict is not installed, measuring the current parser only.\n")
+
+    sys.stdout.write(f"{'query':>14} {'benedict':>12} {'current':>10} {'speedup':>8}\n")
+    for name, query in QUERIES.items():
+        current = _measure(iterations, build_nested_structure, query)
+        if legacy is None:
+            sys.stdout.write(f"{name:>14} {'-':>12} {current:>7.1f} us {'-':>8}\n")
+            continue
+
+        baseline = _measure(iterations, legacy, query)
+        sys.stdout.write(
+            f"{name:>14} {baseline:>9.1f} us {current:>7.1f} us {baseline / current:>7.1f}x\n",
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
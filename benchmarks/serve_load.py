@@ -0,0 +1,117 @@
+"""
+Load-test the server started the previous way and with `server_options`.
+
+Each configuration is started in a subprocess on a free port, then client
+processes hammer `/api/openapi.json` (public, cached after the first request,
+no database access) over keep-alive connections for a few seconds.
+Throughput, latency percentiles and rejected requests (503, above
+`server_limit_concurrency`) are reported.
+
+Usage: python -m benchmarks.serve_load [seconds] [connections]
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from statistics import quantiles
+
+import httpx
+
+CLIENT_PROCESSES = 2
+URL = "http://127.0.0.1:{port}/api/openapi.json"
+
+SERVERS = {
+    "previous": (
+        "import uvicorn; from app.settings import settings; "
+        "uvicorn.run('app.web.application:get_app', workers=settings.workers_count, host=settings.host, "
+        "port=settings.port, log_level='warning', factory=True)"
+    ),
+    "server_options": (
+        "import uvicorn; from app.__main__ import server_options; "
+        "uvicorn.run('app.web.application:get_app', **(server_options() | {'log_level': 'warning'}))"
+    ),
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _wait_until_up(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url)
+        except httpx.TransportError:
+            time.sleep(0.2)
+            continue
+        return
+    raise RuntimeError(f"Server did not start on {url}")
+
+
+async def _connection(url: str, until: float, latencies: list[float], rejected: list[int]) -> None:
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < until:
+            start = time.perf_counter()
+            response = await client.get(url)
+            if response.status_code == 503:
+                rejected.append(1)
+                continue
+            latencies.append(time.perf_counter() - start)
+
+
+def _client(url: str, seconds: float, connections: int) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    rejected: list[int] = []
+    until = time.monotonic() + seconds
+
+    async def run() -> None:
+        await asyncio.gather(*(_connection(url, until, latencies, rejected) for _ in range(connections)))
+
+    asyncio.run(run())
+    return latencies, len(rejected)
+
+
+def _load(port: int, seconds: float, connections: int) -> tuple[float, float, float, int]:
+    url = URL.format(port=port)
+    with ProcessPoolExecutor(CLIENT_PROCESSES) as pool:
+        futures = [
+            pool.submit(_client, url, seconds, connections // CLIENT_PROCESSES) for _ in range(CLIENT_PROCESSES)
+        ]
+        results = [future.result() for future in futures]
+
+    latencies = sorted(latency for result in results for latency in result[0])
+    rejected = sum(result[1] for result in results)
+    percentiles = quantiles(latencies, n=100)
+    return len(latencies) / seconds, percentiles[49] * 1000, percentiles[98] * 1000, rejected
+
+
+def main(seconds: float, connections: int) -> None:
+    sys.stdout.write(f"{'server':>15} {'req/s':>8} {'p50':>9} {'p99':>9} {'503s':>6}\n")
+    for name, code in SERVERS.items():
+        port = _free_port()
+        env = {"API_PORT": str(port), "API_WORKERS_COUNT": "0" if name == "server_options" else "1"}
+        server = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-c", code],
+            env={**os.environ, **env},
+        )
+        try:
+            _wait_until_up(URL.format(port=port))
+            throughput, p50, p99, rejected = _load(port, seconds, connections)
+        finally:
+            server.terminate()
+            server.wait()
+        sys.stdout.write(f"{name:>15} {throughput:>8.0f} {p50:>6.1f} ms {p99:>6.1f} ms {rejected:>6}\n")
+
+
+if __name__ == "__main__":
+    main(
+        float(sys.argv[1]) if len(sys.argv) > 1 else 10.0,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 64,
+    )
@@ -0,0 +1,99 @@
+"""
+Measure the per-request cost of Sentry tracing.
+
+A small FastAPI application is called directly through ASGI with Sentry
+initialized three ways: tracing off, every transaction traced, and the
+`TraceSampler` with the default settings. Envelopes go to a transport that
+drops them, so only the cost paid in the process is measured.
+
+Usage: python -m benchmarks.tracing_overhead [requests ...]
+"""
+
+import asyncio
+import sys
+import time
+from typing import Any
+
+import sentry_sdk
+from fastapi import FastAPI
+from sentry_sdk.envelope import Envelope
+from sentry_sdk.integrations.fastapi import FastApiIntegration
+from sentry_sdk.transport import Transport
+from starlette.types import Message
+
+from app.web.tracing import create_trace_sampler
+
+DEFAULT_REQUESTS = [2_000, 20_000]
+
+
+class _DropTransport(Transport):
+    def capture_envelope(self, envelope: Envelope) -> None:
+        return
+
+
+async def _get_post(post_id: int) -> dict[str, Any]:
+    return {"id": post_id, "title": "Post", "content": "..."}
+
+
+def _scope() -> dict[str, Any]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/posts/1",
+        "raw_path": b"/api/posts/1",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message: Message) -> None:
+    return
+
+
+async def _measure(app: FastAPI, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(_scope(), _receive, _send)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def main(requests_list: list[int]) -> None:
+    app = FastAPI()
+    app.add_api_route("/api/posts/{post_id}", _get_post, name="post:get")
+    sampler = create_trace_sampler(app.routes)
+    modes: dict[str, dict[str, Any]] = {
+        "off": {},
+        "on": {"traces_sample_rate": 1.0},
+        "sampled": {
+            "traces_sampler": sampler.traces_sampler,
+            "before_send_transaction": sampler.before_send_transaction,
+        },
+    }
+
+    sys.stdout.write(f"{'requests':>9}" + "".join(f"{mode:>11}" for mode in modes) + "\n")
+    for requests in requests_list:
+        results = []
+        for options in modes.values():
+            sentry_sdk.init(
+                dsn="http://public@localhost/1",
+                transport=_DropTransport,
+                integrations=[FastApiIntegration(transaction_style="endpoint")],
+                **options,
+            )
+            await _measure(app, 100)
+            results.append(await _measure(app, requests))
+        sys.stdout.write(f"{requests:>9}" + "".join(f"{result:>8.1f} us" for result in results) + "\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(main([int(arg) for arg in sys.argv[1:]] or DEFAULT_REQUESTS))